@@ -3,14 +3,17 @@
 더블클릭으로 실행 가능한 독립 실행형 프로그램
 """
 import sys
+import time
+import hashlib
 import webbrowser
 import threading
 from pathlib import Path
 from flask import Flask, render_template, jsonify, request
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
+from slack_sdk.errors import SlackApiError
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent))
@@ -19,7 +22,15 @@ from src.workspace_manager import WorkspaceManager
 from src.slack_handler import SlackHandler
 from src.sheets_handler import SheetsHandler, AttendanceStatus
 from src.parser import AttendanceParser
-from src.utils import parse_slack_thread_link, column_letter_to_index, get_next_column, column_index_to_letter
+from src.roster_cache import RosterCache
+from src.rate_limiter import default_governor, default_slack_limiter
+from src.user_cache import get_default_user_cache
+from src.write_journal import WriteJournal, JournalFlusher
+from src.notification_queue import NotificationQueue, NotificationWorker
+from src.thread_registry import ThreadRegistry
+from src.reply_store import ReplyStore
+from src.live_attendance import LiveAttendanceListener, SocketModeEventSource, LocalEventSource
+from src.utils import parse_slack_thread_link, column_letter_to_index, get_next_column, column_index_to_letter, get_cache_dir, get_previous_schedule_time
 
 # Flask 앱 초기화
 app = Flask(__name__)
@@ -33,6 +44,389 @@ scheduler = BackgroundScheduler(timezone=pytz.timezone('Asia/Seoul'))
 KST = pytz.timezone('Asia/Seoul')
 
 
+def create_sheets_handler(workspace) -> SheetsHandler:
+    """
+    워크스페이스 설정으로 SheetsHandler 생성 (학생 명단 캐시 포함)
+
+    app.config['SHEETS_SERVICE']에 Sheets 서비스 객체를 넣어 두면 인증 파일 대신
+    그 객체를 사용합니다 (로컬 테스트용 가짜 서비스 주입).
+    """
+    return SheetsHandler(
+        credentials_path=workspace.credentials_path,
+        spreadsheet_id=workspace.spreadsheet_id,
+        sheet_name=workspace.sheet_name,
+        service=app.config.get('SHEETS_SERVICE'),
+        roster_cache=RosterCache(workspace.cache_dir / 'roster.json', ttl=workspace.roster_cache_ttl),
+        revision_check=workspace.roster_revision_check,
+        apply_formatting=workspace.format_cells
+    )
+
+
+def get_thread_registry(workspace) -> ThreadRegistry:
+    """워크스페이스의 출석 스레드 등록부"""
+    return ThreadRegistry(workspace.cache_dir / 'threads.json')
+
+
+def create_slack_handler(workspace) -> SlackHandler:
+    """워크스페이스 설정으로 SlackHandler 생성 (스레드별 댓글 저장소 포함)"""
+    return SlackHandler(
+        workspace.slack_bot_token,
+        reply_store=ReplyStore(workspace.cache_dir / 'replies.db')
+    )
+
+
+def collect_attendance(workspace, slack_handler, thread_ts, parser, incremental=True):
+    """
+    스레드 댓글 수집 + 출석 파싱
+
+    incremental이면 지난 실행 이후 새로 달린 댓글만 가져와 파싱하고,
+    이미 출석 처리한 학생은 결과에서 제외합니다. 시트 기록 후에는
+    commit_collected()로 새로 처리한 댓글/출석을 저장해야 합니다.
+
+    반응 모드(attendance_mode: reactions) 워크스페이스는 스레드 메시지의 반응을
+    reactions.get 한 번으로 읽으며, 반응은 취소될 수 있으므로 매번 전체를 처리합니다.
+
+    Returns:
+        Dict: mode, attendance (전체 출석), new_attendance (이번에 새로 파싱한 출석),
+              new_replies (이번에 가져온 댓글), reply_count (전체 댓글/반응 수),
+              previous_column (지난 실행에서 기록한 열, 처음이면 None)
+
+    Raises:
+        SlackApiError: 댓글을 끝까지 가져오지 못한 경우 (일부 댓글로 미출석을 기록하지 않도록 중단)
+    """
+    channel = workspace.slack_channel_id
+
+    if workspace.attendance_mode == 'reactions':
+        users = slack_handler.get_reaction_users(channel, thread_ts, workspace.attendance_reactions)
+        attendance = parser.parse_reaction_users(users)
+
+        return {
+            'mode': 'reactions',
+            'attendance': attendance,
+            'new_attendance': attendance,
+            'new_replies': [],
+            'reply_count': len(users),
+            'previous_column': None,
+        }
+
+    store = slack_handler.reply_store
+
+    if not incremental:
+        store.reset(channel, thread_ts)
+
+    thread = store.get_thread(channel, thread_ts)
+    known = store.get_attendance(channel, thread_ts) if thread else []
+    new_replies = []
+
+    def track(replies):
+        for reply in replies:
+            new_replies.append(reply)
+            yield reply
+
+    # 페이지를 받는 대로 바로 파싱
+    new_attendance = parser.parse_attendance_replies(
+        track(slack_handler.iter_new_replies_with_user_info(channel, thread_ts)),
+        seen_names={a['name'] for a in known}
+    )
+
+    if thread:
+        print(f"✓ 새 댓글 {len(new_replies)}개, 새 출석자 {len(new_attendance)}명 (기존 출석자 {len(known)}명)")
+
+    return {
+        'mode': 'replies',
+        'attendance': known + new_attendance,
+        'new_attendance': new_attendance,
+        'new_replies': new_replies,
+        'reply_count': store.count_replies(channel, thread_ts) + len(new_replies),
+        'previous_column': thread['column'] if thread else None,
+    }
+
+
+def create_live_listener(workspace) -> LiveAttendanceListener:
+    """
+    워크스페이스의 실시간 출석 리스너 생성
+
+    출석 기록은 저널에 남기고 백그라운드 플러셔가 모아서 시트에 반영합니다.
+    """
+    sheets_handler = create_sheets_handler(workspace)
+
+    def roster_provider():
+        if not sheets_handler.connect():
+            return {}
+        return sheets_handler.get_student_list(workspace.name_column, workspace.start_row)
+
+    def write_queue(updates):
+        write_journal.record(workspace.name, workspace.spreadsheet_id, workspace.sheet_name, updates)
+        journal_flusher.notify()
+
+    return LiveAttendanceListener(
+        workspace.slack_channel_id,
+        get_thread_registry(workspace),
+        AttendanceParser(),
+        roster_provider=roster_provider,
+        write_queue=write_queue,
+        slack_handler=create_slack_handler(workspace)
+    )
+
+
+def start_live_attendance():
+    """live_attendance 워크스페이스의 실시간 출석 시작 (App Token이 없으면 로컬 이벤트 소스 사용)"""
+    for workspace in workspace_manager.get_all_workspaces():
+        if not workspace.live_attendance or workspace.name in live_sources:
+            continue
+
+        try:
+            listener = create_live_listener(workspace)
+
+            if workspace.slack_app_token:
+                source = SocketModeEventSource(workspace.slack_app_token, workspace.slack_bot_token, listener)
+                mode = 'Socket Mode'
+            else:
+                source = LocalEventSource(listener)
+                mode = '로컬 이벤트 주입'
+
+            source.start()
+            live_sources[workspace.name] = source
+            print(f"  ✓ 실시간 출석: {workspace.display_name} ({mode})")
+
+        except Exception as e:
+            print(f"  ✗ 실시간 출석 시작 실패 ({workspace.display_name}): {e}")
+
+
+def stop_live_attendance():
+    """모든 실시간 출석 중지 (남은 기록은 저널에 넘김)"""
+    for name in list(live_sources):
+        try:
+            live_sources.pop(name).stop()
+        except Exception as e:
+            print(f"⚠️ 실시간 출석 중지 중 오류 (무시 가능): {e}")
+
+
+def commit_collected(workspace, slack_handler, thread_ts, collected, column):
+    """시트 기록 후 새로 처리한 댓글/출석과 기록한 열 저장 (댓글 모드만)"""
+    get_thread_registry(workspace).assign_column(thread_ts, workspace.slack_channel_id, column)
+
+    if collected['mode'] == 'replies':
+        slack_handler.reply_store.commit(
+            workspace.slack_channel_id, thread_ts,
+            collected['new_replies'], collected['new_attendance'], column
+        )
+
+
+def find_attendance_thread(workspace, slack_handler, refresh=False):
+    """
+    최신 출석 스레드 찾기
+
+    검색 기간 안에 등록된 스레드가 있으면 채널 기록을 검색하지 않고 그 스레드를 사용합니다.
+    등록된 스레드가 없거나 refresh를 요청한 경우에만 채널 기록을 검색하며, refresh일 때는
+    등록된 스레드 이후의 기록만 검색해 더 새로 올라온 출석 스레드(직접 올린 스레드 등)를 찾습니다.
+
+    Args:
+        refresh (bool): 등록된 스레드가 있어도 채널 기록을 다시 검색할지 여부
+
+    Returns:
+        Optional[Dict]: 스레드 정보 (ts, text, user, source), 없으면 None
+    """
+    oldest = get_thread_search_oldest(workspace)
+
+    entry = get_thread_registry(workspace).latest(workspace.slack_channel_id, since=oldest)
+
+    thread_message = None
+    if refresh or not entry:
+        thread_message = slack_handler.find_latest_attendance_thread(
+            workspace.slack_channel_id,
+            oldest=float(entry['ts']) if entry else oldest
+        )
+
+    if thread_message and (not entry or float(thread_message['ts']) > float(entry['ts'])):
+        thread_message['source'] = 'history'
+        return thread_message
+
+    if entry:
+        print(f"✓ 등록된 출석 스레드 사용: {entry['ts']} (기록 열: {entry.get('column') or '-'})")
+        return {
+            'ts': entry['ts'],
+            'text': entry.get('text') or '',
+            'user': entry.get('user'),
+            'source': 'registry',
+        }
+
+    return None
+
+    if entry:
+        print(f"✓ 등록된 출석 스레드 사용: {entry['ts']} (기록 열: {entry.get('column') or '-'})")
+        return {
+            'ts': entry['ts'],
+            'text': entry.get('text') or '',
+            'user': entry.get('user'),
+            'source': 'registry',
+        }
+
+    return thread_message
+
+
+def get_thread_search_oldest(workspace):
+    """
+    출석 스레드 검색 시작 시각 (Unix 초) 계산
+
+    자동 스케줄이 켜져 있으면 가장 최근 스레드 생성 시각 1시간 전부터,
+    생성 시각이 없으면 가장 최근 집계 시각 1주일 전부터 검색합니다.
+    스케줄이 없으면 None (검색 범위 제한 없음)
+    """
+    schedule = workspace.auto_schedule
+    if not schedule or not schedule.get('enabled'):
+        return None
+
+    now = datetime.now(KST)
+
+    created = get_previous_schedule_time(
+        schedule.get('create_thread_day'), schedule.get('create_thread_time'), now
+    )
+    if created:
+        return (created - timedelta(hours=1)).timestamp()
+
+    checked = get_previous_schedule_time(
+        schedule.get('check_attendance_day'), schedule.get('check_attendance_time'), now
+    )
+    if checked:
+        return (checked - timedelta(days=7)).timestamp()
+
+    return None
+
+
+def journal_handler_factory(workspace_name, spreadsheet_id, sheet_name):
+    """저널 플러셔용 SheetsHandler 생성 (워크스페이스 설정이 바뀌었으면 None)"""
+    workspace = workspace_manager.get_workspace(workspace_name)
+
+    if not workspace or workspace.spreadsheet_id != spreadsheet_id or workspace.sheet_name != sheet_name:
+        return None
+
+    return create_sheets_handler(workspace)
+
+
+# 출석 기록 저널 (시트에 보내기 전에 먼저 기록, 실패/미전송 항목은 백그라운드에서 재전송)
+write_journal = WriteJournal(get_cache_dir() / 'write_journal.db')
+journal_flusher = JournalFlusher(write_journal, journal_handler_factory)
+
+def notification_handler_factory(workspace_name):
+    """알림 작업자용 SlackHandler 생성 (워크스페이스가 없어졌으면 None)"""
+    workspace = workspace_manager.get_workspace(workspace_name)
+
+    if not workspace:
+        return None
+
+    return SlackHandler(workspace.slack_bot_token)
+
+
+# 슬랙 알림 대기열 (스레드 댓글/DM은 대기열에 넣고 백그라운드에서 전송, 실패하면 재시도)
+notification_queue = NotificationQueue(get_cache_dir() / 'notifications.db')
+notification_worker = NotificationWorker(notification_queue, notification_handler_factory)
+
+# 실시간 출석 이벤트 소스 {워크스페이스 이름: SocketModeEventSource 또는 LocalEventSource}
+live_sources = {}
+
+
+def write_attendance_updates(workspace, sheets_handler, updates):
+    """
+    출석 업데이트를 저널에 먼저 기록한 뒤 시트에 반영
+
+    async_sheet_writes 워크스페이스는 저널에만 기록하고 바로 반환하며,
+    전송은 백그라운드 플러셔가 담당합니다.
+
+    Returns:
+        Tuple[int, int]: (성공한 업데이트 수, 저널에 남은 항목 수)
+    """
+    entries = write_journal.record(
+        workspace.name,
+        workspace.spreadsheet_id,
+        workspace.sheet_name,
+        updates,
+        claim=not workspace.async_sheet_writes
+    )
+
+    if workspace.async_sheet_writes:
+        journal_flusher.notify()
+        return 0, len(entries)
+
+    with write_journal.leased(entries):
+        success_count = sheets_handler.update_attendance_column(updates, workspace.start_row)
+
+    write_journal.settle(entries, sheets_handler.last_update_results)
+
+    queued_count = len(entries) - success_count
+    if queued_count > 0:
+        print(f"⚠️ 실패한 {queued_count}개 셀은 저널에 남아 다시 전송됩니다.")
+        journal_flusher.notify()
+
+    return success_count, queued_count
+
+
+def enqueue_notification(workspace, kind, target, message, run_id, thread_ts=None, digest=False):
+    """
+    스레드 댓글/DM을 알림 대기열에 추가 (전송은 백그라운드 작업자가 담당)
+
+    같은 실행(run_id)에서 같은 알림이 이미 대기 중이거나 전송되었으면 추가하지 않습니다.
+    실행이 다르면 내용이 같아도 다시 전송합니다.
+    digest=True이고 워크스페이스에 notification_digest_seconds가 설정되어 있으면,
+    같은 봇 토큰으로 같은 수신자에게 가는 DM을 그 시간 동안 모아 하나로 보냅니다.
+
+    Returns:
+        bool: 새로 추가되었는지 여부
+    """
+    digest_key = None
+    digest_seconds = workspace.notification_digest_seconds if digest and kind == 'dm' else 0
+
+    if digest_seconds:
+        token_hash = hashlib.sha256(workspace.slack_bot_token.encode('utf-8')).hexdigest()[:16]
+        digest_key = f"{token_hash}|{target.strip().lower()}"
+
+    added = notification_queue.enqueue(
+        workspace.name, kind, target, message, run_id,
+        thread_ts=thread_ts,
+        digest_key=digest_key,
+        digest_seconds=digest_seconds
+    )
+
+    if added:
+        notification_worker.notify()
+    else:
+        print(f"⚠️ 이미 대기 중이거나 전송된 알림입니다 ({kind}, {target})")
+
+    return added
+
+
+def enqueue_bulk_dms(workspace, recipients, template, run_id):
+    """
+    여러 사용자에게 보낼 DM을 알림 대기열에 추가 (수신자별로 템플릿을 채워 한 건씩)
+
+    대기열을 거치므로 같은 실행(run_id)의 중복 전송은 막히고 실패한 DM은 작업자가 재시도합니다.
+    템플릿 변수가 맞지 않는 수신자는 건너뛰고 나머지는 그대로 추가합니다.
+
+    Args:
+        recipients (List[Dict]): [{'recipient': User ID 또는 이메일, ...템플릿 변수}]
+        template (str): 메시지 템플릿
+        run_id (str): 실행 ID (중복 확인용)
+
+    Returns:
+        int: 새로 추가된 DM 수
+    """
+    queued = 0
+
+    for recipient in recipients:
+        context = {k: v for k, v in recipient.items() if k != 'recipient'}
+
+        try:
+            message = template.format(**context)
+        except (KeyError, IndexError, ValueError) as e:
+            print(f"  ✗ {recipient['recipient']}: 메시지 템플릿 오류 ({e!r}) - DM을 보내지 않습니다")
+            continue
+
+        if enqueue_notification(workspace, 'dm', recipient['recipient'], message, run_id):
+            queued += 1
+
+    return queued
+
+
 @app.route('/')
 def index():
     """메인 페이지"""
@@ -91,8 +485,9 @@ def delete_workspace():
                 'error': f'{workspace_name} 워크스페이스를 찾을 수 없습니다.'
             }), 404
 
-        # 폴더 삭제
+        # 폴더 삭제 (프로젝트 루트 cache/ 아래의 워크스페이스 캐시도 함께)
         shutil.rmtree(workspace_folder)
+        shutil.rmtree(get_cache_dir() / 'workspaces' / workspace_name, ignore_errors=True)
 
         # 워크스페이스 매니저 리로드
         workspace_manager.reload()
@@ -224,6 +619,7 @@ def find_thread():
     try:
         data = request.json
         workspace_name = data.get('workspace')
+        refresh = data.get('refresh', False)  # 등록된 스레드가 있어도 채널 기록을 다시 검색
 
         workspace = workspace_manager.get_workspace(workspace_name)
         if not workspace:
@@ -240,9 +636,7 @@ def find_thread():
                 'error': '슬랙 연결에 실패했습니다.'
             }), 500
 
-        thread_message = slack_handler.find_latest_attendance_thread(
-            workspace.slack_channel_id
-        )
+        thread_message = find_attendance_thread(workspace, slack_handler, refresh=refresh)
 
         if not thread_message:
             return jsonify({
@@ -254,7 +648,8 @@ def find_thread():
             'success': True,
             'thread_ts': thread_message['ts'],
             'thread_text': thread_message['text'][:100] + '...',
-            'thread_user': thread_message.get('user', 'unknown')
+            'thread_user': thread_message.get('user') or 'unknown',
+            'source': thread_message['source']
         })
 
     except Exception as e:
@@ -264,6 +659,22 @@ def find_thread():
         }), 500
 
 
+@app.route('/api/threads/<workspace_name>', methods=['GET'])
+def get_threads(workspace_name):
+    """등록된 출석 스레드 목록 조회 (스레드별 기록 열 포함)"""
+    workspace = workspace_manager.get_workspace(workspace_name)
+    if not workspace:
+        return jsonify({
+            'success': False,
+            'error': '워크스페이스를 찾을 수 없습니다.'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'threads': get_thread_registry(workspace).list(workspace.slack_channel_id)
+    })
+
+
 @app.route('/api/run-attendance', methods=['POST'])
 def run_attendance():
     """출석체크 실행"""
@@ -275,6 +686,8 @@ def run_attendance():
         mark_absent = data.get('mark_absent', True)
         send_thread_reply = data.get('send_thread_reply', True)
         send_dm = data.get('send_dm', True)
+        diff_write = data.get('diff_write', True)  # 값이 바뀌는 셀만 기록
+        incremental = data.get('incremental', True)  # 지난 실행 이후 새 댓글만 처리
         thread_user = data.get('thread_user')  # 자동 감지 시 사용
 
         # 1. 워크스페이스 로드
@@ -302,28 +715,34 @@ def run_attendance():
             }), 400
 
         # 4. 슬랙 연결
-        slack_handler = SlackHandler(workspace.slack_bot_token)
+        slack_handler = create_slack_handler(workspace)
         if not slack_handler.test_connection():
             return jsonify({
                 'success': False,
                 'error': '슬랙 연결에 실패했습니다.'
             }), 500
 
-        # 5. 댓글 수집
-        replies = slack_handler.get_replies_with_user_info(
-            workspace.slack_channel_id,
-            thread_ts
-        )
+        # 5~6. 댓글 수집 + 출석 파싱 (다시 실행하면 새 댓글만)
+        parser = AttendanceParser()
 
-        if not replies:
+        try:
+            collected = collect_attendance(workspace, slack_handler, thread_ts, parser, incremental)
+        except SlackApiError as e:
             return jsonify({
                 'success': False,
-                'error': '댓글을 가져올 수 없습니다.'
-            }), 500
+                'error': f"댓글을 끝까지 가져오지 못해 출석을 기록하지 않았습니다. ({e.response['error']})"
+            }), 502
 
-        # 6. 출석 파싱
-        parser = AttendanceParser()
-        attendance_list = parser.parse_attendance_replies(replies)
+        attendance_list = collected['attendance']
+
+        # 같은 열에 이미 기록한 스레드면 새 출석자만 기록
+        full_write = collected['previous_column'] != column_input
+
+        if collected['reply_count'] == 0:
+            return jsonify({
+                'success': False,
+                'error': '반응을 가져올 수 없습니다.' if collected['mode'] == 'reactions' else '댓글을 가져올 수 없습니다.'
+            }), 500
 
         if not attendance_list:
             return jsonify({
@@ -334,53 +753,55 @@ def run_attendance():
         summary = parser.get_attendance_summary(attendance_list)
 
         # 7. 구글 시트 연결
-        sheets_handler = SheetsHandler(
-            credentials_path=workspace.credentials_path,
-            spreadsheet_id=workspace.spreadsheet_id,
-            sheet_name=workspace.sheet_name
-        )
+        sheets_handler = create_sheets_handler(workspace)
 
+        # 시트 확인은 캐시가 유효하면 API를 호출하지 않음
         if not sheets_handler.connect() or not sheets_handler.test_connection():
             return jsonify({
                 'success': False,
                 'error': '구글 시트 연결에 실패했습니다.'
             }), 500
 
-        # 8. 학생 명단 읽기
-        students = sheets_handler.get_student_list(
+        # 8. 학생 명단 + 출석 열 스냅샷 읽기 (batchGet 1회)
+        snapshot = sheets_handler.get_sheet_snapshot(
             workspace.name_column,
-            workspace.start_row
+            workspace.start_row,
+            [column_index] + workspace.snapshot_columns
         )
 
+        if snapshot is None:
+            return jsonify({
+                'success': False,
+                'error': '구글 시트를 읽을 수 없습니다. 시트 이름과 공유 권한을 확인하세요.'
+            }), 500
+
+        students = snapshot.students
+
         if not students:
             return jsonify({
                 'success': False,
                 'error': '학생 명단을 읽을 수 없습니다.'
             }), 500
 
-        # 9. 출석 매칭
+        # 9. 출석 매칭 (이어서 실행하면 새 출석자만 매칭)
         updates = []
-        matched_names = []
-        unmatched_names = []
+        new_names = {a['name'] for a in collected['new_attendance']}
+        matched_names = [a['name'] for a in attendance_list if a['name'] in students]
+        unmatched_names = [a['name'] for a in attendance_list if a['name'] not in students]
 
-        for attendance in attendance_list:
-            name = attendance['name']
-            if name in students:
-                row = students[name]
+        for name in matched_names:
+            if full_write or name in new_names:
                 updates.append({
                     'name': name,
-                    'row': row,
+                    'row': students[name],
                     'column': column_index,
                     'status': AttendanceStatus.PRESENT
                 })
-                matched_names.append(name)
-            else:
-                unmatched_names.append(name)
 
-        # 10. 미출석자 처리
+        # 10. 미출석자 처리 (이미 기록한 열이면 다시 쓰지 않음)
         absent_names = [name for name in students.keys() if name not in matched_names]
 
-        if mark_absent:
+        if mark_absent and full_write:
             for name in absent_names:
                 row = students[name]
                 updates.append({
@@ -390,19 +811,27 @@ def run_attendance():
                     'status': AttendanceStatus.ABSENT
                 })
 
-        # 11. 업데이트
-        success_count = sheets_handler.batch_update_attendance(updates)
+        # 11. 업데이트 (변경된 셀만, 출석 열 전체를 하나의 범위로 기록)
+        if diff_write:
+            updates = sheets_handler.diff_attendance_updates(updates, snapshot.column_values(column_index))
+
+        success_count, queued_count = write_attendance_updates(workspace, sheets_handler, updates)
+        commit_collected(workspace, slack_handler, thread_ts, collected, column_input)
 
-        # 12. 알림 전송
+        # 12. 알림 전송 (대기열에 넣고 백그라운드에서 전송, 수동 실행은 요청마다 새 알림)
         notifications = []
+        run_id = f"manual:{thread_ts}:{column_input}:{time.time():.6f}"
 
         if send_thread_reply:
-            if slack_handler.post_thread_reply(
+            if enqueue_notification(
+                workspace,
+                'thread_reply',
                 workspace.slack_channel_id,
-                thread_ts,
-                "출석 체크를 완료했습니다."
+                "출석 체크를 완료했습니다.",
+                run_id,
+                thread_ts=thread_ts
             ):
-                notifications.append('스레드 댓글 작성 완료')
+                notifications.append('스레드 댓글 전송 예약')
 
         if send_dm and thread_user:
             dm_message = f"""[출석체크 완료 알림]
@@ -422,8 +851,8 @@ def run_attendance():
             if len(absent_names) > 50:
                 dm_message += f"... 외 {len(absent_names) - 50}명"
 
-            if slack_handler.send_dm(thread_user, dm_message):
-                notifications.append('DM 전송 완료')
+            if enqueue_notification(workspace, 'dm', thread_user, dm_message, run_id):
+                notifications.append('DM 전송 예약')
 
         # 13. 결과 반환
         return jsonify({
@@ -436,6 +865,12 @@ def run_attendance():
                 'absent_names': absent_names[:20],  # 최대 20명만
                 'unmatched_names': unmatched_names,
                 'success_count': success_count,
+                'changed_count': len(updates),
+                'queued_count': queued_count,
+                'new_replies': len(collected['new_replies']),
+                'new_present': len(collected['new_attendance']),
+                'incremental': not full_write,
+                'mode': collected['mode'],
                 'column': column_input,
                 'notifications': notifications
             }
@@ -450,6 +885,48 @@ def run_attendance():
         }), 500
 
 
+@app.route('/api/roster/refresh', methods=['POST'])
+def refresh_roster():
+    """학생 명단 캐시 새로고침"""
+    try:
+        data = request.json
+        workspace_name = data.get('workspace')
+
+        workspace = workspace_manager.get_workspace(workspace_name)
+        if not workspace:
+            return jsonify({
+                'success': False,
+                'error': '워크스페이스를 찾을 수 없습니다.'
+            }), 404
+
+        sheets_handler = create_sheets_handler(workspace)
+
+        if not sheets_handler.connect():
+            return jsonify({
+                'success': False,
+                'error': '구글 시트 연결에 실패했습니다.'
+            }), 500
+
+        students = sheets_handler.refresh_roster(workspace.name_column, workspace.start_row)
+
+        if not students:
+            return jsonify({
+                'success': False,
+                'error': '학생 명단을 읽을 수 없습니다.'
+            }), 500
+
+        return jsonify({
+            'success': True,
+            'total_students': len(students)
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/api/schedule/<workspace_name>', methods=['GET'])
 def get_schedule(workspace_name):
     """워크스페이스 스케줄 조회"""
@@ -555,6 +1032,108 @@ def save_schedule():
         }), 500
 
 
+@app.route('/api/live/status', methods=['GET'])
+def get_live_status():
+    """실시간 출석 리스너 상태 조회"""
+    return jsonify({
+        'success': True,
+        'workspaces': {
+            name: dict(source.listener.get_stats(), mode=type(source).__name__)
+            for name, source in live_sources.items()
+        }
+    })
+
+
+@app.route('/api/live/inject', methods=['POST'])
+def inject_live_event():
+    """실시간 출석 리스너에 Slack 이벤트 직접 주입 (테스트용 로컬 이벤트 소스)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        source = live_sources.get(data.get('workspace'))
+
+        if not source:
+            return jsonify({
+                'success': False,
+                'error': '실시간 출석이 켜진 워크스페이스가 아닙니다.'
+            }), 404
+
+        # Socket Mode로 실제 Slack 이벤트를 받는 워크스페이스에는 주입할 수 없음
+        if not isinstance(source, LocalEventSource):
+            return jsonify({
+                'success': False,
+                'error': '로컬 이벤트 소스를 사용하는 워크스페이스에만 이벤트를 주입할 수 있습니다.'
+            }), 403
+
+        event = data.get('event') or {
+            'type': 'message',
+            'channel': source.listener.channel_id,
+            'thread_ts': data.get('thread_ts'),
+            'ts': data.get('ts') or f"{time.time():.6f}",
+            'user': data.get('user'),
+            'text': data.get('text', ''),
+        }
+
+        update = source.inject(event)
+
+        return jsonify({
+            'success': True,
+            'queued': update is not None,
+            'name': update['name'] if update else None
+        })
+
+    except Exception as e:
+        import traceback
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'traceback': traceback.format_exc()
+        }), 500
+
+
+@app.route('/api/stats/rate-limits', methods=['GET'])
+def get_rate_limit_stats():
+    """API 호출 대기/재시도 통계 조회"""
+    return jsonify({
+        'success': True,
+        'sheets': default_governor.stats.to_dict(),
+        'slack': default_slack_limiter.get_stats()
+    })
+
+
+@app.route('/api/stats/cache', methods=['GET'])
+def get_cache_stats():
+    """슬랙 사용자 프로필 캐시 적중/실패 통계 조회"""
+    return jsonify({
+        'success': True,
+        'slack_user_cache': get_default_user_cache().get_stats()
+    })
+
+
+@app.route('/api/stats/notifications', methods=['GET'])
+def get_notification_stats():
+    """슬랙 알림 대기열 상태 조회"""
+    return jsonify({
+        'success': True,
+        'notifications': {
+            state: notification_queue.count(state)
+            for state in ('pending', 'inflight', 'sent', 'failed')
+        }
+    })
+
+
+@app.route('/api/stats/journal', methods=['GET'])
+def get_journal_stats():
+    """출석 기록 저널 상태 조회 (재시도를 포기한 failed 항목 포함)"""
+    return jsonify({
+        'success': True,
+        'journal': {
+            state: write_journal.count(state)
+            for state in ('pending', 'inflight', 'failed')
+        },
+        'failed_entries': write_journal.failed_entries()
+    })
+
+
 def open_browser():
     """브라우저 자동 열기"""
     webbrowser.open('http://127.0.0.1:5000')
@@ -579,6 +1158,14 @@ def create_attendance_thread_job(workspace):
         result = slack_handler.post_message(workspace.slack_channel_id, message)
 
         if result:
+            # 집계 작업이 채널 기록을 다시 검색하지 않도록 등록
+            get_thread_registry(workspace).register(
+                result['ts'],
+                workspace.slack_channel_id,
+                column=schedule.get('check_attendance_column'),
+                text=message,
+                user=result.get('user')
+            )
             print(f"✓ 출석 스레드 생성 완료: {result['ts']}")
         else:
             print(f"✗ 출석 스레드 생성 실패")
@@ -592,18 +1179,19 @@ def create_attendance_thread_job(workspace):
 def check_attendance_job(workspace):
     """출석 집계 자동 실행 작업"""
     try:
+        run_started = datetime.now(KST)
         print(f"\n[자동실행] 출석 집계 시작 - {workspace.display_name}")
-        print(f"시간: {datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"시간: {run_started.strftime('%Y-%m-%d %H:%M:%S')}")
 
         schedule = workspace.auto_schedule
         if not schedule or not schedule.get('enabled'):
             return
 
         # 1. 슬랙 연결
-        slack_handler = SlackHandler(workspace.slack_bot_token)
+        slack_handler = create_slack_handler(workspace)
 
-        # 2. 최신 출석 스레드 찾기
-        thread_message = slack_handler.find_latest_attendance_thread(workspace.slack_channel_id)
+        # 2. 최신 출석 스레드 찾기 (등록된 스레드가 없을 때만 채널 기록 검색)
+        thread_message = find_attendance_thread(workspace, slack_handler)
         if not thread_message:
             print("✗ 출석 스레드를 찾을 수 없습니다.")
             return
@@ -613,15 +1201,20 @@ def check_attendance_job(workspace):
 
         print(f"✓ 출석 스레드 발견: {thread_ts}")
 
-        # 3. 댓글 수집
-        replies = slack_handler.get_replies_with_user_info(workspace.slack_channel_id, thread_ts)
-        if not replies:
-            print("✗ 댓글을 가져올 수 없습니다.")
+        # 3~4. 댓글 수집 + 출석 파싱 (다시 실행하면 새 댓글만)
+        parser = AttendanceParser()
+
+        try:
+            collected = collect_attendance(workspace, slack_handler, thread_ts, parser)
+        except SlackApiError as e:
+            print(f"✗ 댓글을 끝까지 가져오지 못해 출석을 기록하지 않습니다: {e.response['error']}")
             return
 
-        # 4. 출석 파싱
-        parser = AttendanceParser()
-        attendance_list = parser.parse_attendance_replies(replies)
+        attendance_list = collected['attendance']
+
+        if collected['reply_count'] == 0:
+            print("✗ 댓글을 가져올 수 없습니다.")
+            return
 
         if not attendance_list:
             print("✗ 출석한 학생이 없습니다.")
@@ -630,18 +1223,29 @@ def check_attendance_job(workspace):
         print(f"✓ 출석자 수: {len(attendance_list)}명")
 
         # 5. 구글 시트 연결
-        sheets_handler = SheetsHandler(
-            credentials_path=workspace.credentials_path,
-            spreadsheet_id=workspace.spreadsheet_id,
-            sheet_name=workspace.sheet_name
-        )
+        sheets_handler = create_sheets_handler(workspace)
 
+        # 시트 확인은 캐시가 유효하면 API를 호출하지 않음
         if not sheets_handler.connect() or not sheets_handler.test_connection():
             print("✗ 구글 시트 연결 실패")
             return
 
-        # 6. 학생 명단 읽기
-        students = sheets_handler.get_student_list(workspace.name_column, workspace.start_row)
+        # 6. 학생 명단 + 출석 열 스냅샷 읽기 (batchGet 1회)
+        current_column = schedule.get('check_attendance_column', 'K')
+
+        # 알림 중복 확인용 실행 ID (같은 스레드/열/시각의 중복 실행만 한 번 전송)
+        run_id = f"check:{thread_ts}:{current_column}:{run_started:%Y%m%d%H%M}"
+        dm_column = workspace.absentee_dm_column if workspace.absentee_dm_enabled else None
+        snapshot = sheets_handler.get_sheet_snapshot(
+            workspace.name_column,
+            workspace.start_row,
+            [column_letter_to_index(current_column)] + workspace.snapshot_columns + ([dm_column] if dm_column is not None else [])
+        )
+        if snapshot is None:
+            print("✗ 구글 시트를 읽을 수 없습니다.")
+            return
+
+        students = snapshot.students
         if not students:
             print("✗ 학생 명단을 읽을 수 없습니다.")
             return
@@ -651,7 +1255,6 @@ def check_attendance_job(workspace):
         auto_column_enabled = schedule.get('auto_column_enabled', False)
         start_column = schedule.get('start_column', 'H')
         end_column = schedule.get('end_column', 'O')
-        current_column = schedule.get('check_attendance_column', 'K')
 
         # 자동 열 증가가 활성화되어 있으면 다음 열로 이동
         if auto_column_enabled and start_column and end_column:
@@ -694,8 +1297,8 @@ def check_attendance_job(workspace):
 
 워크스페이스: {workspace.display_name}
 """
-                    slack_handler.send_dm(notification_user, completion_message)
-                    print(f"✓ 완료 알림 DM 전송 완료")
+                    enqueue_notification(workspace, 'dm', notification_user, completion_message, run_id, digest=True)
+                    print(f"✓ 완료 알림 DM 전송 예약")
 
                 column_index = column_letter_to_index(column_input)
             else:
@@ -712,41 +1315,43 @@ def check_attendance_job(workspace):
             column_input = current_column
             column_index = column_letter_to_index(column_input)
 
+        # 같은 열에 이미 기록한 스레드면 새 출석자만 기록
+        full_write = collected['previous_column'] != column_input
+
         updates = []
-        matched_names = []
-        unmatched_names = []
+        new_names = {a['name'] for a in collected['new_attendance']}
+        matched_names = [a['name'] for a in attendance_list if a['name'] in students]
+        unmatched_names = [a['name'] for a in attendance_list if a['name'] not in students]
 
-        for attendance in attendance_list:
-            name = attendance['name']
-            if name in students:
-                row = students[name]
+        for name in matched_names:
+            if full_write or name in new_names:
                 updates.append({
                     'name': name,
-                    'row': row,
+                    'row': students[name],
                     'column': column_index,
                     'status': AttendanceStatus.PRESENT
                 })
-                matched_names.append(name)
-            else:
-                unmatched_names.append(name)
 
-        # 8. 미출석자 처리
+        # 8. 미출석자 처리 (이미 기록한 열이면 다시 쓰지 않음)
         absent_names = [name for name in students.keys() if name not in matched_names]
 
-        for name in absent_names:
-            row = students[name]
-            updates.append({
-                'name': name,
-                'row': row,
-                'column': column_index,
-                'status': AttendanceStatus.ABSENT
-            })
+        if full_write:
+            for name in absent_names:
+                row = students[name]
+                updates.append({
+                    'name': name,
+                    'row': row,
+                    'column': column_index,
+                    'status': AttendanceStatus.ABSENT
+                })
 
-        # 9. 업데이트
-        success_count = sheets_handler.batch_update_attendance(updates)
-        print(f"✓ 구글 시트 업데이트 완료: {success_count}개")
+        # 9. 업데이트 (변경된 셀만, 출석 열 전체를 하나의 범위로 기록)
+        updates = sheets_handler.diff_attendance_updates(updates, snapshot.column_values(column_index))
+        success_count, queued_count = write_attendance_updates(workspace, sheets_handler, updates)
+        commit_collected(workspace, slack_handler, thread_ts, collected, column_input)
+        print(f"✓ 구글 시트 업데이트 완료: {success_count}개 (변경 셀만 기록, 저널 대기: {queued_count}개)")
 
-        # 10. 알림 전송
+        # 10. 알림 전송 (대기열에 넣고 백그라운드에서 전송)
         notification_user = workspace.notification_user_id or thread_user
 
         # 스레드 댓글 (사용자 정의 메시지 또는 기본 메시지)
@@ -757,16 +1362,20 @@ def check_attendance_job(workspace):
             total=len(students)
         )
 
-        slack_handler.post_thread_reply(
+        enqueue_notification(
+            workspace,
+            'thread_reply',
             workspace.slack_channel_id,
-            thread_ts,
-            completion_message
+            completion_message,
+            run_id,
+            thread_ts=thread_ts
         )
 
         # DM 전송
         if notification_user:
             dm_message = f"""[자동 출석체크 완료 알림]
 
+🏫 워크스페이스: {workspace.display_name}
 📅 열: {column_input}열
 📊 총 인원: {len(students)}명
 ✅ 출석: {len(matched_names)}명 ({len(matched_names)/len(students)*100:.1f}%)
@@ -782,7 +1391,27 @@ def check_attendance_job(workspace):
             if len(absent_names) > 50:
                 dm_message += f"... 외 {len(absent_names) - 50}명"
 
-            slack_handler.send_dm(notification_user, dm_message)
+            enqueue_notification(workspace, 'dm', notification_user, dm_message, run_id, digest=True)
+
+        # 11. 미출석자 안내 DM (명단의 Slack ID/이메일 열 사용, 이미 기록한 열을 다시 집계할 때는 보내지 않음)
+        #     다른 알림과 같이 대기열에 넣어 run_id 중복 확인과 재시도를 받음
+        if dm_column is not None and full_write and absent_names:
+            recipients = []
+
+            for name in absent_names:
+                recipient = snapshot.get_value(students[name], dm_column).strip()
+                if recipient:
+                    recipients.append({
+                        'recipient': recipient,
+                        'name': name,
+                        'column': column_input,
+                        'workspace': workspace.display_name,
+                    })
+                else:
+                    print(f"  ⚠ {name} - Slack ID/이메일이 없어 DM을 보내지 않습니다")
+
+            queued = enqueue_bulk_dms(workspace, recipients, workspace.absentee_dm_message, run_id)
+            print(f"✓ 미출석자 안내 DM 대기열 추가: {queued}명 / 대상 {len(recipients)}명")
 
         print(f"✓ 출석 집계 완료!")
 
@@ -900,6 +1529,23 @@ if __name__ == '__main__':
         scheduler.start()
         print("\n✓ 스케줄러 시작 완료 (한국 시간대: Asia/Seoul)")
 
+        # 출석 기록 저널 플러셔 시작 (이전 실행에서 남은 항목도 다시 전송)
+        journal_flusher.start()
+        print(f"✓ 출석 기록 저널 시작 완료 (대기 중: {write_journal.count('pending') + write_journal.count('inflight')}개)")
+
+        failed_entries = write_journal.failed_entries()
+        if failed_entries:
+            print(f"⚠️ 전송을 포기한 출석 기록 {write_journal.count('failed')}개 (GET /api/stats/journal에서 확인):")
+            for entry in failed_entries[:10]:
+                print(f"  - [{entry['workspace']}] {entry['name']} (행 {entry['row'] + 1}, 열 {column_index_to_letter(entry['column'])}): {entry['last_error']}")
+
+        # 슬랙 알림 작업자 시작 (이전 실행에서 보내지 못한 알림도 다시 전송)
+        notification_worker.start()
+        print(f"✓ 슬랙 알림 대기열 시작 완료 (대기 중: {notification_queue.count('pending')}개)")
+
+        # 실시간 출석 리스너 시작
+        start_live_attendance()
+
         print()
         print("=" * 50)
         print("서버 시작 중...")
@@ -917,6 +1563,9 @@ if __name__ == '__main__':
 
     except KeyboardInterrupt:
         print("\n\n서버 종료 중...")
+        stop_live_attendance()
+        notification_worker.stop()
+        journal_flusher.stop()
         scheduler.shutdown()
         print("✓ 스케줄러 종료 완료")
         print("✓ 서버가 종료되었습니다.")
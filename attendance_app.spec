@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_data_files
 
 block_cipher = None
 
@@ -11,7 +12,7 @@ a = Analysis(
         ('static', 'static'),
         ('src', 'src'),
         ('workspaces', 'workspaces'),
-    ],
+    ] + collect_data_files('googleapiclient.discovery_cache'),  # 정적 Discovery 문서
     hiddenimports=[
         'flask',
         'flask.json',
@@ -0,0 +1,188 @@
+"""
+출석 댓글 파서 마이크로벤치마크
+합성 댓글(기본 10만 개)로 이전 파서(댓글마다 이름 정규식 검색, 실패하면 소문자 변환 + any() 키워드 검사)와
+현재 파서(AttendanceParser.match_text, 댓글당 한 번 훑기)의 댓글별 경로와
+parse_attendance_replies 전체 처리량을 비교합니다.
+
+실행: python benchmarks/parser_benchmark.py [--count 100000] [--repeat 7]
+"""
+import argparse
+import contextlib
+import io
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parser import AttendanceParser
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN = '민서지현수영준호우진하윤도예은성재'
+
+
+def make_replies(count: int, seed: int = 42) -> list:
+    """
+    합성 댓글 생성 (이름/출석, 이름 출석, 키워드만, 일반 대화, 긴 잡담 섞음)
+
+    Args:
+        count (int): 댓글 수
+        seed (int): 난수 시드
+
+    Returns:
+        list: 댓글 리스트 (text, user_id, user_info, timestamp)
+    """
+    rng = random.Random(seed)
+    keywords = AttendanceParser.ATTENDANCE_KEYWORDS
+    chatter = ['안녕하세요', '오늘 수업 자료 어디 있나요?', '감사합니다!', '늦어서 죄송합니다', 'ㅎㅎ 넵']
+    replies = []
+
+    for i in range(count):
+        name = rng.choice(SURNAMES) + ''.join(rng.choice(GIVEN) for _ in range(2))
+        kind = rng.random()
+
+        if kind < 0.45:
+            text = f"{name}/{rng.choice(keywords)}"
+        elif kind < 0.7:
+            text = f"{name} {rng.choice(keywords)}"
+        elif kind < 0.8:
+            text = rng.choice(keywords)
+        elif kind < 0.95:
+            text = rng.choice(chatter)
+        else:
+            text = ' '.join(rng.choice(chatter) for _ in range(8))
+
+        replies.append({
+            'text': text,
+            'user_id': f"U{i:07d}",
+            'user_info': {'real_name': name, 'display_name': name},
+            'timestamp': f"{1700000000 + i}.000100",
+        })
+
+    return replies
+
+
+class LegacyParser(AttendanceParser):
+    """
+    이전 파서의 댓글 처리 경로 (비교용)
+
+    이름 정규식(키워드 목록 순서 그대로)으로 먼저 검색하고, 이름이 없으면
+    소문자 변환 + any()로 키워드를 다시 찾습니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.pattern = re.compile(
+            r'([가-힣a-zA-Z]+)\s*[/\s]\s*(' + '|'.join(self.ATTENDANCE_KEYWORDS) + ')',
+            re.IGNORECASE
+        )
+
+    def extract_name_from_text(self, text: str):
+        match = self.pattern.search(text)
+
+        if match:
+            return self.normalize_name(match.group(1).strip())
+
+        return None
+
+    def _contains_attendance_keyword(self, text: str) -> bool:
+        text_lower = text.lower()
+        return any(keyword in text_lower for keyword in self.ATTENDANCE_KEYWORDS)
+
+    def match_text(self, text: str) -> tuple:
+        """이전 parse_attendance_replies와 같은 순서: 이름 검색 후, 이름이 없을 때만 키워드 검사"""
+        name = self.extract_name_from_text(text)
+
+        if name:
+            return name, True
+
+        return None, self._contains_attendance_keyword(text)
+
+
+def bench(cases: list, replies: list, repeat: int) -> dict:
+    """
+    여러 함수를 번갈아 실행하여 함수별 가장 빠른 실행 시간 측정 (측정 순서에 따른 편향 완화)
+
+    Args:
+        cases (list): [(라벨, 함수)] - 함수는 댓글 리스트를 받음
+        replies (list): 댓글 리스트
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {라벨: 가장 빠른 실행 시간 (초)}
+    """
+    best = {label: float('inf') for label, _ in cases}
+
+    for _ in range(repeat):
+        for label, func in cases:
+            started = time.perf_counter()
+            func(replies)
+            best[label] = min(best[label], time.perf_counter() - started)
+
+    for label, _ in cases:
+        print(f"  {label:<40} {best[label] * 1000:9.1f} ms  {len(replies) / best[label]:>12,.0f} 댓글/초")
+
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='출석 댓글 파서 마이크로벤치마크')
+    arg_parser.add_argument('--count', type=int, default=100000, help='합성 댓글 수 (기본값: 100000)')
+    arg_parser.add_argument('--repeat', type=int, default=7, help='반복 횟수 (가장 빠른 결과 사용, 기본값: 7)')
+    args = arg_parser.parse_args()
+
+    replies = make_replies(args.count)
+    parser = AttendanceParser()
+    legacy = LegacyParser()
+
+    # 결과가 같은지 먼저 확인
+    for reply in replies:
+        assert legacy.match_text(reply['text']) == parser.match_text(reply['text']), reply['text']
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert legacy.parse_attendance_replies(replies) == parser.parse_attendance_replies(replies)
+
+    print(f"=== 출석 댓글 파서 벤치마크 (댓글 {len(replies):,}개, {args.repeat}회 중 최고) ===")
+
+    def per_reply(target):
+        def run(items):
+            match_text = target.match_text
+            for reply in items:
+                match_text(reply['text'])
+        return run
+
+    def full_parse(target):
+        def run(items):
+            with contextlib.redirect_stdout(io.StringIO()):
+                target.parse_attendance_replies(items)
+        return run
+
+    print("\n[댓글별 경로]")
+    reply_times = bench([
+        ('이전: 이름 정규식 + any()', per_reply(legacy)),
+        ('현재: match_text (1회 훑기)', per_reply(parser)),
+    ], replies, args.repeat)
+
+    print("\n[parse_attendance_replies 전체 (출력 포함)]")
+    parse_times = bench([
+        ('이전 파서', full_parse(legacy)),
+        ('현재 파서', full_parse(parser)),
+    ], replies, args.repeat)
+
+    reply_legacy, reply_current = reply_times.values()
+    parse_legacy, parse_current = parse_times.values()
+    print(f"\n댓글별 경로: 이전 방식 대비 {reply_legacy / reply_current:.2f}배")
+    print(f"파싱 전체: 이전 방식 대비 {parse_legacy / parse_current:.2f}배")
+
+    # 파서 생성 비용 (키워드 목록별 캐시)
+    started = time.perf_counter()
+    for _ in range(10000):
+        AttendanceParser()
+    print(f"AttendanceParser() 1만 번 생성: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
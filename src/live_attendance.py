@@ -0,0 +1,340 @@
+"""
+실시간 출석 모듈
+등록된 출석 스레드에 달리는 댓글(message 이벤트)을 받아 바로 파싱하고,
+짧은 간격으로 모아서 출석 기록을 대기열(저널)에 넘깁니다.
+집계 작업은 이후 미출석자만 채우면 됩니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from slack_sdk import WebClient
+from slack_sdk.socket_mode import SocketModeClient
+from slack_sdk.socket_mode.response import SocketModeResponse
+
+from src.parser import AttendanceParser
+from src.sheets_handler import AttendanceStatus
+from src.slack_handler import SlackHandler
+from src.thread_registry import ThreadRegistry
+from src.utils import column_letter_to_index
+
+
+class LiveAttendanceListener:
+    """등록된 출석 스레드의 댓글 이벤트를 출석 기록으로 바꾸는 리스너"""
+
+    # 출석 기록을 모아서 넘기는 간격 (초)
+    DEFAULT_COALESCE_SECONDS = 2.0
+
+    # 이만큼 쌓이면 간격을 기다리지 않고 넘김
+    MAX_PENDING = 50
+
+    # 출석 처리한 이름을 기억하는 스레드 수 (오래 댓글이 없던 스레드부터 잊음,
+    # 잊은 스레드에 다시 댓글이 달려도 같은 셀에 같은 값을 다시 쓸 뿐임)
+    MAX_THREADS = 20
+
+    # 댓글로 처리할 message 이벤트 subtype (None = 일반 댓글)
+    ACCEPTED_SUBTYPES = (None, 'thread_broadcast')
+
+    def __init__(self, channel_id: str, registry: ThreadRegistry, parser: AttendanceParser,
+                 roster_provider: Callable[[], Dict[str, int]], write_queue: Callable[[List[Dict]], None],
+                 slack_handler: Optional[SlackHandler] = None,
+                 coalesce_seconds: float = DEFAULT_COALESCE_SECONDS):
+        """
+        Args:
+            channel_id (str): 출석 채널 ID
+            registry (ThreadRegistry): 출석 스레드 등록부 (스레드별 기록 열)
+            parser (AttendanceParser): 출석 댓글 파서
+            roster_provider (Callable): () -> {학생이름: 행번호} (명단 캐시 사용)
+            write_queue (Callable): (updates) -> None, 모은 출석 기록을 넘겨받는 함수
+            slack_handler (Optional[SlackHandler]): 작성자 프로필 조회용 (없으면 댓글 텍스트만 사용)
+            coalesce_seconds (float): 출석 기록을 모으는 간격 (초)
+        """
+        self.channel_id = channel_id
+        self.registry = registry
+        self.parser = parser
+        self.roster_provider = roster_provider
+        self.write_queue = write_queue
+        self.slack_handler = slack_handler
+        self.coalesce_seconds = coalesce_seconds
+
+        self._lock = threading.Lock()
+        self._pending: Dict[tuple, Dict] = {}  # (열, 행) -> 업데이트
+        self._seen: 'OrderedDict[str, set]' = OrderedDict()  # 스레드 ts -> 출석 처리한 이름
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self.processed_events = 0
+        self.queued_updates = 0
+
+    def start(self):
+        """모은 출석 기록을 주기적으로 넘기는 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=f'live-attendance-{self.channel_id}', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """스레드 중지 (남은 기록은 넘기고 종료)"""
+        self._stopped.set()
+        self._wakeup.set()
+
+        if self._thread:
+            self._thread.join(timeout=5)
+
+        self.flush()
+
+    def _run(self):
+        """작업 루프"""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.coalesce_seconds)
+            self._wakeup.clear()
+
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"✗ 실시간 출석 기록 전달 오류: {e}")
+
+    def handle_event(self, event: Dict) -> Optional[Dict]:
+        """
+        Slack 이벤트 1개 처리 (Events API / Socket Mode의 event 객체)
+
+        등록된 출석 스레드의 댓글이고 출석 형식이면 출석 기록을 대기열에 추가합니다.
+
+        Args:
+            event (Dict): Slack 이벤트 (type, channel, ts, thread_ts, user, text ...)
+
+        Returns:
+            Optional[Dict]: 대기열에 추가한 업데이트, 처리하지 않았으면 None
+        """
+        if event.get('type') != 'message' or event.get('subtype') not in self.ACCEPTED_SUBTYPES:
+            return None
+
+        thread_ts = event.get('thread_ts')
+        if event.get('channel') != self.channel_id or not thread_ts or thread_ts == event.get('ts'):
+            return None
+
+        entry = self.registry.get(thread_ts)
+        if not entry or not entry.get('column'):
+            return None
+
+        column_index = column_letter_to_index(entry['column'])
+        if column_index is None:
+            return None
+
+        self.processed_events += 1
+
+        # 댓글 + 작성자 정보 (배치 수집과 같은 형식)
+        reply = {
+            'user_id': event.get('user'),
+            'user_info': None,
+            'text': event.get('text', ''),
+            'timestamp': event.get('ts', ''),
+        }
+        if self.slack_handler and reply['user_id']:
+            reply['user_info'] = self.slack_handler.resolve_users([reply['user_id']]).get(reply['user_id'])
+
+        with self._lock:
+            seen = set(self._seen.get(thread_ts, ()))
+
+        # 파싱과 명단 조회(캐시가 비었으면 Sheets 호출)는 잠금 밖에서 처리
+        attendance = self.parser.parse_attendance_replies([reply], seen_names=seen)
+        if not attendance:
+            return None
+
+        name = attendance[0]['name']
+        students = self.roster_provider()
+
+        if name not in students:
+            print(f"  ⚠ {name} - 명단에 없는 이름 (실시간 기록 제외)")
+            return None
+
+        update = {
+            'name': name,
+            'row': students[name],
+            'column': column_index,
+            'status': AttendanceStatus.PRESENT,
+        }
+
+        with self._lock:
+            seen = self._seen.setdefault(thread_ts, set())
+            self._seen.move_to_end(thread_ts)
+            while len(self._seen) > self.MAX_THREADS:
+                self._seen.popitem(last=False)
+
+            # 잠금 밖에 있는 동안 같은 이름의 다른 댓글이 먼저 처리된 경우
+            if name in seen:
+                return None
+
+            seen.add(name)
+            self._pending[(column_index, update['row'])] = update
+            full = len(self._pending) >= self.MAX_PENDING
+
+        # 많이 쌓였으면 간격을 기다리지 않고 바로 넘김
+        if full:
+            self._wakeup.set()
+
+        return update
+
+    def flush(self) -> int:
+        """
+        모은 출석 기록을 write_queue로 넘기기
+
+        Returns:
+            int: 넘긴 업데이트 수
+        """
+        with self._lock:
+            updates = list(self._pending.values())
+            self._pending.clear()
+
+        if not updates:
+            return 0
+
+        self.write_queue(updates)
+        self.queued_updates += len(updates)
+        print(f"✓ 실시간 출석 기록 {len(updates)}개 대기열에 추가")
+
+        return len(updates)
+
+    def get_stats(self) -> Dict:
+        """처리 통계 반환"""
+        with self._lock:
+            pending = len(self._pending)
+
+        return {
+            'processed_events': self.processed_events,
+            'queued_updates': self.queued_updates,
+            'pending_updates': pending,
+        }
+
+
+class SocketModeEventSource:
+    """Slack Socket Mode로 이벤트를 받아 리스너에 전달"""
+
+    def __init__(self, app_token: str, bot_token: str, listener: LiveAttendanceListener):
+        """
+        Args:
+            app_token (str): Slack App-Level Token (xapp-로 시작, connections:write 권한)
+            bot_token (str): Slack Bot Token
+            listener (LiveAttendanceListener): 이벤트를 처리할 리스너
+        """
+        self.listener = listener
+        self.client = SocketModeClient(app_token=app_token, web_client=WebClient(token=bot_token))
+        self.client.socket_mode_request_listeners.append(self._on_request)
+
+    def _on_request(self, client, req):
+        """Socket Mode 요청 처리 (먼저 ack 후 이벤트 처리)"""
+        client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+
+        if req.type != 'events_api':
+            return
+
+        try:
+            self.listener.handle_event(req.payload.get('event', {}))
+        except Exception as e:
+            print(f"✗ 실시간 출석 이벤트 처리 오류: {e}")
+
+    def start(self):
+        """연결 시작 (백그라운드)"""
+        self.listener.start()
+        self.client.connect()
+
+    def stop(self):
+        """연결 종료"""
+        self.client.close()
+        self.listener.stop()
+
+
+class LocalEventSource:
+    """
+    Slack 대신 이벤트를 직접 주입하는 로컬 이벤트 소스 (테스트/시연용)
+
+    SocketModeEventSource와 같은 start/stop 인터페이스를 가집니다.
+    """
+
+    def __init__(self, listener: LiveAttendanceListener):
+        """
+        Args:
+            listener (LiveAttendanceListener): 이벤트를 처리할 리스너
+        """
+        self.listener = listener
+
+    def start(self):
+        """리스너 시작"""
+        self.listener.start()
+
+    def stop(self):
+        """리스너 중지"""
+        self.listener.stop()
+
+    def inject(self, event: Dict) -> Optional[Dict]:
+        """
+        이벤트 1개 주입
+
+        Args:
+            event (Dict): Slack 이벤트
+
+        Returns:
+            Optional[Dict]: 리스너가 대기열에 추가한 업데이트
+        """
+        return self.listener.handle_event(event)
+
+    def inject_reply(self, thread_ts: str, text: str, user: str = 'ULOCAL', ts: Optional[str] = None) -> Optional[Dict]:
+        """
+        스레드 댓글 message 이벤트 주입
+
+        Args:
+            thread_ts (str): 스레드 타임스탬프
+            text (str): 댓글 내용
+            user (str): 작성자 User ID
+            ts (Optional[str]): 댓글 타임스탬프 (기본값: 현재 시각)
+
+        Returns:
+            Optional[Dict]: 리스너가 대기열에 추가한 업데이트
+        """
+        return self.inject({
+            'type': 'message',
+            'channel': self.listener.channel_id,
+            'thread_ts': thread_ts,
+            'ts': ts or f"{time.time():.6f}",
+            'user': user,
+            'text': text,
+        })
+
+
+# 테스트 코드
+if __name__ == '__main__':
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = ThreadRegistry(Path(tmp) / 'threads.json')
+        registry.register('1700000000.000100', 'C_TEST', column='K')
+
+        roster = {'김철수': 4, '이영희': 5, '박민수': 6}
+        written = []
+
+        listener = LiveAttendanceListener(
+            'C_TEST', registry, AttendanceParser(),
+            roster_provider=lambda: roster,
+            write_queue=written.extend,
+            coalesce_seconds=0.5
+        )
+        source = LocalEventSource(listener)
+        source.start()
+
+        print("=== 실시간 출석 테스트 ===")
+        source.inject_reply('1700000000.000100', '김철수/출석했습니다')
+        source.inject_reply('1700000000.000100', '이영희 출석')
+        source.inject_reply('1700000000.000100', '김철수/출석했습니다')  # 중복
+        source.inject_reply('1700000000.000999', '박민수/출석')  # 등록되지 않은 스레드
+
+        source.stop()
+
+        print("\n=== 대기열에 넘긴 기록 ===")
+        for update in written:
+            print(f"  - {update['name']}: 행 {update['row']}, 열 {update['column']}, {update['status'].value}")
+        print(f"\n통계: {listener.get_stats()}")
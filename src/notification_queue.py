@@ -0,0 +1,398 @@
+"""
+알림 전송 대기열 모듈
+스레드 댓글/DM 알림을 SQLite에 먼저 기록하고 백그라운드 작업자가 전송합니다.
+중복 키(실행 ID 포함)로 같은 실행의 알림이 두 번 전송되지 않게 하고, 실패하면 지수 백오프로 재시도합니다.
+같은 요약 키(digest_key)로 짧은 시간 안에 들어온 DM은 하나의 메시지로 합쳐 보냅니다.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from slack_sdk.errors import SlackApiError
+
+
+class NotificationQueue:
+    """슬랙 알림 전송 대기열 (SQLite)"""
+
+    # 전송 중(inflight) 항목의 임대 시간 (초, 전송하는 동안 작업자가 계속 연장)
+    LEASE_SECONDS = 120
+
+    # 실패 시 재시도 대기 (초) 및 최대 시도 횟수
+    RETRY_BASE_SECONDS = 5
+    RETRY_MAX_SECONDS = 600
+    MAX_ATTEMPTS = 10
+
+    # 전송 완료 항목 보관 기간 (초, 같은 실행의 중복 확인용)
+    KEEP_SENT_SECONDS = 7 * 24 * 60 * 60
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path (Path): SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        """SQLite 연결 (블록이 끝나면 커밋 후 닫음)"""
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            conn.row_factory = sqlite3.Row
+            yield conn
+
+    def _init_db(self):
+        """테이블 생성"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS notifications (
+                    dedup_key TEXT PRIMARY KEY,
+                    workspace TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    thread_ts TEXT,
+                    text TEXT NOT NULL,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_until REAL NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    sent_at REAL,
+                    message_ts TEXT,
+                    last_error TEXT,
+                    digest_key TEXT
+                )
+            """)
+
+            # 이전 버전 DB에는 digest_key 열이 없음
+            columns = [row['name'] for row in conn.execute("PRAGMA table_info(notifications)")]
+            if 'digest_key' not in columns:
+                conn.execute("ALTER TABLE notifications ADD COLUMN digest_key TEXT")
+
+    @staticmethod
+    def make_key(workspace: str, kind: str, target: str, text: str, run_id: str,
+                 thread_ts: Optional[str] = None) -> str:
+        """
+        중복 키 생성 (같은 실행에서 같은 대상에게 보내는 같은 내용이면 같은 키)
+
+        실행 ID가 다르면 내용이 같아도 다른 알림으로 보고 다시 전송합니다.
+
+        Returns:
+            str: 중복 키
+        """
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+        return f"{workspace}|{run_id}|{kind}|{target}|{thread_ts or ''}|{digest}"
+
+    def enqueue(self, workspace: str, kind: str, target: str, text: str, run_id: str,
+                thread_ts: Optional[str] = None, dedup_key: Optional[str] = None,
+                digest_key: Optional[str] = None, digest_seconds: float = 0) -> bool:
+        """
+        알림을 대기열에 추가 (같은 중복 키가 이미 있으면 추가하지 않음)
+
+        Args:
+            workspace (str): 워크스페이스 폴더 이름
+            kind (str): 'thread_reply' (스레드 댓글) 또는 'dm'
+            target (str): 채널 ID (thread_reply) 또는 User ID/이메일 (dm)
+            text (str): 메시지 내용
+            run_id (str): 실행 ID (예: 스레드 ts + 열 + 실행 시각, 같은 실행의 재시도만 중복으로 처리)
+            thread_ts (Optional[str]): 스레드 타임스탬프 (thread_reply)
+            dedup_key (Optional[str]): 중복 키 (기본값: make_key)
+            digest_key (Optional[str]): 요약 키 (같은 키의 대기 항목은 한 메시지로 합쳐 전송)
+            digest_seconds (float): 요약 대기 시간 (초, 이 시간 동안 같은 키의 항목을 모음)
+
+        Returns:
+            bool: 새로 추가되었는지 여부 (False면 이미 대기 중이거나 전송된 알림)
+        """
+        dedup_key = dedup_key or self.make_key(workspace, kind, target, text, run_id, thread_ts)
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            next_attempt_at = 0
+
+            if digest_key and digest_seconds > 0:
+                # 이미 모으는 중인 요약이 있으면 그 전송 시각에 맞춤
+                row = conn.execute(
+                    "SELECT MIN(next_attempt_at) FROM notifications WHERE digest_key = ? AND state = 'pending'",
+                    (digest_key,)
+                ).fetchone()
+                next_attempt_at = row[0] if row[0] is not None else now + digest_seconds
+
+            cursor = conn.execute("""
+                INSERT OR IGNORE INTO notifications
+                    (dedup_key, workspace, kind, target, thread_ts, text, created_at, next_attempt_at, digest_key)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (dedup_key, workspace, kind, target, thread_ts, text, now, next_attempt_at,
+                  digest_key if digest_seconds > 0 else None))
+
+            return cursor.rowcount > 0
+
+    def claim(self, limit: int = 50) -> List[Dict]:
+        """
+        전송할 항목을 임대 상태로 가져오기 (오래된 순서)
+
+        요약 키가 있는 항목은 같은 키로 모으는 중인 다른 항목도 함께 가져옵니다.
+
+        Args:
+            limit (int): 최대 항목 수
+
+        Returns:
+            List[Dict]: 항목 리스트
+        """
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            rows = conn.execute("""
+                SELECT * FROM notifications
+                WHERE (state = 'pending' AND next_attempt_at <= ?)
+                   OR (state = 'inflight' AND lease_until < ?)
+                ORDER BY created_at
+                LIMIT ?
+            """, (now, now, limit)).fetchall()
+
+            claimed = {row['dedup_key'] for row in rows}
+            digest_keys = list({row['digest_key'] for row in rows if row['digest_key']})
+
+            if digest_keys:
+                placeholders = ','.join('?' * len(digest_keys))
+                companions = conn.execute(f"""
+                    SELECT * FROM notifications
+                    WHERE state = 'pending' AND digest_key IN ({placeholders})
+                    ORDER BY created_at
+                """, digest_keys).fetchall()
+                rows += [row for row in companions if row['dedup_key'] not in claimed]
+
+            conn.executemany(
+                "UPDATE notifications SET state = 'inflight', lease_until = ? WHERE dedup_key = ?",
+                [(now + self.LEASE_SECONDS, row['dedup_key']) for row in rows]
+            )
+
+        return [dict(row) for row in rows]
+
+    def renew(self, dedup_keys: List[str]):
+        """
+        전송 중인 항목의 임대 시간 연장 (호출 한도 대기/재시도로 전송이 길어질 때)
+
+        Args:
+            dedup_keys (List[str]): 중복 키 리스트
+        """
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "UPDATE notifications SET lease_until = ? WHERE dedup_key = ? AND state = 'inflight'",
+                [(time.time() + self.LEASE_SECONDS, key) for key in dedup_keys]
+            )
+
+    def complete(self, dedup_key: str, message_ts: Optional[str] = None):
+        """
+        전송 완료 처리 (중복 확인을 위해 보관 기간 동안 남겨 둠)
+
+        Args:
+            dedup_key (str): 중복 키
+            message_ts (Optional[str]): 보낸 메시지 ts
+        """
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            conn.execute("""
+                UPDATE notifications SET state = 'sent', sent_at = ?, message_ts = ?, lease_until = 0, last_error = NULL
+                WHERE dedup_key = ?
+            """, (now, message_ts, dedup_key))
+            conn.execute(
+                "DELETE FROM notifications WHERE state = 'sent' AND sent_at < ?",
+                (now - self.KEEP_SENT_SECONDS,)
+            )
+
+    def release(self, dedup_key: str, error: str = '', permanent: bool = False):
+        """
+        전송 실패 처리 (지수 백오프 후 재시도, permanent거나 횟수를 넘기면 failed)
+
+        Args:
+            dedup_key (str): 중복 키
+            error (str): 오류 메시지
+            permanent (bool): 다시 시도해도 성공할 수 없는 오류인지 여부
+        """
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM notifications WHERE dedup_key = ?", (dedup_key,)
+            ).fetchone()
+
+            if row is None:
+                return
+
+            attempts = row['attempts'] + 1
+            state = 'failed' if permanent or attempts >= self.MAX_ATTEMPTS else 'pending'
+            delay = min(self.RETRY_MAX_SECONDS, self.RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+
+            conn.execute("""
+                UPDATE notifications SET state = ?, attempts = ?, lease_until = 0, next_attempt_at = ?, last_error = ?
+                WHERE dedup_key = ?
+            """, (state, attempts, now + delay, error, dedup_key))
+
+    def count(self, state: Optional[str] = None) -> int:
+        """
+        항목 수 조회
+
+        Args:
+            state (Optional[str]): 'pending', 'inflight', 'sent', 'failed' 중 하나 (None이면 전체)
+
+        Returns:
+            int: 항목 수
+        """
+        with self._lock, self._connect() as conn:
+            if state is None:
+                return conn.execute("SELECT COUNT(*) FROM notifications").fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM notifications WHERE state = ?", (state,)).fetchone()[0]
+
+
+class NotificationWorker:
+    """알림 대기열을 비우는 백그라운드 작업자"""
+
+    # 다시 보내도 성공할 수 없는 Slack 오류
+    PERMANENT_ERRORS = (
+        'not_in_channel', 'channel_not_found', 'is_archived', 'users_not_found', 'user_not_found',
+        'cannot_dm_bot', 'account_inactive', 'invalid_auth', 'not_authed', 'msg_too_long', 'no_text',
+    )
+
+    def __init__(self, queue: NotificationQueue, handler_factory: Callable, interval: float = 5.0, batch_size: int = 50):
+        """
+        Args:
+            queue (NotificationQueue): 알림 대기열
+            handler_factory (Callable): (workspace) -> SlackHandler 또는 None
+            interval (float): 대기열 확인 주기 (초)
+            batch_size (int): 한 번에 가져올 최대 항목 수
+        """
+        self.queue = queue
+        self.handler_factory = handler_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 스레드 시작 (시작하자마자 남은 항목을 다시 전송)"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='notification-worker', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 스레드 중지"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def notify(self):
+        """새 알림이 추가되었음을 알림 (다음 주기를 기다리지 않고 전송)"""
+        self._wakeup.set()
+
+    def _run(self):
+        """작업 루프"""
+        while not self._stopped.is_set():
+            try:
+                while self.drain_once() > 0 and not self._stopped.is_set():
+                    pass
+            except Exception as e:
+                print(f"✗ 알림 전송 오류: {e}")
+
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    @contextmanager
+    def _leased(self, keys: List[str]):
+        """전송하는 동안 임대 시간을 주기적으로 연장 (다른 작업자가 같은 항목을 다시 가져가지 않도록)"""
+        self.queue.renew(keys)
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(self.queue.LEASE_SECONDS / 3):
+                self.queue.renew(keys)
+
+        thread = threading.Thread(target=heartbeat, name='notification-lease', daemon=True)
+        thread.start()
+
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    @staticmethod
+    def merge_digest(items: List[Dict]) -> str:
+        """
+        같은 수신자에게 보낼 요약 항목들을 하나의 메시지로 합치기
+
+        Args:
+            items (List[Dict]): 대기열 항목 리스트 (작성 순서)
+
+        Returns:
+            str: 합친 메시지
+        """
+        if len(items) == 1:
+            return items[0]['text']
+
+        header = f"[출석체크 알림 요약] {len(items)}건"
+        return header + "\n\n" + "\n\n──────────\n\n".join(item['text'].strip() for item in items)
+
+    def drain_once(self) -> int:
+        """
+        대기열 항목 한 묶음 전송 (요약 키가 같은 항목은 한 메시지로 전송)
+
+        Returns:
+            int: 처리한 항목 수 (0이면 보낼 항목 없음)
+        """
+        items = self.queue.claim(self.batch_size)
+        handlers = {}
+        groups: Dict[str, List[Dict]] = {}
+
+        for item in items:
+            groups.setdefault(item['digest_key'] or item['dedup_key'], []).append(item)
+
+        for group in groups.values():
+            first = group[0]
+            workspace = first['workspace']
+            keys = [item['dedup_key'] for item in group]
+            label = f"{workspace} - {first['kind']}" + (f" 요약 {len(group)}건" if len(group) > 1 else '')
+
+            if workspace not in handlers:
+                handlers[workspace] = self.handler_factory(workspace)
+
+            handler = handlers[workspace]
+
+            if handler is None:
+                for key in keys:
+                    self.queue.release(key, '워크스페이스를 찾을 수 없음')
+                continue
+
+            try:
+                with self._leased(keys):
+                    message_ts = handler.deliver_notification(
+                        first['kind'], first['target'], self.merge_digest(group), first['thread_ts']
+                    )
+                for key in keys:
+                    self.queue.complete(key, message_ts)
+                print(f"✓ [알림] {label} 전송 완료 ({first['target']})")
+
+            except SlackApiError as e:
+                error = e.response['error']
+                permanent = error in self.PERMANENT_ERRORS
+                for key in keys:
+                    self.queue.release(key, error, permanent=permanent)
+                print(f"✗ [알림] {label} 전송 실패 ({first['target']}): {error}"
+                      f"{'' if permanent else ' - 나중에 다시 시도'}")
+
+            except Exception as e:  # 연결 오류 등
+                for key in keys:
+                    self.queue.release(key, str(e))
+                print(f"✗ [알림] {label} 전송 실패 ({first['target']}): {e} - 나중에 다시 시도")
+
+        return len(items)
@@ -3,7 +3,39 @@
 슬랙 댓글에서 출석 정보를 추출합니다.
 """
 import re
-from typing import List, Dict, Optional, Set
+from functools import lru_cache
+from typing import Iterable, List, Dict, Optional, Pattern, Set, Tuple
+
+
+@lru_cache(maxsize=16)
+def compile_attendance_matcher(keywords: Tuple[str, ...]) -> Pattern:
+    """
+    "이름/출석" 패턴과 키워드만 있는 경우를 함께 찾는 정규식 컴파일 (키워드 목록별로 캐시)
+
+    각 위치에서 "이름 + 구분자 + 키워드"를 먼저 시도하고, 아니면 키워드만 일치합니다.
+    이름이 있으면 'name' 그룹(1번)이 일치하고, 키워드만 일치하면 lastindex가 None입니다.
+    키워드가 하나라도 있으면 일치하므로 출석 스레드 검색
+    (SlackHandler.find_latest_attendance_thread)도 같은 정규식을 사용합니다.
+
+    Args:
+        keywords (Tuple[str, ...]): 출석 키워드
+
+    Returns:
+        Pattern: 컴파일된 정규식
+    """
+    alternatives = sorted({k for k in keywords if k}, key=len, reverse=True)
+
+    if not alternatives:
+        return re.compile(r'(?!)')  # 아무것도 일치하지 않음
+
+    keyword = '(?:' + '|'.join(re.escape(k) for k in alternatives) + ')'
+
+    # 패턴: "이름/출석" 또는 "이름 출석" 형태, 아니면 키워드만
+    # 이름은 단어 시작에서만 시도 (단어 중간에서 시작하는 이름은 단어 시작에서 이미 일치했을 것이므로 결과는 같음)
+    return re.compile(
+        r'(?<![가-힣a-zA-Z])(?P<name>[가-힣a-zA-Z]+)\s*[/\s]\s*' + keyword + '|' + keyword,
+        re.IGNORECASE
+    )
 
 
 class AttendanceParser:
@@ -20,13 +52,32 @@ class AttendanceParser:
     ]
 
     def __init__(self):
-        """AttendanceParser 초기화"""
-        # 정규표현식 패턴 컴파일
-        # 패턴: "이름/출석" 또는 "이름 출석" 형태
-        self.pattern = re.compile(
-            r'([가-힣a-zA-Z]+)\s*[/\s]\s*(' + '|'.join(self.ATTENDANCE_KEYWORDS) + ')',
-            re.IGNORECASE
-        )
+        """AttendanceParser 초기화 (정규식은 키워드 목록별로 한 번만 컴파일)"""
+        self.matcher = compile_attendance_matcher(tuple(self.ATTENDANCE_KEYWORDS))
+
+    def match_text(self, text: str) -> Tuple[Optional[str], bool]:
+        """
+        댓글 텍스트를 한 번 검사하여 이름과 출석 키워드 포함 여부 확인
+
+        Args:
+            text (str): 댓글 텍스트
+
+        Returns:
+            Tuple[Optional[str], bool]: (추출된 이름 또는 None, 출석 키워드 포함 여부)
+        """
+        search = self.matcher.search
+        match = search(text)
+
+        if match is None:
+            return None, False
+
+        # 키워드만 먼저 나온 경우 ("출석 김철수/출석") 그 뒤에서 이어서 찾음 (이미 본 부분은 다시 보지 않음)
+        while match.lastindex is None:
+            match = search(text, match.end())
+            if match is None:
+                return None, True
+
+        return self.normalize_name(match.group('name')), True
 
     def extract_name_from_text(self, text: str) -> Optional[str]:
         """
@@ -38,14 +89,7 @@ class AttendanceParser:
         Returns:
             Optional[str]: 추출된 이름 (없으면 None)
         """
-        # 패턴 매칭
-        match = self.pattern.search(text)
-
-        if match:
-            name = match.group(1).strip()
-            return self.normalize_name(name)
-
-        return None
+        return self.match_text(text)[0]
 
     def normalize_name(self, name: str) -> str:
         """
@@ -59,12 +103,13 @@ class AttendanceParser:
         """
         return name.strip()
 
-    def parse_attendance_replies(self, replies: List[Dict]) -> List[Dict]:
+    def parse_attendance_replies(self, replies: Iterable[Dict], seen_names: Optional[Set[str]] = None) -> List[Dict]:
         """
         댓글 리스트에서 출석 정보 파싱
 
         Args:
-            replies (List[Dict]): 슬랙 댓글 리스트 (user_info 포함)
+            replies (Iterable[Dict]): 슬랙 댓글 리스트 또는 제너레이터 (user_info 포함)
+            seen_names (Optional[Set[str]]): 이미 출석 처리한 이름 (새 댓글만 파싱할 때, 결과에서 제외)
 
         Returns:
             List[Dict]: 파싱된 출석 정보 리스트
@@ -72,14 +117,14 @@ class AttendanceParser:
         print(f"\n[파싱] 출석 댓글 파싱 중...")
 
         attendance_list = []
-        seen_names = set()  # 중복 제거용
+        seen_names = set(seen_names or ())  # 중복 제거용
 
         for reply in replies:
             text = reply.get('text', '')
             user_info = reply.get('user_info')
 
-            # 텍스트에서 이름 추출
-            name = self.extract_name_from_text(text)
+            # 텍스트에서 이름 추출 (키워드 포함 여부도 함께 확인)
+            name, has_keyword = self.match_text(text)
 
             if name:
                 # 중복 체크 (같은 사람이 여러 번 댓글 작성한 경우)
@@ -103,7 +148,7 @@ class AttendanceParser:
                     display_name = user_info.get('display_name', '')
 
                     # 실명 또는 표시 이름이 있고, 출석 키워드가 포함된 경우
-                    if self._contains_attendance_keyword(text):
+                    if has_keyword:
                         fallback_name = display_name or real_name
 
                         if fallback_name and fallback_name not in seen_names:
@@ -122,6 +167,47 @@ class AttendanceParser:
 
         return attendance_list
 
+    def parse_reaction_users(self, users: Iterable[Dict]) -> List[Dict]:
+        """
+        출석 반응을 단 사용자 목록을 출석 정보로 변환 (슬랙 표시 이름 또는 실명 사용)
+
+        Args:
+            users (Iterable[Dict]): SlackHandler.get_reaction_users 결과
+
+        Returns:
+            List[Dict]: 출석 정보 리스트 (parse_attendance_replies와 같은 형식)
+        """
+        print(f"\n[파싱] 출석 반응 처리 중...")
+
+        attendance_list = []
+        seen_names = set()
+
+        for user in users:
+            user_info = user.get('user_info') or {}
+            name = self.normalize_name(user_info.get('display_name') or user_info.get('real_name') or '')
+
+            if not name:
+                print(f"  ⚠ {user.get('user_id')} - 사용자 이름을 알 수 없음")
+                continue
+
+            if name in seen_names:
+                continue
+
+            attendance_list.append({
+                'name': name,
+                'text': f":{user.get('reaction')}:",
+                'user_id': user.get('user_id'),
+                'user_info': user.get('user_info'),
+                'timestamp': None,
+                'source': 'reaction'  # 반응으로 출석
+            })
+            seen_names.add(name)
+            print(f"  ✓ {name} - 출석 확인 (:{user.get('reaction')}:)")
+
+        print(f"\n✓ 출석 반응 처리 완료: {len(attendance_list)}명")
+
+        return attendance_list
+
     def _contains_attendance_keyword(self, text: str) -> bool:
         """
         텍스트에 출석 키워드가 포함되어 있는지 확인
@@ -132,8 +218,7 @@ class AttendanceParser:
         Returns:
             bool: 포함 여부
         """
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.ATTENDANCE_KEYWORDS)
+        return self.match_text(text)[1]
 
     def get_attendance_summary(self, attendance_list: List[Dict]) -> Dict:
         """
@@ -153,6 +238,7 @@ class AttendanceParser:
             'by_source': {
                 'text_pattern': len([x for x in attendance_list if x['source'] == 'text_pattern']),
                 'slack_name': len([x for x in attendance_list if x['source'] == 'slack_name']),
+                'reaction': len([x for x in attendance_list if x['source'] == 'reaction']),
             }
         }
 
@@ -0,0 +1,403 @@
+"""
+API 호출 속도 제한 모듈
+토큰 버킷, 대기 시간 통계, Google Sheets 요청 조절기, Slack 메서드별 호출 제한기를 제공합니다.
+"""
+import json
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from googleapiclient.errors import HttpError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+
+
+class TokenBucket:
+    """토큰 버킷 (스레드 안전, 먼저 요청한 호출이 먼저 통과)"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate_per_minute (float): 분당 허용 호출 수
+            capacity (Optional[float]): 버킷 크기 (기본값: 분당 허용 호출 수)
+        """
+        self.rate = rate_per_minute / 60.0  # 초당 토큰
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        토큰을 예약하고 사용할 수 있을 때까지 대기
+
+        토큰이 부족하면 잔량을 음수로 남겨 다음 순번을 예약하므로,
+        동시에 기다리는 호출들은 요청한 순서대로 통과합니다.
+
+        Args:
+            tokens (float): 필요한 토큰 수
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def pause(self, seconds: float):
+        """
+        지정한 시간 동안 토큰 지급을 멈춤 (Retry-After 응답을 받았을 때)
+
+        이미 예약된 순번보다 앞당기지는 않습니다.
+
+        Args:
+            seconds (float): 멈출 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimitStats:
+    """호출/대기/재시도 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self.calls = 0
+            self.waited_calls = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self.retries = 0
+            self.failures = 0
+
+    def record_call(self, wait: float):
+        """호출 1회와 대기 시간 기록"""
+        with self._lock:
+            self.calls += 1
+            if wait > 0:
+                self.waited_calls += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+
+    def record_retry(self, wait: float):
+        """재시도 1회와 백오프 대기 시간 기록"""
+        with self._lock:
+            self.retries += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_failure(self):
+        """재시도 후에도 실패한 호출 기록"""
+        with self._lock:
+            self.failures += 1
+
+    def to_dict(self) -> Dict:
+        """통계를 딕셔너리로 반환"""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'waited_calls': self.waited_calls,
+                'total_wait_seconds': round(self.total_wait, 3),
+                'max_wait_seconds': round(self.max_wait, 3),
+                'retries': self.retries,
+                'failures': self.failures,
+            }
+
+
+class SheetsRequestGovernor:
+    """
+    Google Sheets API 요청 조절기
+
+    프로젝트별/사용자(서비스 계정)별 분당 할당량에 맞춘 토큰 버킷으로 호출 속도를 맞추고,
+    429/5xx 응답은 지터가 있는 지수 백오프로 재시도합니다.
+    여러 워크스페이스가 같은 프로젝트를 쓰면 버킷을 공유하므로 할당량을 나눠 씁니다.
+    """
+
+    # Sheets API 기본 할당량 (분당 요청 수)
+    PROJECT_QUOTA_PER_MINUTE = 300
+    USER_QUOTA_PER_MINUTE = 60
+
+    # 재시도 설정
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 1.0   # 초
+    BACKOFF_MAX = 32.0   # 초
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[tuple, TokenBucket] = {}
+        self._projects: Dict[str, str] = {}  # 인증 파일 -> project_id
+        self.stats = RateLimitStats()
+
+    def _get_bucket(self, key: tuple, rate_per_minute: float) -> TokenBucket:
+        """키별 토큰 버킷 반환 (없으면 생성)"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate_per_minute)
+                self._buckets[key] = bucket
+            return bucket
+
+    def _get_project_id(self, credentials_path: Optional[str]) -> str:
+        """인증 파일의 project_id 반환 (한 번만 읽음)"""
+        if not credentials_path:
+            return 'default'
+
+        with self._lock:
+            if credentials_path in self._projects:
+                return self._projects[credentials_path]
+
+        try:
+            with open(credentials_path, 'r', encoding='utf-8') as f:
+                project_id = json.load(f).get('project_id') or credentials_path
+        except Exception:
+            project_id = credentials_path
+
+        with self._lock:
+            self._projects[credentials_path] = project_id
+
+        return project_id
+
+    def _backoff(self, attempt: int) -> float:
+        """지터가 있는 지수 백오프 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * (2 ** attempt)))
+
+    def execute(self, request, kind: str = 'read', credentials_path: Optional[str] = None):
+        """
+        할당량에 맞춰 요청을 실행하고 일시적인 오류는 재시도
+
+        Args:
+            request: googleapiclient 요청 객체 (execute() 메서드 보유)
+            kind (str): 'read' 또는 'write' (할당량 구분)
+            credentials_path (Optional[str]): 서비스 계정 인증 파일 경로 (사용자 할당량 구분)
+
+        Returns:
+            Dict: API 응답
+
+        Raises:
+            HttpError: 재시도할 수 없는 오류이거나 재시도 횟수를 넘긴 경우
+        """
+        project_bucket = self._get_bucket(
+            ('project', self._get_project_id(credentials_path), kind),
+            self.PROJECT_QUOTA_PER_MINUTE
+        )
+        user_bucket = self._get_bucket(
+            ('user', credentials_path or 'default', kind),
+            self.USER_QUOTA_PER_MINUTE
+        )
+
+        attempt = 0
+
+        while True:
+            wait = user_bucket.acquire() + project_bucket.acquire()
+            self.stats.record_call(wait)
+
+            try:
+                return request.execute()
+
+            except HttpError as e:
+                if e.resp.status not in self.RETRY_STATUS_CODES or attempt >= self.MAX_RETRIES:
+                    self.stats.record_failure()
+                    raise
+
+                delay = self._backoff(attempt)
+                print(f"  ⏳ Sheets API {e.resp.status} 응답 - {delay:.1f}초 후 재시도 ({attempt + 1}/{self.MAX_RETRIES})")
+                self.stats.record_retry(delay)
+                time.sleep(delay)
+                attempt += 1
+
+
+class SlackRateLimiter:
+    """
+    Slack Web API 호출 제한기
+
+    토큰(워크스페이스 앱)별, 메서드별로 Slack 메서드 등급(Tier)에 맞춘 토큰 버킷을 두고,
+    429 응답의 Retry-After 동안에는 같은 토큰/메서드의 다른 호출도 함께 기다리게 합니다.
+    채널 단위로 한도가 걸리는 메서드(PER_CHANNEL_METHODS)는 채널마다 버킷을 따로 둡니다.
+    """
+
+    # 등급별 분당 호출 수
+    TIER_RATES = {
+        1: 1,
+        2: 20,
+        3: 50,
+        4: 100,
+    }
+
+    # 메서드별 등급 (목록에 없으면 DEFAULT_TIER)
+    METHOD_TIERS = {
+        'auth.test': 4,
+        'conversations.history': 3,
+        'conversations.replies': 3,
+        'conversations.open': 3,
+        'reactions.get': 3,
+        'users.info': 4,
+        'users.list': 2,
+        'users.lookupByEmail': 3,
+    }
+    DEFAULT_TIER = 3
+
+    # 등급 대신 별도 한도를 쓰는 메서드 (분당 호출 수)
+    SPECIAL_RATES = {
+        'chat.postMessage': 60,  # 채널당 초당 1건 (짧은 순간 초과는 허용)
+    }
+
+    # 버킷을 (토큰, 메서드, 채널)로 나누는 메서드
+    # Slack 문서의 chat.postMessage 한도는 채널 단위이고 워크스페이스 전체 한도는 수치로
+    # 공개되어 있지 않으므로 따로 상한을 두지 않고, 그 한도에 걸리면 429 Retry-After로 맞춥니다.
+    PER_CHANNEL_METHODS = frozenset({'chat.postMessage'})
+
+    # 429 응답 재시도 횟수
+    MAX_RETRIES = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[tuple, TokenBucket] = {}
+        self._stats: Dict[str, RateLimitStats] = {}
+
+    def get_rate(self, method: str) -> float:
+        """메서드의 분당 허용 호출 수"""
+        if method in self.SPECIAL_RATES:
+            return self.SPECIAL_RATES[method]
+        return self.TIER_RATES[self.METHOD_TIERS.get(method, self.DEFAULT_TIER)]
+
+    def _bucket_key(self, token: str, method: str, channel: Optional[str] = None) -> tuple:
+        """버킷 키 (채널 단위 메서드는 채널까지 포함)"""
+        if method in self.PER_CHANNEL_METHODS:
+            return (token, method, channel)
+        return (token, method)
+
+    def _get_bucket(self, token: str, method: str, channel: Optional[str] = None) -> TokenBucket:
+        """토큰/메서드(/채널)별 토큰 버킷 반환 (없으면 생성, 순간 허용량은 약 10초 분량)"""
+        key = self._bucket_key(token, method, channel)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate = self.get_rate(method)
+                bucket = TokenBucket(rate, capacity=max(1.0, rate / 6))
+                self._buckets[key] = bucket
+            return bucket
+
+    def stats_for(self, method: str) -> RateLimitStats:
+        """메서드별 통계 반환 (없으면 생성)"""
+        with self._lock:
+            stats = self._stats.get(method)
+            if stats is None:
+                stats = RateLimitStats()
+                self._stats[method] = stats
+            return stats
+
+    def acquire(self, token: str, method: str, channel: Optional[str] = None) -> float:
+        """
+        호출 한도 안에서 순번이 올 때까지 대기
+
+        Args:
+            token (str): Slack Bot Token
+            method (str): API 메서드 이름 (예: 'conversations.replies')
+            channel (Optional[str]): 채널 ID (채널 단위 메서드에서만 사용)
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        wait = self._get_bucket(token, method, channel).acquire()
+        self.stats_for(method).record_call(wait)
+        return wait
+
+    def penalize(self, token: str, method: str, seconds: float, channel: Optional[str] = None):
+        """
+        Retry-After 시간 동안 같은 토큰/메서드(/채널) 호출을 멈춤
+
+        채널 단위 메서드인데 채널을 알 수 없으면 그 토큰/메서드의 모든 채널 버킷을 멈춥니다.
+
+        Args:
+            token (str): Slack Bot Token
+            method (str): API 메서드 이름
+            seconds (float): Retry-After (초)
+            channel (Optional[str]): 429를 받은 요청의 채널 ID
+        """
+        if method in self.PER_CHANNEL_METHODS and channel is None:
+            with self._lock:
+                buckets = [bucket for key, bucket in self._buckets.items() if key[:2] == (token, method)]
+            for bucket in buckets:
+                bucket.pause(seconds)
+        else:
+            self._get_bucket(token, method, channel).pause(seconds)
+        self.stats_for(method).record_retry(seconds)
+
+    def make_retry_handler(self, token: str) -> 'SlackRetryAfterHandler':
+        """
+        WebClient에 등록할 429 재시도 핸들러 생성
+
+        Args:
+            token (str): Slack Bot Token
+
+        Returns:
+            SlackRetryAfterHandler: 재시도 핸들러
+        """
+        return SlackRetryAfterHandler(self, token, max_retry_count=self.MAX_RETRIES)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """메서드별 통계를 딕셔너리로 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+        return {method: s.to_dict() for method, s in sorted(stats.items())}
+
+
+class SlackRetryAfterHandler(RateLimitErrorRetryHandler):
+    """
+    slack_sdk의 429 재시도 핸들러 (Retry-After만큼 기다린 뒤 재시도)
+
+    기다리기 전에 제한기의 토큰 버킷도 멈춰서, 같은 토큰/메서드를 쓰는
+    다른 스레드가 그 사이에 호출해 다시 429를 받지 않게 합니다.
+    """
+
+    def __init__(self, limiter: SlackRateLimiter, token: str, **kwargs):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.token = token
+
+    @staticmethod
+    def _retry_after(response) -> float:
+        """응답의 Retry-After 헤더 값 (초, 없으면 1)"""
+        for key, value in response.headers.items():
+            if key.lower() == 'retry-after':
+                try:
+                    return float(value[0] if isinstance(value, list) else value)
+                except (TypeError, ValueError):
+                    break
+        return 1.0
+
+    def prepare_for_next_attempt(self, *, state, request, response=None, error=None):
+        if response is not None:
+            method = urlparse(request.url).path.rsplit('/', 1)[-1]
+            retry_after = self._retry_after(response)
+            channel = (request.body_params or {}).get('channel')
+            print(f"  ⏳ Slack API {method} 429 응답 - {retry_after:.0f}초 후 재시도 "
+                  f"({state.current_attempt + 1}/{self.max_retry_count})")
+            self.limiter.penalize(self.token, method, retry_after, channel=channel)
+
+        super().prepare_for_next_attempt(state=state, request=request, response=response, error=error)
+
+
+# 프로세스 전체에서 공유하는 기본 조절기
+default_governor = SheetsRequestGovernor()
+
+# 프로세스 전체에서 공유하는 Slack 호출 제한기
+default_slack_limiter = SlackRateLimiter()
@@ -0,0 +1,203 @@
+"""
+스레드 댓글 저장소 모듈
+스레드별로 이미 처리한 댓글, 마지막 댓글 ts(high-water mark), 출석 처리한 학생을 SQLite에 저장하여
+다시 실행할 때 새 댓글만 가져와 처리할 수 있게 합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+class ReplyStore:
+    """스레드 댓글/출석 처리 기록 저장소 (SQLite, 워크스페이스별)"""
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path (Path): SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        """SQLite 연결 (블록이 끝나면 커밋 후 닫음)"""
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            yield conn
+
+    def _init_db(self):
+        """테이블 생성"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS threads (
+                    channel TEXT NOT NULL,
+                    thread_ts TEXT NOT NULL,
+                    high_water_mark TEXT,
+                    column_letter TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (channel, thread_ts)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS replies (
+                    channel TEXT NOT NULL,
+                    thread_ts TEXT NOT NULL,
+                    ts TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (channel, thread_ts, ts)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS attendance (
+                    channel TEXT NOT NULL,
+                    thread_ts TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (channel, thread_ts, name)
+                )
+            """)
+
+    def get_thread(self, channel: str, thread_ts: str) -> Optional[Dict]:
+        """
+        스레드 처리 상태 조회
+
+        Args:
+            channel (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+
+        Returns:
+            Optional[Dict]: {'high_water_mark', 'column', 'updated_at'}, 처리한 적 없으면 None
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT high_water_mark, column_letter, updated_at FROM threads WHERE channel = ? AND thread_ts = ?",
+                (channel, thread_ts)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {'high_water_mark': row[0], 'column': row[1], 'updated_at': row[2]}
+
+    def get_high_water_mark(self, channel: str, thread_ts: str) -> Optional[str]:
+        """
+        이미 처리한 마지막 댓글 ts
+
+        Args:
+            channel (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+
+        Returns:
+            Optional[str]: 마지막 댓글 ts, 처리한 적 없으면 None
+        """
+        thread = self.get_thread(channel, thread_ts)
+        return thread['high_water_mark'] if thread else None
+
+    def get_replies(self, channel: str, thread_ts: str) -> List[Dict]:
+        """
+        저장된 댓글 목록 (작성 순서)
+
+        Args:
+            channel (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+
+        Returns:
+            List[Dict]: 댓글 + 사용자 정보 리스트
+        """
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM replies WHERE channel = ? AND thread_ts = ? ORDER BY CAST(ts AS REAL)",
+                (channel, thread_ts)
+            ).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def count_replies(self, channel: str, thread_ts: str) -> int:
+        """저장된 댓글 수"""
+        with self._lock, self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM replies WHERE channel = ? AND thread_ts = ?",
+                (channel, thread_ts)
+            ).fetchone()[0]
+
+    def get_attendance(self, channel: str, thread_ts: str) -> List[Dict]:
+        """
+        이미 출석 처리한 학생 목록
+
+        Args:
+            channel (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+
+        Returns:
+            List[Dict]: 출석 정보 리스트 (AttendanceParser 결과 형식)
+        """
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM attendance WHERE channel = ? AND thread_ts = ?",
+                (channel, thread_ts)
+            ).fetchall()
+
+        attendance = [json.loads(row[0]) for row in rows]
+        return sorted(attendance, key=lambda a: float(a.get('timestamp') or 0))
+
+    def commit(self, channel: str, thread_ts: str, replies: Iterable[Dict],
+               attendance: Iterable[Dict], column: Optional[str] = None):
+        """
+        새로 처리한 댓글과 출석 정보를 저장하고 high-water mark 갱신
+
+        시트 기록(저널 기록)이 끝난 뒤에 호출해야, 중간에 실패했을 때 다음 실행에서 다시 처리됩니다.
+
+        Args:
+            channel (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+            replies (Iterable[Dict]): 새로 처리한 댓글 리스트
+            attendance (Iterable[Dict]): 새로 출석 처리한 학생 리스트
+            column (Optional[str]): 출석을 기록한 열
+        """
+        replies = [r for r in replies if r.get('timestamp')]
+        attendance = list(attendance)
+
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT high_water_mark, column_letter FROM threads WHERE channel = ? AND thread_ts = ?",
+                (channel, thread_ts)
+            ).fetchone()
+
+            marks = [r['timestamp'] for r in replies]
+            if row and row[0]:
+                marks.append(row[0])
+            high_water_mark = max(marks, key=float) if marks else None
+
+            conn.execute("""
+                INSERT OR REPLACE INTO threads (channel, thread_ts, high_water_mark, column_letter, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (channel, thread_ts, high_water_mark, column or (row[1] if row else None), time.time()))
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO replies (channel, thread_ts, ts, data) VALUES (?, ?, ?, ?)",
+                [(channel, thread_ts, r['timestamp'], json.dumps(r, ensure_ascii=False)) for r in replies]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO attendance (channel, thread_ts, name, data) VALUES (?, ?, ?, ?)",
+                [(channel, thread_ts, a['name'], json.dumps(a, ensure_ascii=False)) for a in attendance]
+            )
+
+    def reset(self, channel: str, thread_ts: str):
+        """
+        스레드 처리 기록 삭제 (다음 실행에서 전체 댓글을 다시 처리)
+
+        Args:
+            channel (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+        """
+        with self._lock, self._connect() as conn:
+            for table in ('threads', 'replies', 'attendance'):
+                conn.execute(f"DELETE FROM {table} WHERE channel = ? AND thread_ts = ?", (channel, thread_ts))
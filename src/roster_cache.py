@@ -0,0 +1,166 @@
+"""
+학생 명단 캐시 모듈
+스프레드시트 학생 명단을 메모리와 디스크에 캐시합니다.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class RosterCache:
+    """학생 명단 캐시 (메모리 + 디스크)"""
+
+    # 기본 유효 시간 (초)
+    DEFAULT_TTL = 6 * 60 * 60
+
+    # 프로세스 전체에서 공유하는 메모리 캐시 {(캐시 파일, 키): 항목}
+    _memory: Dict[tuple, Dict] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, cache_file: Path, ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            cache_file (Path): 디스크 캐시 파일 경로 (워크스페이스별)
+            ttl (float): 캐시 유효 시간 (초)
+        """
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(spreadsheet_id: str, sheet_name: str, name_column: int, start_row: int) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            spreadsheet_id (str): 스프레드시트 ID
+            sheet_name (str): 시트 이름
+            name_column (int): 이름 열 인덱스 (0-based)
+            start_row (int): 시작 행 인덱스 (0-based)
+
+        Returns:
+            str: 캐시 키
+        """
+        return f"{spreadsheet_id}|{sheet_name}|{name_column}|{start_row}"
+
+    def _load_file(self) -> Dict:
+        """디스크 캐시 파일 로드"""
+        if not self.cache_file.exists():
+            return {}
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 명단 캐시 파일 읽기 실패 (무시): {e}")
+            return {}
+
+    def _save_file(self, data: Dict):
+        """디스크 캐시 파일 저장"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"⚠️ 명단 캐시 파일 저장 실패 (무시): {e}")
+
+    def _get_entry(self, key: str) -> Optional[Dict]:
+        """메모리 -> 디스크 순서로 캐시 항목 조회"""
+        memory_key = (str(self.cache_file), key)
+
+        with self._lock:
+            entry = self._memory.get(memory_key)
+
+            if entry is None:
+                entry = self._load_file().get(key)
+                if entry is not None:
+                    self._memory[memory_key] = entry
+
+            return entry
+
+    def get(self, key: str, revision: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """
+        유효한 캐시 명단 반환
+
+        revision이 주어지면 저장된 revision과 같아야 하고,
+        항상 TTL 안에 저장된 항목이어야 유효합니다.
+
+        Args:
+            key (str): 캐시 키
+            revision (Optional[str]): 현재 스프레드시트 revision (modifiedTime), 모르면 None
+
+        Returns:
+            Optional[Dict[str, int]]: {학생이름: 행번호}, 없거나 만료되면 None
+        """
+        entry = self._get_entry(key)
+
+        if not entry:
+            return None
+
+        if time.time() - entry.get('cached_at', 0) > self.ttl:
+            return None
+
+        if revision is not None and entry.get('revision') != revision:
+            return None
+
+        return entry['students']
+
+    def put(self, key: str, students: Dict[str, int], revision: Optional[str] = None):
+        """
+        명단 저장
+
+        Args:
+            key (str): 캐시 키
+            students (Dict[str, int]): {학생이름: 행번호}
+            revision (Optional[str]): 명단을 읽은 시점의 revision
+        """
+        entry = {
+            'students': students,
+            'revision': revision,
+            'cached_at': time.time(),
+        }
+
+        with self._lock:
+            self._memory[(str(self.cache_file), key)] = entry
+            data = self._load_file()
+            data[key] = entry
+            self._save_file(data)
+
+    def update_revision(self, key: str, revision: Optional[str]):
+        """
+        명단은 그대로 두고 revision만 갱신 (출석 열 기록 후 호출)
+
+        Args:
+            key (str): 캐시 키
+            revision (Optional[str]): 새 revision
+        """
+        with self._lock:
+            entry = self._memory.get((str(self.cache_file), key))
+            if entry is None:
+                return
+
+            entry['revision'] = revision
+            data = self._load_file()
+            if key in data:
+                data[key]['revision'] = revision
+                self._save_file(data)
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        캐시 무효화
+
+        Args:
+            key (Optional[str]): 무효화할 키 (None이면 이 파일의 모든 항목)
+        """
+        with self._lock:
+            for memory_key in list(self._memory):
+                if memory_key[0] == str(self.cache_file) and (key is None or memory_key[1] == key):
+                    del self._memory[memory_key]
+
+            if key is None:
+                self._save_file({})
+            else:
+                data = self._load_file()
+                if data.pop(key, None) is not None:
+                    self._save_file(data)
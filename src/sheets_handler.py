@@ -2,13 +2,17 @@
 Google Sheets API 처리 모듈
 스프레드시트에서 학생 명단을 읽고 출석 체크를 업데이트합니다.
 """
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from typing import List, Dict, Optional
 from enum import Enum
+import threading
 import time
 
+from src.rate_limiter import SheetsRequestGovernor, default_governor
+from src.roster_cache import RosterCache
+from src.sheets_service_pool import default_pool
+from src.utils import column_index_to_letter
+
 
 class AttendanceStatus(Enum):
     """출석 상태"""
@@ -17,13 +21,91 @@ class AttendanceStatus(Enum):
     LATE = "△"         # 지각
 
 
+class SheetSnapshot:
+    """values().batchGet 한 번으로 읽은 시트 열 스냅샷"""
+
+    def __init__(self, name_column: int, start_row: int, columns: Dict[int, List[str]]):
+        """
+        Args:
+            name_column (int): 이름 열 인덱스 (0-based)
+            start_row (int): 스냅샷 시작 행 인덱스 (0-based)
+            columns (Dict[int, List[str]]): {열 인덱스: start_row부터의 셀 값 리스트} (이름 열 포함)
+        """
+        self.name_column = name_column
+        self.start_row = start_row
+        self.columns = columns
+
+        # {학생이름: 행번호} 매핑 (출석 열과 같은 요청에서 읽은 이름 열 기준)
+        self.students = SheetsHandler._build_student_dict(
+            [[value] for value in columns.get(name_column, [])],
+            start_row
+        )
+
+    def get_value(self, row_number: int, column: int) -> str:
+        """
+        특정 셀 값 반환
+
+        Args:
+            row_number (int): 행 번호 (0-based)
+            column (int): 열 인덱스 (0-based)
+
+        Returns:
+            str: 셀 값 (비어 있거나 읽지 않은 열이면 빈 문자열)
+        """
+        values = self.columns.get(column, [])
+        index = row_number - self.start_row
+
+        if 0 <= index < len(values):
+            return values[index]
+
+        return ''
+
+    def column_values(self, column: int) -> Dict[int, str]:
+        """
+        한 열의 값을 {행번호: 셀 값} 형태로 반환
+
+        Args:
+            column (int): 열 인덱스 (0-based)
+
+        Returns:
+            Dict[int, str]: {행번호: 셀 값}
+        """
+        return {
+            self.start_row + i: value
+            for i, value in enumerate(self.columns.get(column, []))
+        }
+
+
 class SheetsHandler:
     """Google Sheets API를 처리하는 클래스"""
 
     # Google Sheets API 스코프
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
-    def __init__(self, credentials_path: str, spreadsheet_id: str, sheet_name: str = '출석현황'):
+    # 명단 캐시 revision 확인용 (Drive API modifiedTime)
+    DRIVE_METADATA_SCOPE = 'https://www.googleapis.com/auth/drive.metadata.readonly'
+
+    # values().batchUpdate 요청 1회에 담을 최대 셀 수
+    BATCH_CHUNK_SIZE = 500
+
+    # 출석 상태별 배경색 (apply_formatting 사용 시)
+    STATUS_COLORS = {
+        AttendanceStatus.PRESENT.value: {'red': 0.85, 'green': 0.94, 'blue': 0.83},  # 연한 초록
+        AttendanceStatus.ABSENT.value: {'red': 0.96, 'green': 0.80, 'blue': 0.80},   # 연한 빨강
+        AttendanceStatus.LATE.value: {'red': 1.0, 'green': 0.95, 'blue': 0.80},      # 연한 노랑
+    }
+    DEFAULT_COLOR = {'red': 1.0, 'green': 1.0, 'blue': 1.0}
+
+    # 시트 탭 목록 캐시 유효 시간 (초)
+    SHEET_TABS_TTL = 6 * 60 * 60
+
+    # 프로세스 전체에서 공유하는 시트 탭 목록 캐시 {spreadsheet_id: {'title', 'sheets', 'cached_at'}}
+    _sheet_tabs: Dict[str, Dict] = {}
+    _sheet_tabs_lock = threading.Lock()
+
+    def __init__(self, credentials_path: str, spreadsheet_id: str, sheet_name: str = '출석현황',
+                 service=None, roster_cache: Optional[RosterCache] = None, revision_check: bool = False,
+                 governor: Optional[SheetsRequestGovernor] = None, apply_formatting: bool = False):
         """
         SheetsHandler 초기화
 
@@ -31,25 +113,46 @@ class SheetsHandler:
             credentials_path (str): 서비스 계정 JSON 키 파일 경로
             spreadsheet_id (str): 스프레드시트 ID
             sheet_name (str): 시트 이름
+            service: 미리 만든 Sheets 서비스 객체 (지정하면 connect()가 새로 만들지 않음)
+            roster_cache (Optional[RosterCache]): 학생 명단 캐시
+            revision_check (bool): Drive API modifiedTime으로 명단 캐시를 검증할지 여부
+                (False면 캐시 TTL만 사용)
+            governor (Optional[SheetsRequestGovernor]): 요청 조절기 (기본값: 프로세스 공용 조절기)
+            apply_formatting (bool): 값과 함께 출석 상태별 배경색을 기록할지 여부 (기본값: False)
         """
         self.credentials_path = credentials_path
         self.spreadsheet_id = spreadsheet_id
         self.sheet_name = sheet_name
-        self.service = None
+        self.service = service
+        self.drive_service = None
+        self.roster_cache = roster_cache
+        self.revision_check = revision_check
+        self.governor = governor or default_governor
+        self.apply_formatting = apply_formatting
+        self.last_update_results = []  # 마지막 batch_update_attendance의 셀별 결과
+        self._roster_key = None  # 마지막으로 읽은 명단의 캐시 키
 
     def connect(self) -> bool:
         """
         Google Sheets API 연결
 
+        서비스 객체는 프로세스 전체 풀에서 가져오므로, 같은 인증 파일로 두 번째
+        연결부터는 키 파일 파싱, Discovery 문서 로드, 토큰 발급을 다시 하지 않습니다.
+
         Returns:
             bool: 연결 성공 여부
         """
+        if self.service:
+            return True
+
         try:
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path,
-                scopes=self.SCOPES
-            )
-            self.service = build('sheets', 'v4', credentials=credentials)
+            scopes = list(self.SCOPES)
+            if self.revision_check:
+                scopes.append(self.DRIVE_METADATA_SCOPE)
+
+            self.service = default_pool.get_service(self.credentials_path, scopes, 'sheets', 'v4')
+            if self.revision_check:
+                self.drive_service = default_pool.get_service(self.credentials_path, scopes, 'drive', 'v3')
             print("✓ Google Sheets API 연결 성공!")
             return True
         except FileNotFoundError:
@@ -59,9 +162,29 @@ class SheetsHandler:
             print(f"✗ Google Sheets API 연결 실패: {e}")
             return False
 
-    def test_connection(self) -> bool:
+    def _execute(self, request, kind: str = 'read') -> Dict:
+        """
+        요청 조절기를 거쳐 Sheets API 요청 실행 (할당량 대기 + 429/5xx 재시도)
+
+        Args:
+            request: googleapiclient 요청 객체
+            kind (str): 'read' 또는 'write'
+
+        Returns:
+            Dict: API 응답
+        """
+        return self.governor.execute(request, kind, self.credentials_path)
+
+    def test_connection(self, force: bool = False) -> bool:
         """
-        연결 테스트 및 스프레드시트 정보 가져오기
+        연결 테스트 및 대상 시트 존재 여부 확인
+
+        시트 탭 목록은 스프레드시트별로 SHEET_TABS_TTL 동안 캐시되며,
+        캐시가 유효하면 API를 호출하지 않습니다.
+        조회 시 sheets.properties만 요청하도록 필드 마스크를 사용합니다.
+
+        Args:
+            force (bool): 캐시를 무시하고 다시 조회할지 여부
 
         Returns:
             bool: 연결 성공 여부
@@ -69,36 +192,91 @@ class SheetsHandler:
         if not self.service:
             return False
 
-        try:
-            # 스프레드시트 메타데이터 가져오기
-            sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
-
-            title = sheet_metadata.get('properties', {}).get('title', 'Unknown')
-            print(f"✓ 스프레드시트 접근 성공!")
-            print(f"  - 제목: {title}")
-            print(f"  - ID: {self.spreadsheet_id}")
-
-            # 시트 목록 확인
-            sheets = sheet_metadata.get('sheets', [])
-            sheet_names = [s['properties']['title'] for s in sheets]
-            print(f"  - 시트 목록: {', '.join(sheet_names)}")
-
-            if self.sheet_name not in sheet_names:
-                print(f"⚠ 경고: '{self.sheet_name}' 시트를 찾을 수 없습니다.")
+        tabs = None if force else self._get_cached_sheet_tabs()
+
+        if tabs is None:
+            try:
+                # 제목과 시트 탭 속성만 요청 (필드 마스크)
+                sheet_metadata = self._execute(self.service.spreadsheets().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    fields='properties.title,sheets.properties(sheetId,title)'
+                ), 'read')
+
+                tabs = {
+                    'title': sheet_metadata.get('properties', {}).get('title', 'Unknown'),
+                    'sheets': {
+                        s['properties']['title']: s['properties'].get('sheetId')
+                        for s in sheet_metadata.get('sheets', [])
+                    },
+                    'cached_at': time.time(),
+                }
+
+                with self._sheet_tabs_lock:
+                    self._sheet_tabs[self.spreadsheet_id] = tabs
+
+                print(f"✓ 스프레드시트 접근 성공!")
+                print(f"  - 제목: {tabs['title']}")
+                print(f"  - ID: {self.spreadsheet_id}")
+                print(f"  - 시트 목록: {', '.join(tabs['sheets'])}")
+
+            except HttpError as e:
+                print(f"✗ 스프레드시트 접근 실패: {e}")
+                print("  - 서비스 계정에 스프레드시트 공유 권한이 있는지 확인하세요.")
+                return False
+            except Exception as e:
+                print(f"✗ 연결 테스트 실패: {e}")
                 return False
 
-            return True
-
-        except HttpError as e:
-            print(f"✗ 스프레드시트 접근 실패: {e}")
-            print("  - 서비스 계정에 스프레드시트 공유 권한이 있는지 확인하세요.")
-            return False
-        except Exception as e:
-            print(f"✗ 연결 테스트 실패: {e}")
+        if self.sheet_name not in tabs['sheets']:
+            print(f"⚠ 경고: '{self.sheet_name}' 시트를 찾을 수 없습니다.")
+            self._invalidate_sheet_tabs()
             return False
 
+        return True
+
+    def _get_cached_sheet_tabs(self) -> Optional[Dict]:
+        """유효한 시트 탭 목록 캐시 반환 (없거나 만료되면 None)"""
+        with self._sheet_tabs_lock:
+            tabs = self._sheet_tabs.get(self.spreadsheet_id)
+
+        if tabs and time.time() - tabs['cached_at'] <= self.SHEET_TABS_TTL:
+            return tabs
+
+        return None
+
+    def _invalidate_sheet_tabs(self):
+        """이 스프레드시트의 시트 탭 목록 캐시 제거"""
+        with self._sheet_tabs_lock:
+            self._sheet_tabs.pop(self.spreadsheet_id, None)
+
+    def get_sheet_id(self) -> Optional[int]:
+        """
+        대상 시트의 sheetId 반환 (캐시 사용)
+
+        Returns:
+            Optional[int]: sheetId, 시트를 찾을 수 없으면 None
+        """
+        if not self.test_connection():
+            return None
+
+        return self._get_cached_sheet_tabs()['sheets'].get(self.sheet_name)
+
+    def _handle_range_error(self, error: HttpError):
+        """
+        범위 오류(시트 이름 변경/삭제 등)로 요청이 실패하면 캐시를 버리고 다시 검증
+
+        값 요청은 시트 이름이 맞지 않으면 'Unable to parse range', 서식 요청(updateCells)은
+        캐시된 시트 ID가 없어졌으면 'No grid with id'로 실패합니다.
+
+        Args:
+            error (HttpError): 발생한 오류
+        """
+        message = str(error)
+        if error.resp.status == 400 and ('Unable to parse range' in message or 'No grid with id' in message):
+            print("  - 범위 오류: 시트 목록을 다시 확인합니다.")
+            self._invalidate_sheet_tabs()
+            self.test_connection(force=True)
+
     def get_student_list(self, name_column: int, start_row: int) -> Dict[str, int]:
         """
         스프레드시트에서 학생 명단 읽기
@@ -114,19 +292,23 @@ class SheetsHandler:
             print("✗ API가 연결되지 않았습니다. connect()를 먼저 호출하세요.")
             return {}
 
+        cached_students, revision = self._get_cached_roster(name_column, start_row)
+        if cached_students is not None:
+            return cached_students
+
         try:
             # A1 notation으로 변환
-            col_letter = chr(65 + name_column)  # 0 -> A, 1 -> B, ...
+            col_letter = column_index_to_letter(name_column)
             start_row_num = start_row + 1  # 0-based -> 1-based
             range_name = f"{self.sheet_name}!{col_letter}{start_row_num}:{col_letter}"
 
             print(f"\n[Google Sheets] 학생 명단 읽기 중...")
             print(f"  - 범위: {range_name}")
 
-            result = self.service.spreadsheets().values().get(
+            result = self._execute(self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name
-            ).execute()
+            ), 'read')
 
             values = result.get('values', [])
 
@@ -134,14 +316,8 @@ class SheetsHandler:
                 print("✗ 학생 명단이 비어있습니다.")
                 return {}
 
-            # {이름: 행번호} 매핑
-            student_dict = {}
-            for i, row in enumerate(values):
-                if row and row[0]:  # 빈 셀이 아닌 경우
-                    name = row[0].strip()
-                    if name:
-                        row_number = start_row + i  # 0-based 행 번호
-                        student_dict[name] = row_number
+            student_dict = self._build_student_dict(values, start_row)
+            self._put_cached_roster(name_column, start_row, student_dict, revision)
 
             print(f"✓ 학생 명단 읽기 완료: {len(student_dict)}명")
 
@@ -154,6 +330,204 @@ class SheetsHandler:
             print(f"✗ 오류 발생: {e}")
             return {}
 
+    def get_revision(self) -> Optional[str]:
+        """
+        스프레드시트 revision (Drive API modifiedTime) 가져오기
+
+        Returns:
+            Optional[str]: modifiedTime, 확인할 수 없으면 None (캐시 TTL로 대체)
+        """
+        if not self.revision_check or not self.drive_service:
+            return None
+
+        try:
+            result = self._execute(self.drive_service.files().get(
+                fileId=self.spreadsheet_id,
+                fields='modifiedTime'
+            ), 'read')
+            return result.get('modifiedTime')
+        except Exception as e:
+            print(f"⚠️ 스프레드시트 revision 확인 실패 (캐시 TTL 사용): {e}")
+            self.revision_check = False
+            return None
+
+    def _get_cached_roster(self, name_column: int, start_row: int):
+        """
+        캐시된 학생 명단 조회
+
+        Returns:
+            Tuple[Optional[Dict[str, int]], Optional[str]]: (캐시 명단 또는 None, 현재 revision)
+        """
+        self._roster_key = RosterCache.make_key(self.spreadsheet_id, self.sheet_name, name_column, start_row)
+
+        if not self.roster_cache:
+            return None, None
+
+        revision = self.get_revision()
+        students = self.roster_cache.get(self._roster_key, revision)
+
+        if students is not None:
+            print(f"✓ 학생 명단 캐시 사용: {len(students)}명")
+
+        return students, revision
+
+    def _put_cached_roster(self, name_column: int, start_row: int, students: Dict[str, int], revision: Optional[str]):
+        """읽어온 학생 명단을 캐시에 저장"""
+        if self.roster_cache and students:
+            key = RosterCache.make_key(self.spreadsheet_id, self.sheet_name, name_column, start_row)
+            self.roster_cache.put(key, students, revision)
+
+    def refresh_roster(self, name_column: int, start_row: int) -> Dict[str, int]:
+        """
+        명단 캐시를 비우고 스프레드시트에서 다시 읽기
+
+        Args:
+            name_column (int): 이름 열 인덱스 (0-based)
+            start_row (int): 시작 행 인덱스 (0-based)
+
+        Returns:
+            Dict[str, int]: {학생이름: 행번호} 매핑 딕셔너리
+        """
+        if self.roster_cache:
+            key = RosterCache.make_key(self.spreadsheet_id, self.sheet_name, name_column, start_row)
+            self.roster_cache.invalidate(key)
+
+        return self.get_student_list(name_column, start_row)
+
+    @staticmethod
+    def _build_student_dict(values: List[List[str]], start_row: int) -> Dict[str, int]:
+        """
+        이름 열 값 목록을 {학생이름: 행번호} 매핑으로 변환
+
+        Args:
+            values (List[List[str]]): API가 반환한 이름 열 값
+            start_row (int): 시작 행 인덱스 (0-based)
+
+        Returns:
+            Dict[str, int]: {학생이름: 행번호} 매핑 딕셔너리
+        """
+        student_dict = {}
+        for i, row in enumerate(values):
+            if row and row[0]:  # 빈 셀이 아닌 경우
+                name = row[0].strip()
+                if name:
+                    row_number = start_row + i  # 0-based 행 번호
+                    student_dict[name] = row_number
+
+        return student_dict
+
+    def get_sheet_snapshot(self, name_column: int, start_row: int, columns: Optional[List[int]] = None) -> Optional['SheetSnapshot']:
+        """
+        학생 명단과 출석 열 등 여러 열을 한 번의 요청으로 읽기 (values().batchGet)
+
+        매칭 단계(학생 명단)와 차등 기록 단계(현재 셀 값)가 같은 스냅샷을 사용합니다.
+        이름 열은 캐시가 있어도 항상 같은 요청에서 읽으므로(추가 왕복 없음), 명단 순서가 바뀌거나
+        행이 추가되어도 출석이 다른 학생의 행에 기록되지 않습니다. TTL만 쓰는 명단 캐시는 읽은 명단으로 갱신합니다.
+        시트 이름이 잘못된 경우에도 이 요청이 실패하므로 별도의 연결 테스트가 필요 없습니다.
+
+        Args:
+            name_column (int): 이름 열 인덱스 (0-based)
+            start_row (int): 시작 행 인덱스 (0-based)
+            columns (Optional[List[int]]): 함께 읽을 열 인덱스 리스트 (출석 열, 추가 열)
+
+        Returns:
+            Optional[SheetSnapshot]: 시트 스냅샷, 실패 시 None
+        """
+        if not self.service:
+            print("✗ API가 연결되지 않았습니다. connect()를 먼저 호출하세요.")
+            return None
+
+        # 이름 열을 맨 앞에 두고 중복 제거
+        read_columns = [name_column] + [c for c in dict.fromkeys(columns or []) if c != name_column]
+
+        try:
+            start_row_num = start_row + 1  # 0-based -> 1-based
+            ranges = []
+            for column in read_columns:
+                col_letter = column_index_to_letter(column)
+                ranges.append(f"{self.sheet_name}!{col_letter}{start_row_num}:{col_letter}")
+
+            print(f"\n[Google Sheets] 시트 스냅샷 읽기 중...")
+            print(f"  - 범위: {', '.join(ranges)}")
+
+            result = self._execute(self.service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=ranges
+            ), 'read')
+
+            value_ranges = result.get('valueRanges', [])
+            column_values = {}
+            for i, column in enumerate(read_columns):
+                values = value_ranges[i].get('values', []) if i < len(value_ranges) else []
+                column_values[column] = [row[0] if row else '' for row in values]
+
+            snapshot = SheetSnapshot(name_column, start_row, column_values)
+
+            # TTL만 쓰는 캐시는 방금 읽은 명단으로 갱신. revision 확인을 쓰면 명단이 바뀐 경우
+            # revision도 바뀌어 다음 조회에서 다시 읽으므로 캐시를 건드리지 않음 (Drive 호출 없음)
+            if self.roster_cache and not self.revision_check:
+                self._put_cached_roster(name_column, start_row, snapshot.students, None)
+
+            if not snapshot.students:
+                print("✗ 학생 명단이 비어있습니다.")
+            else:
+                print(f"✓ 학생 명단 읽기 완료: {len(snapshot.students)}명")
+
+            return snapshot
+
+        except HttpError as e:
+            print(f"✗ 시트 스냅샷 읽기 실패: {e}")
+            print(f"  - '{self.sheet_name}' 시트가 있는지, 서비스 계정에 공유 권한이 있는지 확인하세요.")
+            self._handle_range_error(e)
+            return None
+        except Exception as e:
+            print(f"✗ 오류 발생: {e}")
+            return None
+
+    def diff_attendance_updates(self, updates: List[Dict], current_values: Dict[int, str]) -> List[Dict]:
+        """
+        현재 셀 값과 비교하여 값이 바뀌는 업데이트만 남기기 (차등 기록)
+
+        Args:
+            updates (List[Dict]): 업데이트 정보 리스트
+            current_values (Dict[int, str]): {행번호: 현재 셀 값}
+
+        Returns:
+            List[Dict]: 실제로 값이 바뀌는 업데이트 리스트
+        """
+        changed = []
+
+        for update in updates:
+            status = self._status_value(update.get('status', AttendanceStatus.PRESENT))
+            current = (current_values.get(update.get('row')) or '').strip()
+
+            if current != status:
+                changed.append(update)
+
+        print(f"\n[Google Sheets] 변경 셀: {len(changed)}개 / 전체 {len(updates)}개")
+
+        return changed
+
+    def _cell_range(self, row_number: int, column: int) -> str:
+        """
+        0-based 행/열 인덱스를 A1 notation 셀 범위로 변환
+
+        Args:
+            row_number (int): 행 번호 (0-based)
+            column (int): 열 인덱스 (0-based)
+
+        Returns:
+            str: 셀 범위 (예: 출석현황!K5)
+        """
+        col_letter = column_index_to_letter(column)
+        row_num = row_number + 1  # 0-based -> 1-based
+        return f"{self.sheet_name}!{col_letter}{row_num}"
+
+    @staticmethod
+    def _status_value(status) -> str:
+        """출석 상태를 셀에 기록할 문자(O, X, △)로 변환"""
+        return status.value if isinstance(status, AttendanceStatus) else status
+
     def update_attendance(self, row_number: int, column: int, status: AttendanceStatus = AttendanceStatus.PRESENT) -> bool:
         """
         특정 셀의 출석 체크 업데이트
@@ -169,30 +543,113 @@ class SheetsHandler:
         if not self.service:
             return False
 
-        try:
-            # A1 notation으로 변환
-            col_letter = chr(65 + column)  # 0 -> A, 1 -> B, ...
-            row_num = row_number + 1  # 0-based -> 1-based
-            cell_range = f"{self.sheet_name}!{col_letter}{row_num}"
-
-            # 출석 상태 문자 (O, X, △)
-            status_value = status.value if isinstance(status, AttendanceStatus) else status
+        cell_range = self._cell_range(row_number, column)
 
+        try:
             body = {
-                'values': [[status_value]]
+                'values': [[self._status_value(status)]]
             }
 
-            self.service.spreadsheets().values().update(
+            self._execute(self.service.spreadsheets().values().update(
                 spreadsheetId=self.spreadsheet_id,
                 range=cell_range,
                 valueInputOption='USER_ENTERED',
                 body=body
-            ).execute()
+            ), 'write')
 
             return True
 
         except HttpError as e:
             print(f"✗ 셀 업데이트 실패 ({cell_range}): {e}")
+            self._handle_range_error(e)
+            return False
+        except Exception as e:
+            print(f"✗ 오류 발생: {e}")
+            return False
+
+    def _send_value_batch(self, data: List[Dict]) -> bool:
+        """
+        values().batchUpdate로 여러 범위를 한 번의 요청으로 기록
+
+        Args:
+            data (List[Dict]): ValueRange 리스트
+                예: [{'range': '출석현황!K5', 'values': [['O']]}, ...]
+
+        Returns:
+            bool: 요청 성공 여부 (요청 단위로 전부 반영되거나 전부 실패)
+        """
+        try:
+            result = self._execute(self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={
+                    'valueInputOption': 'USER_ENTERED',
+                    'data': data
+                }
+            ), 'write')
+
+            print(f"  - 요청 1회로 {result.get('totalUpdatedCells', 0)}개 셀 기록")
+
+            return True
+
+        except HttpError as e:
+            print(f"✗ 일괄 업데이트 실패 ({len(data)}개 범위): {e}")
+            self._handle_range_error(e)
+            return False
+        except Exception as e:
+            print(f"✗ 오류 발생: {e}")
+            return False
+
+    def _send_formatted_batch(self, cells: List[Dict]) -> bool:
+        """
+        spreadsheets().batchUpdate 한 번으로 값과 배경색을 함께 기록
+
+        같은 열에서 연속된 행은 하나의 updateCells 요청으로 묶습니다.
+
+        Args:
+            cells (List[Dict]): 셀 리스트 ({'row', 'column', 'status'(O/X/△)})
+
+        Returns:
+            bool: 요청 성공 여부
+        """
+        sheet_id = self.get_sheet_id()
+        if sheet_id is None:
+            print(f"✗ 서식 업데이트 실패: '{self.sheet_name}' 시트 ID를 찾을 수 없습니다.")
+            return False
+
+        requests = []
+        for cell in sorted(cells, key=lambda c: (c['column'], c['row'])):
+            cell_data = {
+                'userEnteredValue': {'stringValue': cell['status']},
+                'userEnteredFormat': {'backgroundColor': self.STATUS_COLORS.get(cell['status'], self.DEFAULT_COLOR)},
+            }
+
+            previous = requests[-1]['updateCells'] if requests else None
+            if (previous and previous['start']['columnIndex'] == cell['column']
+                    and previous['start']['rowIndex'] + len(previous['rows']) == cell['row']):
+                previous['rows'].append({'values': [cell_data]})
+                continue
+
+            requests.append({
+                'updateCells': {
+                    'start': {'sheetId': sheet_id, 'rowIndex': cell['row'], 'columnIndex': cell['column']},
+                    'rows': [{'values': [cell_data]}],
+                    'fields': 'userEnteredValue,userEnteredFormat.backgroundColor',
+                }
+            })
+
+        try:
+            self._execute(self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={'requests': requests}
+            ), 'write')
+
+            print(f"  - 요청 1회로 {len(cells)}개 셀 기록 (값 + 서식)")
+
+            return True
+
+        except HttpError as e:
+            print(f"✗ 서식 포함 일괄 업데이트 실패 ({len(cells)}개 셀): {e}")
+            self._handle_range_error(e)
             return False
         except Exception as e:
             print(f"✗ 오류 발생: {e}")
@@ -202,6 +659,11 @@ class SheetsHandler:
         """
         여러 학생의 출석을 한번에 업데이트 (배치 처리)
 
+        모든 셀을 values().batchUpdate 요청으로 모아 보내며,
+        BATCH_CHUNK_SIZE개를 넘으면 여러 요청으로 나눕니다.
+        apply_formatting이 켜져 있으면 값과 배경색을 spreadsheets().batchUpdate로 함께 보냅니다.
+        셀별 결과는 last_update_results에 기록됩니다.
+
         Args:
             updates (List[Dict]): 업데이트 정보 리스트
                 예: [{'name': '김철수', 'row': 4, 'column': 10, 'status': AttendanceStatus.PRESENT}, ...]
@@ -209,36 +671,128 @@ class SheetsHandler:
         Returns:
             int: 성공한 업데이트 수
         """
+        self.last_update_results = []
+
         if not self.service or not updates:
             return 0
 
         print(f"\n[Google Sheets] 출석 체크 업데이트 중...")
 
-        success_count = 0
-
+        # 유효한 업데이트만 셀 범위로 변환
+        cells = []
         for update in updates:
-            name = update.get('name')
             row = update.get('row')
             column = update.get('column')
-            status = update.get('status', AttendanceStatus.PRESENT)
 
             if row is None or column is None:
                 continue
 
-            if self.update_attendance(row, column, status):
-                status_str = status.value if isinstance(status, AttendanceStatus) else status
-                print(f"  ✓ {name} - {status_str} 업데이트 완료")
-                success_count += 1
+            cells.append({
+                'name': update.get('name'),
+                'row': row,
+                'column': column,
+                'range': self._cell_range(row, column),
+                'status': self._status_value(update.get('status', AttendanceStatus.PRESENT)),
+            })
+
+        success_count = 0
+
+        for i in range(0, len(cells), self.BATCH_CHUNK_SIZE):
+            chunk = cells[i:i + self.BATCH_CHUNK_SIZE]
+
+            if self.apply_formatting:
+                success = self._send_formatted_batch(chunk)
             else:
-                print(f"  ✗ {name} - 업데이트 실패")
+                success = self._send_value_batch([
+                    {'range': cell['range'], 'values': [[cell['status']]]}
+                    for cell in chunk
+                ])
 
-            # API Rate Limiting 방지
-            time.sleep(0.1)
+            for cell in chunk:
+                self.last_update_results.append({**cell, 'success': success})
+
+                if success:
+                    print(f"  ✓ {cell['name']} - {cell['status']} 업데이트 완료")
+                    success_count += 1
+                else:
+                    print(f"  ✗ {cell['name']} - 업데이트 실패")
 
         print(f"\n✓ 출석 체크 완료: {success_count}/{len(updates)}명")
 
         return success_count
 
+    def update_attendance_column(self, updates: List[Dict], start_row: Optional[int] = None) -> int:
+        """
+        한 열의 출석을 하나의 연속 범위로 업데이트 (열 단위 기록)
+
+        start_row부터 마지막 학생 행까지 하나의 열 배열을 만들어
+        K5:K305 같은 단일 A1 범위로 전송합니다.
+        학생 사이의 빈 행은 None(null)으로 채워 기존 값이 유지됩니다.
+        업데이트가 여러 열에 걸쳐 있거나 apply_formatting이 켜져 있으면
+        batch_update_attendance로 처리합니다.
+
+        Args:
+            updates (List[Dict]): 업데이트 정보 리스트 (batch_update_attendance와 동일)
+            start_row (Optional[int]): 범위 시작 행 (0-based, 기본값: 가장 위 학생 행)
+
+        Returns:
+            int: 성공한 업데이트 수
+        """
+        self.last_update_results = []
+
+        if not self.service or not updates:
+            return 0
+
+        valid_updates = [u for u in updates if u.get('row') is not None and u.get('column') is not None]
+        columns = {u['column'] for u in valid_updates}
+
+        if len(columns) != 1 or self.apply_formatting:
+            return self.batch_update_attendance(updates)
+
+        column = columns.pop()
+        rows = [u['row'] for u in valid_updates]
+        first_row = min(rows) if start_row is None else min(start_row, min(rows))
+        last_row = max(rows)
+
+        # 열 배열 구성 (업데이트가 없는 행은 None -> 기존 값 유지)
+        column_values = [None] * (last_row - first_row + 1)
+        for update in valid_updates:
+            status = update.get('status', AttendanceStatus.PRESENT)
+            column_values[update['row'] - first_row] = self._status_value(status)
+
+        col_letter = column_index_to_letter(column)
+        range_name = f"{self.sheet_name}!{col_letter}{first_row + 1}:{col_letter}{last_row + 1}"
+
+        print(f"\n[Google Sheets] 출석 체크 업데이트 중 (열 단위)...")
+        print(f"  - 범위: {range_name}")
+
+        success = self._send_value_batch([{
+            'range': range_name,
+            'majorDimension': 'COLUMNS',
+            'values': [column_values]
+        }])
+
+        success_count = 0
+        for update in valid_updates:
+            status_str = self._status_value(update.get('status', AttendanceStatus.PRESENT))
+            self.last_update_results.append({
+                'name': update.get('name'),
+                'row': update['row'],
+                'column': column,
+                'range': self._cell_range(update['row'], column),
+                'status': status_str,
+                'success': success
+            })
+            if success:
+                success_count += 1
+
+        if success:
+            print(f"\n✓ 출석 체크 완료: {success_count}/{len(updates)}명")
+        else:
+            print(f"\n✗ 출석 체크 실패: 0/{len(updates)}명")
+
+        return success_count
+
 
 # 테스트 코드
 if __name__ == '__main__':
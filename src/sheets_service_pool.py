@@ -0,0 +1,122 @@
+"""
+Google API 서비스 풀 모듈
+인증 파일별로 Credentials와 서비스 객체를 만들어 프로세스 전체에서 재사용합니다.
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2 import service_account
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+
+
+class SheetsServicePool:
+    """Google API 서비스 객체 풀 (스레드 안전)"""
+
+    # 요청 타임아웃 (초)
+    HTTP_TIMEOUT = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credentials: Dict[tuple, Dict] = {}  # (인증 파일, 스코프) -> {'mtime', 'credentials'}
+        self._services: Dict[tuple, Dict] = {}     # (인증 파일, 스코프, API, 버전) -> {'mtime', 'service'}
+
+    def _get_credentials(self, credentials_path: str, scopes: tuple, mtime: float):
+        """
+        인증 파일별 Credentials 반환 (파일이 바뀌었을 때만 다시 읽음)
+
+        같은 Credentials 객체를 계속 사용하므로 액세스 토큰은 만료될 때까지 재사용되고,
+        만료되면 요청 시점에 자동으로 갱신됩니다.
+        """
+        key = (credentials_path, scopes)
+        entry = self._credentials.get(key)
+
+        if entry is None or entry['mtime'] != mtime:
+            credentials = service_account.Credentials.from_service_account_file(
+                credentials_path,
+                scopes=list(scopes)
+            )
+            entry = {'mtime': mtime, 'credentials': credentials}
+            self._credentials[key] = entry
+
+        return entry['credentials']
+
+    def _make_request_builder(self, credentials):
+        """
+        스레드마다 별도의 HTTP 연결을 쓰는 requestBuilder 생성
+
+        httplib2.Http는 스레드 안전하지 않으므로, 하나의 서비스 객체를 공유하면서
+        실제 요청은 스레드별 AuthorizedHttp로 보냅니다.
+        """
+        local = threading.local()
+
+        def request_builder(http, *args, **kwargs):
+            thread_http = getattr(local, 'http', None)
+
+            if thread_http is None:
+                thread_http = google_auth_httplib2.AuthorizedHttp(
+                    credentials,
+                    http=httplib2.Http(timeout=self.HTTP_TIMEOUT)
+                )
+                local.http = thread_http
+
+            return HttpRequest(thread_http, *args, **kwargs)
+
+        return request_builder
+
+    def get_service(self, credentials_path: str, scopes: List[str], api: str = 'sheets', version: str = 'v4'):
+        """
+        서비스 객체 반환 (없으면 생성)
+
+        Discovery 문서는 googleapiclient에 포함된 정적 사본을 사용하므로
+        네트워크 요청 없이 서비스를 만듭니다.
+
+        Args:
+            credentials_path (str): 서비스 계정 JSON 키 파일 경로
+            scopes (List[str]): OAuth 스코프
+            api (str): API 이름 (기본값: sheets)
+            version (str): API 버전 (기본값: v4)
+
+        Returns:
+            googleapiclient.discovery.Resource: 서비스 객체
+
+        Raises:
+            FileNotFoundError: 인증 파일이 없는 경우
+        """
+        credentials_path = str(Path(credentials_path).resolve())
+        scopes = tuple(sorted(scopes))
+        mtime = os.path.getmtime(credentials_path)
+        key = (credentials_path, scopes, api, version)
+
+        with self._lock:
+            entry = self._services.get(key)
+
+            if entry is not None and entry['mtime'] == mtime:
+                return entry['service']
+
+            credentials = self._get_credentials(credentials_path, scopes, mtime)
+            service = build(
+                api,
+                version,
+                http=google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=self.HTTP_TIMEOUT)),
+                requestBuilder=self._make_request_builder(credentials),
+                cache_discovery=False,
+                static_discovery=True
+            )
+
+            self._services[key] = {'mtime': mtime, 'service': service}
+            return service
+
+    def clear(self):
+        """모든 캐시된 Credentials와 서비스 객체 제거"""
+        with self._lock:
+            self._credentials.clear()
+            self._services.clear()
+
+
+# 프로세스 전체에서 공유하는 기본 풀
+default_pool = SheetsServicePool()
@@ -4,23 +4,83 @@ Slack API 처리 모듈
 """
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
-from typing import List, Dict, Optional
+from slack_sdk.http_retry.builtin_handlers import ConnectionErrorRetryHandler
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterable, Iterator, List, Dict, Optional
+import hashlib
+import random
+import threading
 import time
 import re
 
+from src.parser import compile_attendance_matcher
+from src.rate_limiter import SlackRateLimiter, default_slack_limiter
+from src.reply_store import ReplyStore
+from src.user_cache import UserProfileCache, get_default_user_cache
+
 
 class SlackHandler:
     """Slack API를 처리하는 클래스"""
 
-    def __init__(self, token: str):
+    # conversations.replies 페이지당 댓글 수 / 스레드당 최대 댓글 수
+    REPLIES_PAGE_SIZE = 200
+    MAX_REPLIES = 5000
+
+    # users.list 페이지당 사용자 수
+    DIRECTORY_PAGE_SIZE = 200
+
+    # 한 페이지에서 캐시에 없는 사용자가 이 수 이상이면 전체 사용자 목록을 미리 가져옴
+    DIRECTORY_PREFETCH_THRESHOLD = 5
+
+    # 출석 스레드 검색: 첫 페이지 크기 / 최대 페이지 크기 / 최대 검색 메시지 수
+    DISCOVERY_PAGE_SIZE = 20
+    DISCOVERY_MAX_PAGE_SIZE = 200
+    DISCOVERY_MAX_MESSAGES = 1000
+
+    # users.info 병렬 조회 작업자 수 (호출 속도는 SlackRateLimiter가 Tier 4 한도로 조절)
+    PROFILE_WORKERS = 8
+
+    # DM 일괄 전송: 동시 전송 수 / 수신자별 최대 시도 횟수 / 재시도 기본 대기 (초)
+    DM_WORKERS = 4
+    DM_MAX_ATTEMPTS = 3
+    DM_RETRY_BASE_SECONDS = 1.0
+
+    # 잠시 후 다시 보내면 성공할 수 있는 오류
+    TRANSIENT_ERRORS = ('ratelimited', 'internal_error', 'fatal_error', 'service_unavailable', 'request_timeout')
+
+    # 토큰별 팀 ID (auth.test는 토큰당 한 번만 호출)
+    _team_ids: Dict[str, str] = {}
+    _team_ids_lock = threading.Lock()
+
+    def __init__(self, token: str, use_directory: bool = True, user_cache: Optional[UserProfileCache] = None,
+                 rate_limiter: Optional[SlackRateLimiter] = None, reply_store: Optional[ReplyStore] = None,
+                 client: Optional[WebClient] = None):
         """
         SlackHandler 초기화
 
         Args:
             token (str): Slack Bot Token (xoxb-로 시작)
+            use_directory (bool): 사용자 정보를 users.list 일괄 조회로 가져올지 여부
+            user_cache (Optional[UserProfileCache]): 사용자 프로필 캐시 (기본값: 프로세스 공용 캐시)
+            rate_limiter (Optional[SlackRateLimiter]): 호출 제한기 (기본값: 프로세스 공용 제한기)
+            reply_store (Optional[ReplyStore]): 스레드별 처리한 댓글 저장소 (있으면 새 댓글만 가져올 수 있음)
+            client (Optional[WebClient]): 사용할 Web API 클라이언트 (테스트용 로컬 대체 클라이언트 등)
         """
-        self.client = WebClient(token=token)
-        self.user_cache = {}  # 사용자 정보 캐시
+        self.token = token
+        self.rate_limiter = rate_limiter or default_slack_limiter
+        self.client = client or WebClient(
+            token=token,
+            retry_handlers=[
+                ConnectionErrorRetryHandler(),
+                self.rate_limiter.make_retry_handler(token),  # 429 응답은 Retry-After만큼 기다린 뒤 재시도
+            ]
+        )
+        self.user_cache = user_cache or get_default_user_cache()  # 사용자 정보 캐시 (팀 ID + User ID)
+        self.reply_store = reply_store
+        self.last_reply_count = 0  # 마지막으로 수집한 댓글 수
+        self.use_directory = use_directory
+        self.directory_loaded = False  # users.list 일괄 조회 완료 여부
 
     @staticmethod
     def convert_mentions(message: str) -> str:
@@ -44,6 +104,29 @@ class SlackHandler:
 
         return message
 
+    def _call(self, method: str, **kwargs):
+        """
+        Slack Web API 호출 (토큰/메서드별, 채널 단위 메서드는 채널별 호출 한도 안에서)
+
+        Args:
+            method (str): API 메서드 이름 (예: 'conversations.replies')
+            **kwargs: API 인자
+
+        Returns:
+            SlackResponse: API 응답
+
+        Raises:
+            SlackApiError: API 오류 (429는 재시도 후에도 실패한 경우)
+        """
+        self.rate_limiter.acquire(self.token, method, channel=kwargs.get('channel'))
+
+        try:
+            return getattr(self.client, method.replace('.', '_'))(**kwargs)
+        except SlackApiError as e:
+            if e.response is not None and e.response.status_code == 429:
+                self.rate_limiter.stats_for(method).record_failure()
+            raise
+
     def test_connection(self) -> bool:
         """
         Slack API 연결 테스트
@@ -52,7 +135,11 @@ class SlackHandler:
             bool: 연결 성공 여부
         """
         try:
-            response = self.client.auth_test()
+            response = self._call('auth.test')
+
+            with self._team_ids_lock:
+                self._team_ids[self.token] = response['team_id']
+
             print(f"✓ Slack 연결 성공!")
             print(f"  - Bot 이름: {response['user']}")
             print(f"  - 팀: {response['team']}")
@@ -61,6 +148,84 @@ class SlackHandler:
             print(f"✗ Slack 연결 실패: {e.response['error']}")
             return False
 
+    def iter_thread_replies(self, channel_id: str, thread_ts: str, page_size: Optional[int] = None,
+                            max_replies: Optional[int] = None, oldest: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        스레드 댓글을 페이지 단위로 가져오기 (커서 페이지네이션)
+
+        response_metadata.next_cursor를 따라가며 페이지를 받을 때마다 바로 yield하므로,
+        호출하는 쪽은 다음 페이지를 받기 전에 이전 페이지를 처리할 수 있습니다.
+
+        Args:
+            channel_id (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+            page_size (Optional[int]): 페이지당 댓글 수 (기본값: REPLIES_PAGE_SIZE)
+            max_replies (Optional[int]): 최대 댓글 수 (기본값: MAX_REPLIES, 넘으면 중단)
+            oldest (Optional[str]): 이 ts보다 나중에 달린 댓글만 가져오기 (high-water mark)
+
+        Yields:
+            List[Dict]: 한 페이지의 댓글 리스트 (원본 메시지 제외)
+
+        Raises:
+            SlackApiError: 페이지를 가져오지 못한 경우 (일부 댓글만으로 출석을 기록하지 않도록 그대로 전달)
+        """
+        page_size = page_size or self.REPLIES_PAGE_SIZE
+        max_replies = max_replies or self.MAX_REPLIES
+
+        print(f"\n[Slack] 스레드 댓글 수집 중...")
+        print(f"  - Channel: {channel_id}")
+        print(f"  - Thread TS: {thread_ts}")
+        if oldest:
+            print(f"  - 새 댓글만 수집: {oldest} 이후")
+
+        self.last_reply_count = 0
+        window = {'oldest': oldest} if oldest else {}
+        cursor = None
+
+        try:
+            while True:
+                response = self._call(
+                    'conversations.replies',
+                    channel=channel_id,
+                    ts=thread_ts,
+                    limit=page_size,
+                    cursor=cursor,
+                    **window
+                )
+
+                if not response['ok']:
+                    raise SlackApiError("API 호출 실패", response)
+
+                # 원본 메시지(스레드 부모)와 이미 처리한 댓글은 제외
+                replies = [
+                    m for m in response['messages']
+                    if m.get('ts') != thread_ts and (not oldest or float(m.get('ts', 0)) > float(oldest))
+                ]
+
+                remaining = max_replies - self.last_reply_count
+                if len(replies) > remaining:
+                    replies = replies[:remaining]
+
+                self.last_reply_count += len(replies)
+
+                if replies:
+                    yield replies
+
+                cursor = (response.get('response_metadata') or {}).get('next_cursor')
+
+                if self.last_reply_count >= max_replies and cursor:
+                    print(f"⚠ 최대 댓글 수({max_replies}개)에 도달하여 수집을 중단합니다.")
+                    break
+
+                if not cursor:
+                    break
+
+            print(f"✓ 댓글 수집 완료: {self.last_reply_count}개")
+
+        except SlackApiError as e:
+            print(f"✗ 댓글 가져오기 실패: {e.response['error']} ({self.last_reply_count}개까지만 수집됨)")
+            raise
+
     def get_thread_replies(self, channel_id: str, thread_ts: str) -> List[Dict]:
         """
         특정 스레드의 모든 댓글 가져오기
@@ -70,34 +235,44 @@ class SlackHandler:
             thread_ts (str): 스레드 타임스탬프
 
         Returns:
-            List[Dict]: 댓글 리스트 (원본 메시지 제외)
+            List[Dict]: 댓글 리스트 (원본 메시지 제외), 중간에 실패하면 빈 리스트
         """
-        try:
-            print(f"\n[Slack] 스레드 댓글 수집 중...")
-            print(f"  - Channel: {channel_id}")
-            print(f"  - Thread TS: {thread_ts}")
+        replies = []
 
-            response = self.client.conversations_replies(
-                channel=channel_id,
-                ts=thread_ts,
-                limit=1000  # 최대 1000개
-            )
+        try:
+            for page in self.iter_thread_replies(channel_id, thread_ts):
+                replies.extend(page)
+        except SlackApiError:
+            return []
 
-            if not response['ok']:
-                raise SlackApiError("API 호출 실패", response)
+        return replies
 
-            messages = response['messages']
+    @property
+    def team_id(self) -> str:
+        """
+        토큰의 팀 ID (프로필 캐시 키, 확인할 수 없으면 토큰 해시)
 
-            # 첫 번째 메시지는 원본 메시지이므로 제외
-            replies = messages[1:] if len(messages) > 1 else []
+        토큰 해시는 이번 호출에만 쓰고 저장하지 않으므로, 다음 호출에서 auth.test를 다시 시도합니다.
 
-            print(f"✓ 댓글 수집 완료: {len(replies)}개")
+        Returns:
+            str: 팀 ID
+        """
+        with self._team_ids_lock:
+            team_id = self._team_ids.get(self.token)
 
-            return replies
+        if team_id:
+            return team_id
 
+        try:
+            team_id = self._call('auth.test')['team_id']
         except SlackApiError as e:
-            print(f"✗ 댓글 가져오기 실패: {e.response['error']}")
-            return []
+            print(f"⚠️ 팀 ID 확인 실패 (이번에는 토큰 해시 사용): {e.response['error']}")
+            return 'token-' + hashlib.sha256(self.token.encode()).hexdigest()[:16]
+
+        with self._team_ids_lock:
+            self._team_ids[self.token] = team_id
+
+        return team_id
 
     def get_user_info(self, user_id: str) -> Optional[Dict]:
         """
@@ -110,28 +285,20 @@ class SlackHandler:
             Optional[Dict]: 사용자 정보 (이름, 실명 등)
         """
         # 캐시에 있으면 반환
-        if user_id in self.user_cache:
-            return self.user_cache[user_id]
+        cached = self.user_cache.get(self.team_id, user_id)
+        if cached is not None:
+            return cached
 
         try:
-            response = self.client.users_info(user=user_id)
+            response = self._call('users.info', user=user_id)
 
             if not response['ok']:
                 return None
 
-            user = response['user']
-            user_info = {
-                'id': user_id,
-                'name': user.get('name', ''),
-                'real_name': user.get('real_name', ''),
-                'display_name': user.get('profile', {}).get('display_name', ''),
-            }
+            user_info = self._to_user_info(response['user'])
 
             # 캐시에 저장
-            self.user_cache[user_id] = user_info
-
-            # API Rate Limiting 방지
-            time.sleep(0.1)
+            self.user_cache.put(self.team_id, user_id, user_info)
 
             return user_info
 
@@ -139,6 +306,179 @@ class SlackHandler:
             print(f"✗ 사용자 정보 가져오기 실패 ({user_id}): {e.response['error']}")
             return None
 
+    @staticmethod
+    def _to_user_info(user: Dict) -> Dict:
+        """
+        Slack 사용자 객체를 사용자 정보 딕셔너리로 변환
+
+        Args:
+            user (Dict): users.info / users.list의 사용자 객체
+
+        Returns:
+            Dict: 사용자 정보 (id, name, real_name, display_name)
+        """
+        profile = user.get('profile', {})
+
+        return {
+            'id': user.get('id'),
+            'name': user.get('name', ''),
+            'real_name': user.get('real_name') or profile.get('real_name', ''),
+            'display_name': profile.get('display_name', ''),
+        }
+
+    def load_user_directory(self) -> int:
+        """
+        워크스페이스 전체 사용자 목록을 users.list 페이지 조회로 가져와 캐시에 저장
+
+        사용자마다 users.info를 호출하는 대신 몇 번의 호출로 id -> 프로필 인덱스를 만듭니다.
+
+        Returns:
+            int: 가져온 사용자 수
+        """
+        print(f"\n[Slack] 사용자 목록 일괄 조회 중...")
+
+        count = 0
+        cursor = None
+
+        try:
+            while True:
+                response = self._call('users.list', limit=self.DIRECTORY_PAGE_SIZE, cursor=cursor)
+
+                if not response['ok']:
+                    raise SlackApiError("API 호출 실패", response)
+
+                self.user_cache.put_many(self.team_id, {
+                    member['id']: self._to_user_info(member)
+                    for member in response['members']
+                })
+                count += len(response['members'])
+
+                cursor = (response.get('response_metadata') or {}).get('next_cursor')
+                if not cursor:
+                    break
+
+            self.directory_loaded = True
+            print(f"✓ 사용자 목록 조회 완료: {count}명")
+
+        except SlackApiError as e:
+            print(f"✗ 사용자 목록 조회 실패 (개별 조회로 대체): {e.response['error']}")
+            # 실패하면 다시 시도하지 않고 users.info 개별 조회 사용
+            self.use_directory = False
+
+        return count
+
+    def _prefetch_users(self, replies: List[Dict]):
+        """
+        한 페이지의 댓글 작성자 중 캐시에 없는 사용자가 많으면 사용자 목록을 일괄 조회
+
+        Args:
+            replies (List[Dict]): 슬랙 댓글 리스트
+        """
+        if not self.use_directory or self.directory_loaded:
+            return
+
+        user_ids = {r.get('user') for r in replies if r.get('user') and not r.get('bot_id')}
+        missing = user_ids - set(self.user_cache.get_many(self.team_id, user_ids))
+
+        if len(missing) >= self.DIRECTORY_PREFETCH_THRESHOLD:
+            self.load_user_directory()
+
+    def resolve_users(self, user_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 사용자 정보를 한꺼번에 조회 (캐시에 없는 사용자는 병렬로 users.info 호출)
+
+        동시 호출 수는 PROFILE_WORKERS로 제한되고, 호출 속도는 토큰별
+        users.info 한도(Tier 4) 안에서 조절됩니다.
+
+        Args:
+            user_ids (Iterable[str]): 사용자 ID 목록
+
+        Returns:
+            Dict[str, Dict]: {user_id: 사용자 정보} (조회에 실패한 사용자는 제외)
+        """
+        user_ids = [u for u in dict.fromkeys(user_ids) if u]
+        if not user_ids:
+            return {}
+
+        found = self.user_cache.get_many(self.team_id, user_ids)
+        missing = [u for u in user_ids if u not in found]
+
+        if missing:
+            workers = min(self.PROFILE_WORKERS, len(missing))
+            print(f"  - 사용자 정보 병렬 조회: {len(missing)}명 (동시 {workers}개)")
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for user_id, user_info in zip(missing, pool.map(self.get_user_info, missing)):
+                    if user_info:
+                        found[user_id] = user_info
+
+        return found
+
+    def _enrich_reply(self, reply: Dict, profiles: Dict[str, Dict]) -> Optional[Dict]:
+        """
+        댓글에 사용자 정보 추가 (Bot 메시지는 None)
+
+        Args:
+            reply (Dict): 슬랙 댓글 메시지
+            profiles (Dict[str, Dict]): resolve_users로 조회한 {user_id: 사용자 정보}
+
+        Returns:
+            Optional[Dict]: 댓글 + 사용자 정보
+        """
+        # Bot 메시지 제외
+        if reply.get('bot_id'):
+            return None
+
+        user_id = reply.get('user')
+        user_info = profiles.get(user_id) if user_id else None
+
+        return {
+            'user_id': user_id,
+            'user_info': user_info,
+            'text': reply.get('text', ''),
+            'timestamp': reply.get('ts', ''),
+        }
+
+    def iter_replies_with_user_info(self, channel_id: str, thread_ts: str, oldest: Optional[str] = None) -> Iterator[Dict]:
+        """
+        스레드 댓글과 사용자 정보를 페이지 단위로 받아 하나씩 yield
+
+        Args:
+            channel_id (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+            oldest (Optional[str]): 이 ts보다 나중에 달린 댓글만 (기본값: 전체)
+
+        Yields:
+            Dict: 댓글 + 사용자 정보
+        """
+        for page in self.iter_thread_replies(channel_id, thread_ts, oldest=oldest):
+            # 사용자 목록 일괄 조회 후, 목록에 없는 사용자만 users.info로 병렬 조회
+            self._prefetch_users(page)
+            profiles = self.resolve_users(r.get('user') for r in page if not r.get('bot_id'))
+
+            # 원래 댓글 순서대로 반환
+            for reply in page:
+                enriched = self._enrich_reply(reply, profiles)
+                if enriched:
+                    yield enriched
+
+    def iter_new_replies_with_user_info(self, channel_id: str, thread_ts: str) -> Iterator[Dict]:
+        """
+        지난 실행 이후 새로 달린 댓글만 사용자 정보와 함께 yield
+
+        reply_store에 저장된 high-water mark 이후의 댓글만 요청합니다.
+        처리가 끝나면 호출한 쪽에서 reply_store.commit()으로 새 댓글을 저장해야 합니다.
+
+        Args:
+            channel_id (str): 채널 ID
+            thread_ts (str): 스레드 타임스탬프
+
+        Yields:
+            Dict: 댓글 + 사용자 정보
+        """
+        oldest = self.reply_store.get_high_water_mark(channel_id, thread_ts) if self.reply_store else None
+        yield from self.iter_replies_with_user_info(channel_id, thread_ts, oldest=oldest)
+
     def get_replies_with_user_info(self, channel_id: str, thread_ts: str) -> List[Dict]:
         """
         스레드 댓글과 사용자 정보를 함께 가져오기
@@ -148,49 +488,81 @@ class SlackHandler:
             thread_ts (str): 스레드 타임스탬프
 
         Returns:
-            List[Dict]: 댓글 + 사용자 정보 리스트
+            List[Dict]: 댓글 + 사용자 정보 리스트, 댓글을 끝까지 가져오지 못하면 빈 리스트
         """
-        replies = self.get_thread_replies(channel_id, thread_ts)
-
-        if not replies:
+        try:
+            enriched_replies = list(self.iter_replies_with_user_info(channel_id, thread_ts))
+        except SlackApiError:
             return []
 
-        print(f"\n[Slack] 사용자 정보 수집 중...")
+        print(f"✓ 사용자 정보 수집 완료: {len(enriched_replies)}개")
 
-        enriched_replies = []
+        return enriched_replies
 
-        for reply in replies:
-            user_id = reply.get('user')
-            text = reply.get('text', '')
-            ts = reply.get('ts', '')
+    def get_reaction_users(self, channel_id: str, message_ts: str,
+                           reactions: Optional[List[str]] = None) -> List[Dict]:
+        """
+        메시지에 반응(이모지)을 단 사용자 목록과 사용자 정보 (reactions.get 1회)
 
-            # Bot 메시지 제외
-            if reply.get('bot_id'):
-                continue
+        Args:
+            channel_id (str): 채널 ID
+            message_ts (str): 메시지(스레드 부모) 타임스탬프
+            reactions (Optional[List[str]]): 출석으로 인정할 이모지 이름 (None이면 모든 반응)
 
-            user_info = None
-            if user_id:
-                user_info = self.get_user_info(user_id)
+        Returns:
+            List[Dict]: [{'user_id', 'user_info', 'reaction'}] (먼저 반응한 이모지 기준, 중복 제거)
+        """
+        wanted = {r.strip(':') for r in reactions} if reactions else None
 
-            enriched_replies.append({
-                'user_id': user_id,
-                'user_info': user_info,
-                'text': text,
-                'timestamp': ts,
-            })
+        try:
+            print(f"\n[Slack] 출석 반응 수집 중...")
+            print(f"  - 인정 이모지: {', '.join(sorted(wanted)) if wanted else '전체'}")
 
-        print(f"✓ 사용자 정보 수집 완료: {len(enriched_replies)}개")
+            response = self._call('reactions.get', channel=channel_id, timestamp=message_ts, full=True)
 
-        return enriched_replies
+            if not response['ok']:
+                raise SlackApiError("API 호출 실패", response)
+
+            reacted = {}  # user_id -> 이모지
+
+            for reaction in response['message'].get('reactions', []):
+                name = reaction['name'].split('::')[0]  # 피부색 변형 (thumbsup::skin-tone-2)
 
-    def find_latest_attendance_thread(self, channel_id: str, keywords: List[str] = None, include_bot: bool = True) -> Optional[Dict]:
+                if wanted and name not in wanted:
+                    continue
+
+                for user_id in reaction.get('users', []):
+                    reacted.setdefault(user_id, name)
+
+            print(f"✓ 반응 수집 완료: {len(reacted)}명")
+
+        except SlackApiError as e:
+            print(f"✗ 반응 가져오기 실패: {e.response['error']}")
+            return []
+
+        # 사용자 정보는 댓글 모드와 같은 방식으로 조회 (목록 일괄 조회 + 캐시 + 병렬 조회)
+        self._prefetch_users([{'user': user_id} for user_id in reacted])
+        profiles = self.resolve_users(reacted)
+
+        return [
+            {'user_id': user_id, 'user_info': profiles.get(user_id), 'reaction': name}
+            for user_id, name in reacted.items()
+        ]
+
+    def find_latest_attendance_thread(self, channel_id: str, keywords: List[str] = None, include_bot: bool = True,
+                                      oldest: Optional[float] = None, max_messages: Optional[int] = None) -> Optional[Dict]:
         """
         채널에서 가장 최신 출석체크 스레드 찾기
 
+        최신 메시지부터 작은 페이지로 읽기 시작해 필요할 때만 페이지를 키우며
+        (커서 페이지네이션), 키워드가 처음 일치하는 메시지에서 바로 멈춥니다.
+
         Args:
             channel_id (str): 채널 ID
             keywords (List[str]): 검색 키워드 리스트 (기본값: ["출석 스레드", "출석체크", "출석"])
             include_bot (bool): 봇 메시지 포함 여부 (기본값: True)
+            oldest (Optional[float]): 검색 시작 시각 (Unix 초, 이보다 오래된 메시지는 보지 않음)
+            max_messages (Optional[int]): 최대 검색 메시지 수 (기본값: DISCOVERY_MAX_MESSAGES)
 
         Returns:
             Optional[Dict]: 찾은 메시지 정보 (ts, text, user 등), 없으면 None
@@ -198,34 +570,46 @@ class SlackHandler:
         if keywords is None:
             keywords = ["출석 스레드", "출석체크", "출석"]
 
+        max_messages = max_messages or self.DISCOVERY_MAX_MESSAGES
+        pattern = compile_attendance_matcher(tuple(keywords))  # 키워드가 하나라도 있으면 일치
+
         try:
             print(f"\n[Slack] 최신 출석체크 스레드 검색 중...")
             print(f"  - 검색 키워드: {', '.join(keywords)}")
             print(f"  - 봇 메시지 포함: {include_bot}")
-
-            # 최근 메시지 가져오기 (최대 100개)
-            response = self.client.conversations_history(
-                channel=channel_id,
-                limit=100
-            )
-
-            if not response['ok']:
-                raise SlackApiError("API 호출 실패", response)
-
-            messages = response['messages']
-
-            # 키워드를 포함한 메시지 찾기 (최신순)
-            for message in messages:
-                text = message.get('text', '').lower()
-
-                # Bot 메시지 제외 (옵션)
-                if not include_bot and message.get('bot_id'):
-                    continue
-
-                # 키워드 검색
-                for keyword in keywords:
-                    if keyword.lower() in text:
-                        print(f"✓ 출석체크 스레드 발견!")
+            if oldest is not None:
+                print(f"  - 검색 범위: {datetime.fromtimestamp(oldest).strftime('%Y-%m-%d %H:%M')} 이후")
+
+            window = {}
+            if oldest is not None:
+                window['oldest'] = f"{oldest:.6f}"
+
+            page_size = self.DISCOVERY_PAGE_SIZE
+            scanned = 0
+            cursor = None
+
+            while scanned < max_messages:
+                response = self._call(
+                    'conversations.history',
+                    channel=channel_id,
+                    limit=min(page_size, max_messages - scanned),
+                    cursor=cursor,
+                    **window
+                )
+
+                if not response['ok']:
+                    raise SlackApiError("API 호출 실패", response)
+
+                # 키워드를 포함한 메시지 찾기 (최신순)
+                for message in response['messages']:
+                    scanned += 1
+
+                    # Bot 메시지 제외 (옵션)
+                    if not include_bot and message.get('bot_id'):
+                        continue
+
+                    if pattern.search(message.get('text', '')):
+                        print(f"✓ 출석체크 스레드 발견! (메시지 {scanned}개 확인)")
                         print(f"  - 메시지: {message.get('text', '')[:100]}...")
                         print(f"  - 작성자: {'봇' if message.get('bot_id') else '사용자'}")
 
@@ -236,7 +620,14 @@ class SlackHandler:
                             'bot_id': message.get('bot_id'),
                         }
 
-            print("✗ 출석체크 스레드를 찾을 수 없습니다.")
+                cursor = (response.get('response_metadata') or {}).get('next_cursor')
+                if not cursor:
+                    break
+
+                # 앞쪽에서 찾지 못했으면 다음 페이지는 더 크게
+                page_size = min(page_size * 2, self.DISCOVERY_MAX_PAGE_SIZE)
+
+            print(f"✗ 출석체크 스레드를 찾을 수 없습니다. (메시지 {scanned}개 확인)")
             return None
 
         except SlackApiError as e:
@@ -245,7 +636,7 @@ class SlackHandler:
 
     def get_user_id_by_email(self, email: str) -> Optional[str]:
         """
-        이메일 주소로 User ID 찾기
+        이메일 주소로 User ID 찾기 (캐시 사용)
 
         Args:
             email (str): 슬랙 이메일 주소
@@ -253,11 +644,16 @@ class SlackHandler:
         Returns:
             Optional[str]: User ID (U로 시작), 실패 시 None
         """
+        cached = self.user_cache.get_user_id_by_email(self.team_id, email)
+        if cached:
+            return cached
+
         try:
-            response = self.client.users_lookupByEmail(email=email)
+            response = self._call('users.lookupByEmail', email=email)
 
             if response['ok']:
                 user_id = response['user']['id']
+                self.user_cache.put_user_id_by_email(self.team_id, email, user_id)
                 print(f"✓ 이메일로 User ID 찾기 성공: {email} → {user_id}")
                 return user_id
             else:
@@ -268,10 +664,87 @@ class SlackHandler:
             print(f"✗ 이메일로 User ID 찾기 실패: {e.response['error']}")
             return None
 
+    def open_dm_channel(self, user_id: str) -> str:
+        """
+        사용자와의 DM 채널 ID 가져오기 (캐시에 없을 때만 conversations.open 호출)
+
+        Args:
+            user_id (str): Slack User ID
+
+        Returns:
+            str: DM 채널 ID
+
+        Raises:
+            SlackApiError: 채널 열기 실패
+        """
+        cached = self.user_cache.get_dm_channel(self.team_id, user_id)
+        if cached:
+            return cached
+
+        response = self._call('conversations.open', users=[user_id])
+
+        if not response['ok']:
+            raise SlackApiError("DM 채널 열기 실패", response)
+
+        channel_id = response['channel']['id']
+        self.user_cache.put_dm_channel(self.team_id, user_id, channel_id)
+        return channel_id
+
+    def resolve_dm_recipient(self, user_id_or_email: str) -> Optional[str]:
+        """
+        User ID 또는 이메일 주소를 User ID로 변환
+
+        Args:
+            user_id_or_email (str): Slack User ID 또는 이메일 주소
+
+        Returns:
+            Optional[str]: User ID, 이메일로 사용자를 찾지 못하면 None
+        """
+        if '@' not in user_id_or_email:
+            return user_id_or_email
+
+        return self.get_user_id_by_email(user_id_or_email)
+
+    def _post_dm(self, user_id: str, message: str) -> str:
+        """
+        DM 1건 전송 (캐시된 DM 채널 사용, channel_not_found면 채널을 다시 열어 한 번 더 시도)
+
+        Args:
+            user_id (str): Slack User ID
+            message (str): 메시지 내용
+
+        Returns:
+            str: 보낸 메시지 ts
+
+        Raises:
+            SlackApiError: 전송 실패
+        """
+        for attempt in range(2):
+            channel_id = self.open_dm_channel(user_id)
+
+            try:
+                response = self._call(
+                    'chat.postMessage',
+                    channel=channel_id,
+                    text=message
+                )
+                return response['ts']
+
+            except SlackApiError as e:
+                if e.response['error'] != 'channel_not_found' or attempt > 0:
+                    raise
+
+                print(f"⚠️ 저장된 DM 채널을 찾을 수 없어 다시 엽니다 ({user_id})")
+                self.user_cache.invalidate_dm_channel(self.team_id, user_id)
+
     def send_dm(self, user_id_or_email: str, message: str) -> bool:
         """
         특정 사용자에게 DM 전송 (User ID 또는 이메일 주소 모두 지원)
 
+        이메일 -> User ID, User ID -> DM 채널 ID를 캐시하므로 같은 사람에게 다시 보낼 때는
+        chat.postMessage 한 번만 호출합니다. 캐시된 채널이 없어졌으면(channel_not_found)
+        캐시를 지우고 채널을 다시 열어 한 번 더 보냅니다.
+
         Args:
             user_id_or_email (str): Slack User ID (U로 시작) 또는 이메일 주소
             message (str): 메시지 내용
@@ -279,41 +752,155 @@ class SlackHandler:
         Returns:
             bool: 전송 성공 여부
         """
+        user_id = self.resolve_dm_recipient(user_id_or_email)
+        if not user_id:
+            print(f"✗ DM 전송 실패: 이메일로 사용자를 찾을 수 없습니다")
+            return False
+
         try:
-            user_id = user_id_or_email
+            self._post_dm(user_id, message)
+            print(f"✓ DM 전송 성공")
+            return True
 
-            # 이메일 형식이면 User ID로 변환
-            if '@' in user_id_or_email:
-                print(f"[DM] 이메일 주소 감지: {user_id_or_email}")
-                user_id = self.get_user_id_by_email(user_id_or_email)
-                if not user_id:
-                    print(f"✗ DM 전송 실패: 이메일로 사용자를 찾을 수 없습니다")
-                    return False
+        except SlackApiError as e:
+            print(f"✗ DM 전송 실패: {e.response['error']}")
+            return False
 
-            # DM 채널 열기
-            response = self.client.conversations_open(users=[user_id])
+    def _deliver(self, job: Dict) -> Dict:
+        """
+        DM 일괄 전송 작업 1건 처리 (일시적인 오류는 지수 백오프로 재시도)
 
-            if not response['ok']:
-                raise SlackApiError("DM 채널 열기 실패", response)
+        메시지는 이 수신자의 템플릿 변수로 한 번만 만들고 재시도할 때도 같은 메시지를 보냅니다.
+        템플릿 변수가 맞지 않으면 이 수신자만 실패(template_error)로 기록합니다.
 
-            channel_id = response['channel']['id']
+        Args:
+            job (Dict): {'recipient', 'template', 'context'}
 
-            # 메시지 전송
-            response = self.client.chat_postMessage(
-                channel=channel_id,
-                text=message
-            )
+        Returns:
+            Dict: 수신자별 전송 결과
+        """
+        result = {
+            'recipient': job['recipient'],
+            'user_id': None,
+            'status': 'failed',
+            'attempts': 0,
+            'error': None,
+            'ts': None,
+            'context': job['context'],
+        }
 
-            if response['ok']:
-                print(f"✓ DM 전송 성공")
-                return True
-            else:
-                print(f"✗ DM 전송 실패")
-                return False
+        try:
+            text = job['template'].format(**job['context'])
+        except (KeyError, IndexError, ValueError) as e:
+            result['error'] = f"template_error: {e!r}"
+            return result
 
-        except SlackApiError as e:
-            print(f"✗ DM 전송 실패: {e.response['error']}")
-            return False
+        while result['attempts'] < self.DM_MAX_ATTEMPTS:
+            result['attempts'] += 1
+
+            try:
+                if result['user_id'] is None:
+                    result['user_id'] = self.resolve_dm_recipient(job['recipient'])
+                    if not result['user_id']:
+                        result.update(status='not_found', error='users_not_found')
+                        return result
+
+                result['ts'] = self._post_dm(result['user_id'], text)
+                result.update(status='sent', error=None)
+                return result
+
+            except SlackApiError as e:
+                result['error'] = e.response['error']
+                if result['error'] not in self.TRANSIENT_ERRORS:
+                    return result
+
+            except Exception as e:  # 연결 오류 등
+                result['error'] = str(e)
+
+            if result['attempts'] < self.DM_MAX_ATTEMPTS:
+                time.sleep(random.uniform(0, self.DM_RETRY_BASE_SECONDS * (2 ** (result['attempts'] - 1))))
+
+        return result
+
+    def send_bulk_dms(self, recipients: List[Dict], template: str,
+                      max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        여러 사용자에게 DM 일괄 전송 (병렬, 호출 한도 안에서)
+
+        메시지는 수신자별 작업 안에서 만들므로, 한 수신자의 템플릿 변수가 잘못되어도
+        그 수신자만 실패로 기록되고 나머지는 그대로 전송됩니다.
+        DM 채널과 이메일 -> User ID는 캐시를 사용하므로 이미 보낸 적 있는 사람은
+        chat.postMessage 한 번으로 전송됩니다.
+
+        Args:
+            recipients (List[Dict]): [{'recipient': User ID 또는 이메일, ...템플릿 변수}]
+            template (str): 메시지 템플릿 (예: "{name}님, 오늘 출석이 확인되지 않았습니다.")
+            max_workers (Optional[int]): 동시 전송 수 (기본값: DM_WORKERS)
+
+        Returns:
+            List[Dict]: 수신자별 결과 (recipient, user_id, status: sent/failed/not_found,
+                        attempts, error, ts, context) - recipients와 같은 순서
+        """
+        jobs = [
+            {
+                'recipient': recipient['recipient'],
+                'template': template,
+                'context': {k: v for k, v in recipient.items() if k != 'recipient'},
+            }
+            for recipient in recipients
+        ]
+
+        if not jobs:
+            return []
+
+        workers = min(max_workers or self.DM_WORKERS, len(jobs))
+        print(f"\n[Slack] DM 일괄 전송 중... ({len(jobs)}명, 동시 {workers}개)")
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self._deliver, jobs))
+
+        sent = sum(1 for r in results if r['status'] == 'sent')
+        print(f"✓ DM 일괄 전송 완료: 성공 {sent}명 / 실패 {len(results) - sent}명")
+
+        for r in results:
+            if r['status'] != 'sent':
+                print(f"  ✗ {r['recipient']}: {r['error']} (시도 {r['attempts']}회)")
+
+        return results
+
+    def deliver_notification(self, kind: str, target: str, message: str, thread_ts: Optional[str] = None) -> str:
+        """
+        알림 대기열 항목 1건 전송 (실패하면 예외를 그대로 올려 대기열이 재시도하게 함)
+
+        Args:
+            kind (str): 'thread_reply' 또는 'dm'
+            target (str): 채널 ID (thread_reply) 또는 User ID/이메일 (dm)
+            message (str): 메시지 내용
+            thread_ts (Optional[str]): 스레드 타임스탬프 (thread_reply)
+
+        Returns:
+            str: 보낸 메시지 ts
+
+        Raises:
+            SlackApiError: 전송 실패
+            ValueError: 알 수 없는 알림 종류
+        """
+        if kind == 'dm':
+            user_id = self.resolve_dm_recipient(target)
+            if not user_id:
+                raise SlackApiError("DM 수신자를 찾을 수 없습니다", {'ok': False, 'error': 'users_not_found'})
+            return self._post_dm(user_id, message)
+
+        if kind == 'thread_reply':
+            response = self._call(
+                'chat.postMessage',
+                channel=target,
+                thread_ts=thread_ts,
+                text=self.convert_mentions(message)
+            )
+            return response['ts']
+
+        raise ValueError(f"알 수 없는 알림 종류: {kind}")
 
     def post_thread_reply(self, channel_id: str, thread_ts: str, message: str) -> bool:
         """
@@ -331,7 +918,8 @@ class SlackHandler:
             # @channel, @here 등을 슬랙 형식으로 변환
             converted_message = self.convert_mentions(message)
 
-            response = self.client.chat_postMessage(
+            response = self._call(
+                'chat.postMessage',
                 channel=channel_id,
                 thread_ts=thread_ts,
                 text=converted_message
@@ -363,7 +951,8 @@ class SlackHandler:
             # @channel, @here 등을 슬랙 형식으로 변환
             converted_message = self.convert_mentions(message)
 
-            response = self.client.chat_postMessage(
+            response = self._call(
+                'chat.postMessage',
                 channel=channel_id,
                 text=converted_message
             )
@@ -373,7 +962,8 @@ class SlackHandler:
                 return {
                     'ts': response['ts'],
                     'text': message,
-                    'channel': channel_id
+                    'channel': channel_id,
+                    'user': (response.get('message') or {}).get('user')
                 }
             else:
                 print(f"✗ 메시지 전송 실패")
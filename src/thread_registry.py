@@ -0,0 +1,150 @@
+"""
+출석 스레드 등록부 모듈
+자동 생성한 출석 스레드(ts, 채널, 생성 시각, 기록한 열)를 워크스페이스별로 디스크에 저장합니다.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class ThreadRegistry:
+    """출석 스레드 등록부 (워크스페이스별 JSON 파일)"""
+
+    # 보관할 최대 스레드 수 (오래된 것부터 삭제)
+    MAX_ENTRIES = 200
+
+    _lock = threading.Lock()
+
+    def __init__(self, registry_file: Path):
+        """
+        Args:
+            registry_file (Path): 등록부 파일 경로 (워크스페이스별)
+        """
+        self.registry_file = Path(registry_file)
+
+    def _load(self) -> Dict[str, Dict]:
+        """등록부 파일 로드 {ts: 항목}"""
+        if not self.registry_file.exists():
+            return {}
+
+        try:
+            with open(self.registry_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 스레드 등록부 읽기 실패 (무시): {e}")
+            return {}
+
+    def _save(self, data: Dict[str, Dict]):
+        """등록부 파일 저장 (오래된 항목 정리)"""
+        if len(data) > self.MAX_ENTRIES:
+            newest = sorted(data.values(), key=lambda e: e['created_at'], reverse=True)[:self.MAX_ENTRIES]
+            data = {e['ts']: e for e in newest}
+
+        try:
+            self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.registry_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"⚠️ 스레드 등록부 저장 실패 (무시): {e}")
+
+    def register(self, ts: str, channel: str, column: Optional[str] = None,
+                 text: Optional[str] = None, user: Optional[str] = None) -> Dict:
+        """
+        새로 만든 출석 스레드 등록
+
+        Args:
+            ts (str): 스레드 타임스탬프
+            channel (str): 채널 ID
+            column (Optional[str]): 이 스레드의 출석을 기록할 열 (예: 'K')
+            text (Optional[str]): 스레드 메시지
+            user (Optional[str]): 작성자 (봇 User ID)
+
+        Returns:
+            Dict: 등록된 항목
+        """
+        entry = {
+            'ts': ts,
+            'channel': channel,
+            'created_at': float(ts) if ts else time.time(),
+            'column': column,
+            'text': text,
+            'user': user,
+        }
+
+        with self._lock:
+            data = self._load()
+            data[ts] = entry
+            self._save(data)
+
+        return entry
+
+    def assign_column(self, ts: str, channel: str, column: str):
+        """
+        스레드의 출석을 기록한 열 저장 (등록되지 않은 스레드면 새로 등록)
+
+        Args:
+            ts (str): 스레드 타임스탬프
+            channel (str): 채널 ID
+            column (str): 출석을 기록한 열
+        """
+        with self._lock:
+            data = self._load()
+            entry = data.get(ts)
+
+            if entry is None:
+                entry = {'ts': ts, 'channel': channel, 'created_at': float(ts), 'text': None, 'user': None}
+                data[ts] = entry
+
+            entry['column'] = column
+            entry['checked_at'] = time.time()
+            self._save(data)
+
+    def get(self, ts: str) -> Optional[Dict]:
+        """
+        스레드 항목 조회
+
+        Args:
+            ts (str): 스레드 타임스탬프
+
+        Returns:
+            Optional[Dict]: 등록된 항목, 없으면 None
+        """
+        with self._lock:
+            return self._load().get(ts)
+
+    def latest(self, channel: str, since: Optional[float] = None) -> Optional[Dict]:
+        """
+        채널의 가장 최근 출석 스레드 조회
+
+        Args:
+            channel (str): 채널 ID
+            since (Optional[float]): 이 시각(Unix 초) 이후에 만든 스레드만
+
+        Returns:
+            Optional[Dict]: 가장 최근 항목, 없으면 None
+        """
+        entries = [
+            e for e in self.list(channel)
+            if since is None or e['created_at'] >= since
+        ]
+        return entries[0] if entries else None
+
+    def list(self, channel: Optional[str] = None) -> List[Dict]:
+        """
+        등록된 스레드 목록 (최신순)
+
+        Args:
+            channel (Optional[str]): 채널 ID (None이면 전체)
+
+        Returns:
+            List[Dict]: 항목 리스트
+        """
+        with self._lock:
+            entries = list(self._load().values())
+
+        if channel is not None:
+            entries = [e for e in entries if e['channel'] == channel]
+
+        return sorted(entries, key=lambda e: e['created_at'], reverse=True)
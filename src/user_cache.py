@@ -0,0 +1,348 @@
+"""
+Slack 사용자 프로필 캐시 모듈
+메모리 LRU와 SQLite 디스크 저장소를 함께 사용하여 실행/워크스페이스 간에 프로필을 공유합니다.
+DM 전송용 이메일 -> User ID, User ID -> DM 채널 ID 매핑도 함께 저장합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from src.utils import get_cache_dir
+
+
+class UserProfileCache:
+    """Slack 사용자 프로필 2단계 캐시 (메모리 LRU + SQLite, 스레드 안전)"""
+
+    # 메모리에 유지할 최대 프로필 수
+    DEFAULT_MAX_ENTRIES = 5000
+
+    # 프로필 유효 시간 (초)
+    DEFAULT_TTL = 7 * 24 * 60 * 60
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            db_path (Path): SQLite 파일 경로
+            max_entries (int): 메모리 LRU 크기
+            ttl (float): 프로필 유효 시간 (초)
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+
+        # 메모리 LRU (모두 같은 TTL과 최대 크기 적용)
+        self._memory: OrderedDict = OrderedDict()       # (team_id, user_id) -> (cached_at, info)
+        self._emails: OrderedDict = OrderedDict()       # (team_id, email) -> (cached_at, user_id)
+        self._dm_channels: OrderedDict = OrderedDict()  # (team_id, user_id) -> (cached_at, DM 채널 ID)
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        """SQLite 연결 (블록이 끝나면 커밋 후 닫음)"""
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            yield conn
+
+    def _init_db(self):
+        """테이블 생성"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock, self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS profiles (
+                    team_id TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    info TEXT NOT NULL,
+                    cached_at REAL NOT NULL,
+                    PRIMARY KEY (team_id, user_id)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS emails (
+                    team_id TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    cached_at REAL NOT NULL,
+                    PRIMARY KEY (team_id, email)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS dm_channels (
+                    team_id TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    channel_id TEXT NOT NULL,
+                    PRIMARY KEY (team_id, user_id)
+                )
+            """)
+
+    def _remember(self, key: tuple, cached_at: float, info: Dict, store: Optional[OrderedDict] = None):
+        """메모리 LRU에 저장 (잠금 안에서 호출, store 기본값: 프로필)"""
+        store = self._memory if store is None else store
+        store[key] = (cached_at, info)
+        store.move_to_end(key)
+
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def _recall(self, store: OrderedDict, key: tuple, now: float):
+        """메모리 LRU에서 조회 (잠금 안에서 호출, 만료된 항목은 지우고 None)"""
+        entry = store.get(key)
+
+        if entry is None:
+            return None
+
+        if now - entry[0] > self.ttl:
+            del store[key]
+            return None
+
+        store.move_to_end(key)
+        return entry[1]
+
+    def get_many(self, team_id: str, user_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 사용자 프로필 조회 (메모리 -> 디스크 순서)
+
+        Args:
+            team_id (str): Slack 팀 ID
+            user_ids (Iterable[str]): 사용자 ID 목록
+
+        Returns:
+            Dict[str, Dict]: {user_id: 사용자 정보} (캐시에 있는 사용자만)
+        """
+        now = time.time()
+        found = {}
+        disk_lookup = []
+
+        with self._lock:
+            for user_id in dict.fromkeys(user_ids):
+                info = self._recall(self._memory, (team_id, user_id), now)
+
+                if info is not None:
+                    found[user_id] = info
+                    self.memory_hits += 1
+                else:
+                    disk_lookup.append(user_id)
+
+            if disk_lookup:
+                with self._connect() as conn:
+                    placeholders = ','.join('?' * len(disk_lookup))
+                    rows = conn.execute(
+                        f"SELECT user_id, info, cached_at FROM profiles "
+                        f"WHERE team_id = ? AND user_id IN ({placeholders})",
+                        [team_id] + disk_lookup
+                    ).fetchall()
+
+                for user_id, info, cached_at in rows:
+                    if now - cached_at <= self.ttl:
+                        info = json.loads(info)
+                        found[user_id] = info
+                        self._remember((team_id, user_id), cached_at, info)
+                        self.disk_hits += 1
+
+                self.misses += len([u for u in disk_lookup if u not in found])
+
+        return found
+
+    def get(self, team_id: str, user_id: str) -> Optional[Dict]:
+        """
+        사용자 프로필 조회
+
+        Args:
+            team_id (str): Slack 팀 ID
+            user_id (str): 사용자 ID
+
+        Returns:
+            Optional[Dict]: 사용자 정보, 없거나 만료되면 None
+        """
+        return self.get_many(team_id, [user_id]).get(user_id)
+
+    def put_many(self, team_id: str, infos: Dict[str, Dict]):
+        """
+        여러 사용자 프로필 저장
+
+        Args:
+            team_id (str): Slack 팀 ID
+            infos (Dict[str, Dict]): {user_id: 사용자 정보}
+        """
+        if not infos:
+            return
+
+        now = time.time()
+
+        with self._lock:
+            for user_id, info in infos.items():
+                self._remember((team_id, user_id), now, info)
+
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO profiles (team_id, user_id, info, cached_at) VALUES (?, ?, ?, ?)",
+                    [(team_id, user_id, json.dumps(info, ensure_ascii=False), now) for user_id, info in infos.items()]
+                )
+
+    def put(self, team_id: str, user_id: str, info: Dict):
+        """
+        사용자 프로필 저장
+
+        Args:
+            team_id (str): Slack 팀 ID
+            user_id (str): 사용자 ID
+            info (Dict): 사용자 정보
+        """
+        self.put_many(team_id, {user_id: info})
+
+    def get_user_id_by_email(self, team_id: str, email: str) -> Optional[str]:
+        """
+        이메일로 저장된 User ID 조회
+
+        Args:
+            team_id (str): Slack 팀 ID
+            email (str): 이메일 주소
+
+        Returns:
+            Optional[str]: User ID, 없거나 만료되면 None
+        """
+        key = (team_id, email.strip().lower())
+        now = time.time()
+
+        with self._lock:
+            user_id = self._recall(self._emails, key, now)
+            if user_id:
+                return user_id
+
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT user_id, cached_at FROM emails WHERE team_id = ? AND email = ?", key
+                ).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                return None
+
+            self._remember(key, row[1], row[0], self._emails)
+            return row[0]
+
+    def put_user_id_by_email(self, team_id: str, email: str, user_id: str):
+        """
+        이메일 -> User ID 저장
+
+        Args:
+            team_id (str): Slack 팀 ID
+            email (str): 이메일 주소
+            user_id (str): User ID
+        """
+        key = (team_id, email.strip().lower())
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, now, user_id, self._emails)
+
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO emails (team_id, email, user_id, cached_at) VALUES (?, ?, ?, ?)",
+                    key + (user_id, now)
+                )
+
+    def get_dm_channel(self, team_id: str, user_id: str) -> Optional[str]:
+        """
+        사용자와의 DM 채널 ID 조회
+
+        Args:
+            team_id (str): Slack 팀 ID
+            user_id (str): User ID
+
+        Returns:
+            Optional[str]: DM 채널 ID, 없으면 None
+        """
+        key = (team_id, user_id)
+        now = time.time()
+
+        with self._lock:
+            channel_id = self._recall(self._dm_channels, key, now)
+            if channel_id:
+                return channel_id
+
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT channel_id FROM dm_channels WHERE team_id = ? AND user_id = ?", key
+                ).fetchone()
+
+            if row is None:
+                return None
+
+            self._remember(key, now, row[0], self._dm_channels)
+            return row[0]
+
+    def put_dm_channel(self, team_id: str, user_id: str, channel_id: str):
+        """
+        사용자와의 DM 채널 ID 저장
+
+        Args:
+            team_id (str): Slack 팀 ID
+            user_id (str): User ID
+            channel_id (str): DM 채널 ID
+        """
+        with self._lock:
+            self._remember((team_id, user_id), time.time(), channel_id, self._dm_channels)
+
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO dm_channels (team_id, user_id, channel_id) VALUES (?, ?, ?)",
+                    (team_id, user_id, channel_id)
+                )
+
+    def invalidate_dm_channel(self, team_id: str, user_id: str):
+        """
+        DM 채널 ID 삭제 (channel_not_found 등으로 더 이상 쓸 수 없을 때)
+
+        Args:
+            team_id (str): Slack 팀 ID
+            user_id (str): User ID
+        """
+        with self._lock:
+            self._dm_channels.pop((team_id, user_id), None)
+
+            with self._connect() as conn:
+                conn.execute("DELETE FROM dm_channels WHERE team_id = ? AND user_id = ?", (team_id, user_id))
+
+    def get_stats(self) -> Dict:
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'email_entries': len(self._emails),
+                'dm_channel_entries': len(self._dm_channels),
+            }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_user_cache() -> UserProfileCache:
+    """
+    프로세스 전체에서 공유하는 사용자 프로필 캐시 반환 (처음 호출 시 생성)
+
+    Returns:
+        UserProfileCache: 공용 캐시 (cache/slack_users.db)
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = UserProfileCache(get_cache_dir() / 'slack_users.db')
+        return _default_cache
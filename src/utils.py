@@ -4,7 +4,7 @@
 """
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
 
@@ -116,6 +116,18 @@ def format_duration(seconds: float) -> str:
     return f"{seconds:.2f}초"
 
 
+def get_cache_dir() -> Path:
+    """
+    프로세스 공용 캐시/저널 폴더 반환 (프로젝트 루트의 cache/, 없으면 생성)
+
+    Returns:
+        Path: 캐시 폴더 경로
+    """
+    cache_dir = Path(__file__).parent.parent / "cache"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+
 def parse_slack_thread_link(link_or_ts: str) -> Optional[str]:
     """
     슬랙 링크 또는 Thread TS를 파싱하여 Thread TS 반환
@@ -156,10 +168,10 @@ def parse_slack_thread_link(link_or_ts: str) -> Optional[str]:
 
 def column_letter_to_index(letter: str) -> Optional[int]:
     """
-    열 문자를 인덱스로 변환 (A -> 0, B -> 1, ..., Z -> 25)
+    열 문자를 인덱스로 변환 (A -> 0, B -> 1, ..., Z -> 25, AA -> 26, ...)
 
     Args:
-        letter (str): 열 문자 (A-Z, 대소문자 구분 없음)
+        letter (str): 열 문자 (A-ZZZ, 대소문자 구분 없음)
 
     Returns:
         Optional[int]: 열 인덱스 (0-based), 잘못된 입력 시 None
@@ -169,27 +181,37 @@ def column_letter_to_index(letter: str) -> Optional[int]:
 
     letter = letter.strip().upper()
 
-    # 단일 문자 검증 (A-Z)
-    if len(letter) == 1 and 'A' <= letter <= 'Z':
-        return ord(letter) - ord('A')
+    # 1~3글자 영문 검증 (시트 최대 열은 ZZZ보다 작음)
+    if not re.fullmatch(r'[A-Z]{1,3}', letter):
+        return None
 
-    return None
+    index = 0
+    for char in letter:
+        index = index * 26 + (ord(char) - ord('A') + 1)
+
+    return index - 1
 
 
 def column_index_to_letter(index: int) -> Optional[str]:
     """
-    열 인덱스를 문자로 변환 (0 -> A, 1 -> B, ..., 25 -> Z)
+    열 인덱스를 문자로 변환 (0 -> A, 1 -> B, ..., 25 -> Z, 26 -> AA, ...)
 
     Args:
         index (int): 열 인덱스 (0-based)
 
     Returns:
-        Optional[str]: 열 문자, 범위 벗어나면 None
+        Optional[str]: 열 문자, 잘못된 인덱스면 None
     """
-    if not isinstance(index, int) or index < 0 or index > 25:
+    if not isinstance(index, int) or index < 0:
         return None
 
-    return chr(ord('A') + index)
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+
+    return letters
 
 
 def get_next_column(current_column: str, start_column: str, end_column: str) -> str:
@@ -227,6 +249,43 @@ def get_next_column(current_column: str, start_column: str, end_column: str) ->
     return column_index_to_letter(next_idx)
 
 
+WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+
+
+def get_previous_schedule_time(day: str, time_str: str, now: datetime) -> Optional[datetime]:
+    """
+    매주 반복되는 스케줄(요일 + 시간)의 가장 최근 실행 시각 계산
+
+    Args:
+        day (str): 요일 (mon, tue, ... sun)
+        time_str (str): 시간 (HH:MM)
+        now (datetime): 기준 시각 (이 시각의 시간대를 그대로 사용)
+
+    Returns:
+        Optional[datetime]: now 이전(같은 시각 포함)의 가장 최근 실행 시각, 형식이 잘못되면 None
+
+    Examples:
+        >>> get_previous_schedule_time('mon', '09:00', datetime(2024, 1, 3, 12, 0))  # 수요일
+        datetime.datetime(2024, 1, 1, 9, 0)
+    """
+    day = (day or '').strip().lower()[:3]
+    if day not in WEEKDAYS:
+        return None
+
+    try:
+        hour, minute = (int(part) for part in time_str.split(':'))
+        scheduled = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    except (AttributeError, ValueError):
+        return None
+
+    scheduled -= timedelta(days=(now.weekday() - WEEKDAYS.index(day)) % 7)
+
+    if scheduled > now:
+        scheduled -= timedelta(days=7)
+
+    return scheduled
+
+
 # 테스트 코드
 if __name__ == '__main__':
     print_header("유틸리티 함수 테스트")
@@ -265,3 +324,6 @@ if __name__ == '__main__':
     print(f"  A -> {column_letter_to_index('A')}")  # 0
     print(f"  10 -> {column_index_to_letter(10)}")  # K
     print(f"  7 -> {column_index_to_letter(7)}")   # H
+    print(f"  AA -> {column_letter_to_index('AA')}")  # 26
+    print(f"  27 -> {column_index_to_letter(27)}")  # AB
+
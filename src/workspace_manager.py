@@ -3,9 +3,12 @@
 여러 슬랙 워크스페이스 설정을 관리하는 모듈
 """
 import json
+import shutil
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from src.utils import column_letter_to_index, get_cache_dir
+
 
 class WorkspaceConfig:
     """워크스페이스 설정 클래스"""
@@ -79,33 +82,151 @@ class WorkspaceConfig:
     def sheet_name(self) -> str:
         return self._config['sheet_name']
 
+    def _column_index(self, value, key: str) -> Optional[int]:
+        """
+        설정의 열 값을 인덱스로 변환 (A, AA 등 열 문자 또는 0-based 숫자)
+
+        Args:
+            value: 설정 값
+            key (str): 설정 키 (경고 메시지용)
+
+        Returns:
+            Optional[int]: 열 인덱스 (0-based), 잘못된 값이면 경고를 출력하고 None
+        """
+        if isinstance(value, str) and not value.strip().isdigit():
+            index = column_letter_to_index(value)
+        else:
+            try:
+                index = int(value)
+            except (TypeError, ValueError):
+                index = None
+
+        if index is None or index < 0:
+            print(f"⚠️ [{self.name}] {key}의 열 값이 올바르지 않아 무시합니다: {value!r}")
+            return None
+
+        return index
+
     @property
     def name_column(self) -> int:
         """이름 열 인덱스 (0-based)"""
-        col = self._config['name_column']
+        col = self._column_index(self._config['name_column'], 'name_column')
 
-        # 문자열 (A, B 등)이면 숫자로 변환
-        if isinstance(col, str):
-            col = col.strip().upper()
-            if len(col) == 1 and 'A' <= col <= 'Z':
-                return ord(col) - ord('A')
+        if col is None:
+            raise ValueError(f"name_column 설정이 올바르지 않습니다: {self._config['name_column']!r}")
 
-        # 이미 숫자면 그대로 반환
-        return int(col)
+        return col
 
     @property
     def start_row(self) -> int:
         return self._config['start_row']
 
+    @property
+    def snapshot_columns(self) -> List[int]:
+        """시트 스냅샷에 함께 읽을 추가 열 인덱스 리스트 (0-based)"""
+        columns = []
+
+        for col in self._config.get('snapshot_columns', []):
+            index = self._column_index(col, 'snapshot_columns')
+            if index is not None:
+                columns.append(index)
+
+        return columns
+
     @property
     def credentials_path(self) -> str:
         return str(self.credentials_file)
 
+    @property
+    def cache_dir(self) -> Path:
+        """
+        워크스페이스별 캐시 폴더 (명단 캐시, 스레드 레지스트리, 댓글 저장소)
+
+        다른 캐시/저널과 같은 프로젝트 루트 cache/ 아래의 workspaces/<이름>/ 을 사용합니다.
+        예전 위치(<워크스페이스>/.cache/)에 남아 있는 캐시는 처음 접근할 때 옮깁니다.
+        """
+        cache_dir = get_cache_dir() / "workspaces" / self.name
+        legacy_dir = self.path / ".cache"
+
+        if legacy_dir.is_dir() and not cache_dir.exists():
+            cache_dir.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(legacy_dir), str(cache_dir))
+            print(f"✓ [{self.name}] 캐시 폴더 이동: {legacy_dir} -> {cache_dir}")
+
+        return cache_dir
+
+    @property
+    def roster_cache_ttl(self) -> int:
+        """학생 명단 캐시 유효 시간 (초, 기본값: 6시간)"""
+        return int(self._config.get('roster_cache_ttl_minutes', 360)) * 60
+
+    @property
+    def roster_revision_check(self) -> bool:
+        """Drive API modifiedTime으로 명단 캐시를 검증할지 여부 (기본값: False)"""
+        return bool(self._config.get('roster_revision_check', False))
+
+    @property
+    def async_sheet_writes(self) -> bool:
+        """출석 기록을 저널에만 남기고 백그라운드에서 시트에 반영할지 여부 (기본값: False)"""
+        return bool(self._config.get('async_sheet_writes', False))
+
+    @property
+    def format_cells(self) -> bool:
+        """출석 셀에 상태별 배경색을 함께 기록할지 여부 (기본값: False)"""
+        return bool(self._config.get('format_cells', False))
+
+    @property
+    def attendance_mode(self) -> str:
+        """출석 수집 방식: 'replies' (스레드 댓글, 기본값) 또는 'reactions' (스레드 메시지의 이모지 반응)"""
+        mode = self._config.get('attendance_mode', 'replies')
+        return mode if mode in ('replies', 'reactions') else 'replies'
+
+    @property
+    def attendance_reactions(self) -> List[str]:
+        """반응 모드에서 출석으로 인정할 이모지 이름 목록 (비어 있으면 모든 반응)"""
+        return [str(r).strip(':') for r in self._config.get('attendance_reactions', []) if r]
+
+    @property
+    def absentee_dm_enabled(self) -> bool:
+        """자동 집계 후 미출석자 본인에게 안내 DM을 보낼지 여부 (기본값: False)"""
+        return bool(self._config.get('absentee_dm_enabled', False))
+
+    @property
+    def absentee_dm_column(self) -> Optional[int]:
+        """학생별 Slack User ID 또는 이메일이 있는 열 인덱스 (0-based, 설정되지 않으면 None)"""
+        col = self._config.get('absentee_dm_column')
+
+        return self._column_index(col, 'absentee_dm_column') if col not in (None, '') else None
+
+    @property
+    def absentee_dm_message(self) -> str:
+        """미출석자 안내 DM 템플릿 ({name}, {column}, {workspace} 사용 가능)"""
+        return self._config.get(
+            'absentee_dm_message',
+            "[출석 안내] {name}님, 이번 출석 체크({column}열)에서 출석이 확인되지 않았습니다.\n"
+            "출석하셨다면 출석 스레드에 댓글을 남기거나 담당자에게 알려주세요."
+        )
+
+    @property
+    def live_attendance(self) -> bool:
+        """등록된 출석 스레드의 댓글을 실시간으로 받아 기록할지 여부 (기본값: False)"""
+        return bool(self._config.get('live_attendance', False))
+
+    @property
+    def slack_app_token(self) -> Optional[str]:
+        """Socket Mode용 App-Level Token (xapp-로 시작, 설정되지 않으면 None)"""
+        return self._config.get('slack_app_token') or None
+
     @property
     def notification_user_id(self) -> Optional[str]:
         """알림 수신자 User ID (설정되지 않으면 None)"""
         return self._config.get('notification_user_id')
 
+    @property
+    def notification_digest_seconds(self) -> int:
+        """같은 알림 수신자에게 가는 자동 집계 요약 DM을 모아서 보낼 대기 시간 (초, 0이면 바로 전송)"""
+        return max(0, int(self._config.get('notification_digest_seconds', 0)))
+
     @property
     def auto_schedule(self) -> Optional[Dict]:
         """자동 실행 스케줄 설정"""
@@ -0,0 +1,411 @@
+"""
+출석 기록 저널 모듈
+시트에 보낼 출석 업데이트를 SQLite에 먼저 기록하고(write-ahead),
+백그라운드 플러셔가 모아서 전송합니다. 프로세스가 재시작되면 남은 항목을 다시 보냅니다.
+"""
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from src.sheets_handler import AttendanceStatus
+
+
+class WriteJournal:
+    """출석 업데이트 선기록 저널 (SQLite)"""
+
+    # 전송 중(inflight) 항목의 임대 시간 (초) - 지나면 다른 작업자가 다시 가져감
+    # 전송하는 동안은 leased()가 계속 연장하므로, 요청 조절기의 재시도/대기가 길어져도 만료되지 않음
+    LEASE_SECONDS = 120
+
+    # 실패 시 재시도 대기 (초) 및 최대 시도 횟수
+    RETRY_BASE_SECONDS = 5
+    RETRY_MAX_SECONDS = 600
+    MAX_ATTEMPTS = 20
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path (Path): SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        """SQLite 연결 (블록이 끝나면 커밋 후 닫음)"""
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            conn.row_factory = sqlite3.Row
+            yield conn
+
+    def _init_db(self):
+        """테이블 생성"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    workspace TEXT NOT NULL,
+                    col INTEGER NOT NULL,
+                    row INTEGER NOT NULL,
+                    spreadsheet_id TEXT NOT NULL,
+                    sheet_name TEXT NOT NULL,
+                    name TEXT,
+                    status TEXT NOT NULL,
+                    seq INTEGER NOT NULL DEFAULT 1,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_until REAL NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    last_error TEXT,
+                    PRIMARY KEY (workspace, col, row)
+                )
+            """)
+
+    def record(self, workspace: str, spreadsheet_id: str, sheet_name: str,
+               updates: List[Dict], claim: bool = False) -> List[Dict]:
+        """
+        출석 업데이트를 저널에 기록 (같은 워크스페이스/열/행은 최신 값으로 덮어씀)
+
+        Args:
+            workspace (str): 워크스페이스 폴더 이름
+            spreadsheet_id (str): 스프레드시트 ID
+            sheet_name (str): 시트 이름
+            updates (List[Dict]): 업데이트 정보 리스트 (batch_update_attendance와 동일)
+            claim (bool): True면 호출한 쪽이 바로 전송하도록 임대 상태(inflight)로 기록
+
+        Returns:
+            List[Dict]: 기록된 항목 리스트 (complete/release에 전달)
+        """
+        now = time.time()
+        state = 'inflight' if claim else 'pending'
+        lease_until = now + self.LEASE_SECONDS if claim else 0
+        entries = []
+
+        with self._lock, self._connect() as conn:
+            for update in updates:
+                row = update.get('row')
+                column = update.get('column')
+
+                if row is None or column is None:
+                    continue
+
+                status = update.get('status', AttendanceStatus.PRESENT)
+                status = status.value if isinstance(status, AttendanceStatus) else status
+
+                conn.execute("""
+                    INSERT INTO entries (workspace, col, row, spreadsheet_id, sheet_name, name, status,
+                                         state, lease_until, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (workspace, col, row) DO UPDATE SET
+                        spreadsheet_id = excluded.spreadsheet_id,
+                        sheet_name = excluded.sheet_name,
+                        name = excluded.name,
+                        status = excluded.status,
+                        seq = entries.seq + 1,
+                        state = excluded.state,
+                        attempts = 0,
+                        lease_until = excluded.lease_until,
+                        next_attempt_at = 0,
+                        last_error = NULL
+                """, (workspace, column, row, spreadsheet_id, sheet_name, update.get('name'), status,
+                      state, lease_until, now))
+
+                seq = conn.execute(
+                    "SELECT seq FROM entries WHERE workspace = ? AND col = ? AND row = ?",
+                    (workspace, column, row)
+                ).fetchone()['seq']
+
+                entries.append({
+                    'workspace': workspace,
+                    'spreadsheet_id': spreadsheet_id,
+                    'sheet_name': sheet_name,
+                    'name': update.get('name'),
+                    'row': row,
+                    'column': column,
+                    'status': status,
+                    'seq': seq,
+                })
+
+        return entries
+
+    def claim(self, limit: int = 500) -> List[Dict]:
+        """
+        전송할 항목을 임대 상태로 가져오기
+
+        대기 중(pending)이고 재시도 시각이 지난 항목과, 임대 시간이 끝난 전송 중 항목
+        (프로세스 종료 등으로 완료되지 못한 항목)을 오래된 순서로 가져옵니다.
+        한 번에 같은 워크스페이스/스프레드시트/시트의 항목만 반환합니다.
+
+        Args:
+            limit (int): 최대 항목 수
+
+        Returns:
+            List[Dict]: 항목 리스트
+        """
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            first = conn.execute("""
+                SELECT workspace, spreadsheet_id, sheet_name FROM entries
+                WHERE (state = 'pending' AND next_attempt_at <= ?)
+                   OR (state = 'inflight' AND lease_until < ?)
+                ORDER BY created_at
+                LIMIT 1
+            """, (now, now)).fetchone()
+
+            if first is None:
+                return []
+
+            rows = conn.execute("""
+                SELECT * FROM entries
+                WHERE workspace = ? AND spreadsheet_id = ? AND sheet_name = ?
+                  AND ((state = 'pending' AND next_attempt_at <= ?)
+                       OR (state = 'inflight' AND lease_until < ?))
+                ORDER BY col, row
+                LIMIT ?
+            """, (first['workspace'], first['spreadsheet_id'], first['sheet_name'], now, now, limit)).fetchall()
+
+            for row in rows:
+                conn.execute("""
+                    UPDATE entries SET state = 'inflight', lease_until = ?
+                    WHERE workspace = ? AND col = ? AND row = ? AND seq = ?
+                """, (now + self.LEASE_SECONDS, row['workspace'], row['col'], row['row'], row['seq']))
+
+        return [{
+            'workspace': row['workspace'],
+            'spreadsheet_id': row['spreadsheet_id'],
+            'sheet_name': row['sheet_name'],
+            'name': row['name'],
+            'row': row['row'],
+            'column': row['col'],
+            'status': row['status'],
+            'seq': row['seq'],
+        } for row in rows]
+
+    def renew(self, entries: List[Dict]):
+        """
+        전송 중인 항목의 임대 시간 연장
+
+        Args:
+            entries (List[Dict]): 전송 중인 항목 리스트
+        """
+        with self._lock, self._connect() as conn:
+            conn.executemany("""
+                UPDATE entries SET lease_until = ?
+                WHERE workspace = ? AND col = ? AND row = ? AND seq = ? AND state = 'inflight'
+            """, [(time.time() + self.LEASE_SECONDS, e['workspace'], e['column'], e['row'], e['seq'])
+                  for e in entries])
+
+    @contextmanager
+    def leased(self, entries: List[Dict]):
+        """
+        블록을 실행하는 동안 임대 시간을 주기적으로 연장 (다른 작업자가 같은 항목을 다시 가져가지 않도록)
+
+        Args:
+            entries (List[Dict]): 전송 중인 항목 리스트
+        """
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(self.LEASE_SECONDS / 3):
+                self.renew(entries)
+
+        thread = threading.Thread(target=heartbeat, name='journal-lease', daemon=True)
+        thread.start()
+
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def complete(self, entries: List[Dict]):
+        """
+        전송 완료된 항목 제거
+
+        전송 중에 새 값이 기록된 항목(seq가 바뀐 항목)은 남겨 두어 새 값이 다시 전송됩니다.
+
+        Args:
+            entries (List[Dict]): 완료된 항목 리스트
+        """
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM entries WHERE workspace = ? AND col = ? AND row = ? AND seq = ?",
+                [(e['workspace'], e['column'], e['row'], e['seq']) for e in entries]
+            )
+
+    def release(self, entries: List[Dict], error: str = ''):
+        """
+        전송 실패한 항목을 재시도 대기 상태로 되돌리기 (지수 백오프)
+
+        Args:
+            entries (List[Dict]): 실패한 항목 리스트
+            error (str): 오류 메시지
+        """
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            for e in entries:
+                row = conn.execute(
+                    "SELECT attempts FROM entries WHERE workspace = ? AND col = ? AND row = ? AND seq = ?",
+                    (e['workspace'], e['column'], e['row'], e['seq'])
+                ).fetchone()
+
+                if row is None:
+                    continue
+
+                attempts = row['attempts'] + 1
+                state = 'failed' if attempts >= self.MAX_ATTEMPTS else 'pending'
+                delay = min(self.RETRY_MAX_SECONDS, self.RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+
+                conn.execute("""
+                    UPDATE entries SET state = ?, attempts = ?, lease_until = 0,
+                                       next_attempt_at = ?, last_error = ?
+                    WHERE workspace = ? AND col = ? AND row = ? AND seq = ?
+                """, (state, attempts, now + delay, error,
+                      e['workspace'], e['column'], e['row'], e['seq']))
+
+    def settle(self, entries: List[Dict], results: List[Dict]):
+        """
+        셀별 전송 결과(SheetsHandler.last_update_results)로 항목을 완료/재시도 처리
+
+        Args:
+            entries (List[Dict]): 전송한 항목 리스트
+            results (List[Dict]): 셀별 결과 ({'row', 'column', 'success', ...})
+        """
+        succeeded = {(r['row'], r['column']) for r in results if r.get('success')}
+
+        done = [e for e in entries if (e['row'], e['column']) in succeeded]
+        failed = [e for e in entries if (e['row'], e['column']) not in succeeded]
+
+        if done:
+            self.complete(done)
+        if failed:
+            self.release(failed, 'Sheets 업데이트 실패')
+
+    def count(self, state: Optional[str] = None) -> int:
+        """
+        항목 수 조회
+
+        Args:
+            state (Optional[str]): 'pending', 'inflight', 'failed' 중 하나 (None이면 전체)
+
+        Returns:
+            int: 항목 수
+        """
+        with self._lock, self._connect() as conn:
+            if state is None:
+                return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM entries WHERE state = ?", (state,)).fetchone()[0]
+
+    def failed_entries(self, limit: int = 100) -> List[Dict]:
+        """
+        최대 시도 횟수를 넘겨 더 이상 전송하지 않는 항목 조회 (최근 실패 순)
+
+        Args:
+            limit (int): 최대 항목 수
+
+        Returns:
+            List[Dict]: 항목 리스트 (workspace, sheet_name, name, row, column, status, attempts, last_error)
+        """
+        with self._lock, self._connect() as conn:
+            rows = conn.execute("""
+                SELECT * FROM entries WHERE state = 'failed'
+                ORDER BY next_attempt_at DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+
+        return [{
+            'workspace': row['workspace'],
+            'sheet_name': row['sheet_name'],
+            'name': row['name'],
+            'row': row['row'],
+            'column': row['col'],
+            'status': row['status'],
+            'attempts': row['attempts'],
+            'last_error': row['last_error'],
+        } for row in rows]
+
+
+class JournalFlusher:
+    """저널 항목을 모아서 시트에 전송하는 백그라운드 작업자"""
+
+    def __init__(self, journal: WriteJournal, handler_factory: Callable, interval: float = 5.0, batch_size: int = 500):
+        """
+        Args:
+            journal (WriteJournal): 출석 기록 저널
+            handler_factory (Callable): (workspace, spreadsheet_id, sheet_name) -> SheetsHandler 또는 None
+            interval (float): 저널 확인 주기 (초)
+            batch_size (int): 한 번에 전송할 최대 항목 수
+        """
+        self.journal = journal
+        self.handler_factory = handler_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 스레드 시작 (시작하자마자 남은 항목을 다시 전송)"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='journal-flusher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 스레드 중지"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def notify(self):
+        """새 항목이 기록되었음을 알림 (다음 주기를 기다리지 않고 전송)"""
+        self._wakeup.set()
+
+    def _run(self):
+        """작업 루프"""
+        while not self._stopped.is_set():
+            try:
+                while self.flush_once() > 0 and not self._stopped.is_set():
+                    pass
+            except Exception as e:
+                print(f"✗ 저널 전송 오류: {e}")
+
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    def flush_once(self) -> int:
+        """
+        저널 항목 한 묶음 전송
+
+        Returns:
+            int: 처리한 항목 수 (0이면 보낼 항목 없음)
+        """
+        entries = self.journal.claim(self.batch_size)
+
+        if not entries:
+            return 0
+
+        first = entries[0]
+        print(f"\n[저널] {first['workspace']} - 대기 중인 출석 기록 {len(entries)}개 전송")
+
+        handler = self.handler_factory(first['workspace'], first['spreadsheet_id'], first['sheet_name'])
+
+        if handler is None or not handler.connect():
+            self.journal.release(entries, '워크스페이스 또는 시트에 연결할 수 없음')
+            return len(entries)
+
+        with self.journal.leased(entries):
+            handler.update_attendance_column(entries)
+
+        self.journal.settle(entries, handler.last_update_results)
+
+        return len(entries)
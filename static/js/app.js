@@ -165,10 +165,11 @@ async function findThread() {
     btn.innerHTML = '<span class="loading"></span> 검색 중...';
 
     try {
+        // 직접 찾기를 누른 경우에는 등록된 스레드 이후의 채널 기록도 다시 검색
         const response = await fetch('/api/find-thread', {
             method: 'POST',
             headers: {'Content-Type': 'application/json'},
-            body: JSON.stringify({workspace: currentWorkspace})
+            body: JSON.stringify({workspace: currentWorkspace, refresh: true})
         });
 
         const data = await response.json();
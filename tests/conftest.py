@@ -0,0 +1,11 @@
+"""
+pytest 설정: 프로젝트 루트(src 패키지)와 tests 폴더(fakes)를 import 경로에 추가
+"""
+import sys
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+
+for path in (TESTS_DIR.parent, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
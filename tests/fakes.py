@@ -0,0 +1,193 @@
+"""
+테스트용 가짜 외부 서비스
+실제 Google Sheets API / Slack Web API 대신 메모리에서 동작하는 최소한의 대체 객체
+"""
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.slack_response import SlackResponse
+
+
+def _column_to_index(letters: str) -> int:
+    """A1 표기 열 문자를 0-based 인덱스로 변환 (A -> 0, AA -> 26)"""
+    index = 0
+    for char in letters:
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+
+class FakeRequest:
+    """googleapiclient 요청 객체처럼 execute()로 결과를 돌려주는 래퍼"""
+
+    def __init__(self, func):
+        self.func = func
+
+    def execute(self, **kwargs):
+        return self.func()
+
+
+class FakeSheetsService:
+    """
+    spreadsheets().get / values().get / batchGet / update / batchUpdate만 흉내 내는 가짜 서비스
+
+    grid는 {(행 인덱스, 열 인덱스): 값} (모두 0-based) 형태이며,
+    calls에는 호출한 API와 범위가 순서대로 기록됩니다.
+    """
+
+    def __init__(self, grid: Optional[Dict[Tuple[int, int], str]] = None, sheet_title: str = '출석현황'):
+        self.grid = dict(grid or {})
+        self.sheet_title = sheet_title
+        self.calls: List[tuple] = []
+
+    # spreadsheets() / values()는 모두 자기 자신을 돌려줌
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def set_column(self, column: int, start_row: int, values: List[str]):
+        """열 하나를 start_row(0-based)부터 채우기"""
+        for offset, value in enumerate(values):
+            self.grid[(start_row + offset, column)] = value
+
+    def _parse_range(self, a1_range: str) -> Tuple[int, int, int]:
+        """'시트!B5:B' 형태의 범위를 (열, 시작 행, 끝 행)으로 변환"""
+        cells = a1_range.split('!', 1)[-1]
+        match = re.match(r'([A-Z]+)(\d+)(?::([A-Z]+)(\d*))?$', cells)
+        if not match:
+            raise ValueError(f"지원하지 않는 범위: {a1_range}")
+
+        column = _column_to_index(match.group(1))
+        first_row = int(match.group(2)) - 1
+
+        if not match.group(3):
+            last_row = first_row
+        elif match.group(4):
+            last_row = int(match.group(4)) - 1
+        else:
+            last_row = None  # 열 끝까지
+
+        return column, first_row, last_row
+
+    def _read(self, a1_range: str) -> List[List[str]]:
+        column, first_row, last_row = self._parse_range(a1_range)
+        rows = [row for row, col in self.grid if col == column]
+        last = max(rows, default=-1) if last_row is None else min(last_row, max(rows, default=-1))
+
+        values = []
+        for row in range(first_row, last + 1):
+            value = self.grid.get((row, column))
+            values.append([value] if value is not None else [])
+        return values
+
+    def get(self, spreadsheetId=None, range=None, fields=None, **kwargs):
+        self.calls.append(('get', range))
+
+        if range is None:
+            # spreadsheets().get(): 시트 탭 목록
+            return FakeRequest(lambda: {
+                'properties': {'title': 'Fake Spreadsheet'},
+                'sheets': [{'properties': {'title': self.sheet_title, 'sheetId': 0}}]
+            })
+
+        return FakeRequest(lambda: {'range': range, 'values': self._read(range)})
+
+    def batchGet(self, spreadsheetId=None, ranges=None, **kwargs):
+        self.calls.append(('batchGet', tuple(ranges)))
+        return FakeRequest(lambda: {
+            'valueRanges': [{'range': a1_range, 'values': self._read(a1_range)} for a1_range in ranges]
+        })
+
+    def update(self, spreadsheetId=None, range=None, body=None, **kwargs):
+        self.calls.append(('update', range))
+
+        def execute():
+            column, row, _ = self._parse_range(range)
+            self.grid[(row, column)] = body['values'][0][0]
+            return {'updatedCells': 1}
+
+        return FakeRequest(execute)
+
+    def batchUpdate(self, spreadsheetId=None, body=None, **kwargs):
+        if 'requests' in body:
+            # spreadsheets().batchUpdate(): 서식 요청은 기록만 함
+            self.calls.append(('formatBatchUpdate', len(body['requests'])))
+            return FakeRequest(lambda: {'replies': []})
+
+        self.calls.append(('batchUpdate', tuple(data['range'] for data in body['data'])))
+
+        def execute():
+            updated = 0
+            for data in body['data']:
+                column, first_row, _ = self._parse_range(data['range'])
+                values = data['values']
+                if data.get('majorDimension') == 'COLUMNS':
+                    values = [[value] for value in values[0]]
+                for offset, row in enumerate(values):
+                    if row and row[0] is not None:
+                        self.grid[(first_row + offset, column)] = row[0]
+                        updated += 1
+            return {'totalUpdatedCells': updated}
+
+        return FakeRequest(execute)
+
+
+def slack_response(data: Dict, status_code: int = 200) -> SlackResponse:
+    """WebClient가 돌려주는 것과 같은 SlackResponse 생성"""
+    return SlackResponse(client=None, http_verb='POST', api_url='https://slack.com/api/fake',
+                         req_args={}, data=data, headers={}, status_code=status_code)
+
+
+class FakeSlackClient:
+    """
+    SlackHandler(client=...)에 넣는 가짜 WebClient (DM 전송에 쓰는 메서드만 구현)
+
+    failures에 {채널 ID 또는 User ID: [오류 코드, ...]}를 넣으면 그 대상의
+    chat.postMessage가 순서대로 해당 오류로 실패한 뒤 성공합니다.
+    emails에 없는 이메일은 users_not_found로 실패합니다.
+    """
+
+    def __init__(self, emails: Optional[Dict[str, str]] = None, failures: Optional[Dict[str, List[str]]] = None):
+        self.emails = dict(emails or {})
+        self.failures = {target: list(errors) for target, errors in (failures or {}).items()}
+        self.calls: List[tuple] = []
+        self.sent: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def _record(self, *call):
+        with self._lock:
+            self.calls.append(call)
+
+    def auth_test(self, **kwargs):
+        self._record('auth.test')
+        return slack_response({'ok': True, 'team_id': 'T_FAKE', 'user_id': 'U_BOT'})
+
+    def users_lookupByEmail(self, email, **kwargs):
+        self._record('users.lookupByEmail', email)
+        if email not in self.emails:
+            raise SlackApiError('users_not_found', slack_response({'ok': False, 'error': 'users_not_found'}, 404))
+        return slack_response({'ok': True, 'user': {'id': self.emails[email]}})
+
+    def conversations_open(self, users, **kwargs):
+        self._record('conversations.open', users[0])
+        return slack_response({'ok': True, 'channel': {'id': 'D' + users[0]}})
+
+    def chat_postMessage(self, channel, text, thread_ts=None, **kwargs):
+        self._record('chat.postMessage', channel)
+
+        with self._lock:
+            user_id = channel[1:] if channel.startswith('D') else channel
+            pending = self.failures.get(user_id)
+            error = pending.pop(0) if pending else None
+            if not error:
+                ts = f"1700000000.{len(self.sent):06d}"
+                self.sent.append({'channel': channel, 'text': text, 'thread_ts': thread_ts, 'ts': ts})
+
+        if error:
+            status_code = 429 if error == 'ratelimited' else 200
+            raise SlackApiError(error, slack_response({'ok': False, 'error': error}, status_code))
+
+        return slack_response({'ok': True, 'channel': channel, 'ts': ts})
@@ -0,0 +1,55 @@
+"""
+최신 출석 스레드 찾기 테스트 (등록부 우선, 필요할 때만 채널 기록 검색)
+"""
+from types import SimpleNamespace
+
+import app_flask
+from src.thread_registry import ThreadRegistry
+
+CHANNEL = 'C1'
+REGISTERED_TS = '1700000000.000100'
+
+
+class HistoryStub:
+    """채널 기록 검색 호출만 기록하는 SlackHandler 대체 객체"""
+
+    def __init__(self, found=None):
+        self.found = found
+        self.searches = []
+
+    def find_latest_attendance_thread(self, channel_id, oldest=None, **kwargs):
+        self.searches.append((channel_id, oldest))
+        return dict(self.found) if self.found else None
+
+
+def make_workspace(tmp_path):
+    return SimpleNamespace(slack_channel_id=CHANNEL, cache_dir=tmp_path, auto_schedule=None)
+
+
+def test_registered_thread_is_used_without_scanning_history(tmp_path):
+    workspace = make_workspace(tmp_path)
+    ThreadRegistry(tmp_path / 'threads.json').register(REGISTERED_TS, CHANNEL, column='K')
+    slack = HistoryStub(found={'ts': '1700000500.000000', 'text': '출석 스레드', 'user': 'U1'})
+
+    thread = app_flask.find_attendance_thread(workspace, slack)
+
+    assert (thread['ts'], thread['source']) == (REGISTERED_TS, 'registry')
+    assert slack.searches == []
+
+
+def test_refresh_scans_history_after_the_registered_thread(tmp_path):
+    workspace = make_workspace(tmp_path)
+    ThreadRegistry(tmp_path / 'threads.json').register(REGISTERED_TS, CHANNEL, column='K')
+    slack = HistoryStub(found={'ts': '1700000500.000000', 'text': '출석 스레드', 'user': 'U1'})
+
+    thread = app_flask.find_attendance_thread(workspace, slack, refresh=True)
+
+    assert (thread['ts'], thread['source']) == ('1700000500.000000', 'history')
+    assert slack.searches == [(CHANNEL, float(REGISTERED_TS))]
+
+
+def test_history_is_scanned_when_nothing_is_registered(tmp_path):
+    slack = HistoryStub()
+
+    assert app_flask.find_attendance_thread(make_workspace(tmp_path), slack) is None
+    assert slack.searches == [(CHANNEL, None)]
@@ -0,0 +1,151 @@
+"""
+실시간 출석 리스너 테스트 (로컬 이벤트 소스 사용)
+"""
+import threading
+
+import pytest
+
+from src.live_attendance import LiveAttendanceListener, LocalEventSource
+from src.parser import AttendanceParser
+from src.sheets_handler import AttendanceStatus
+from src.thread_registry import ThreadRegistry
+
+CHANNEL = 'C_LIVE'
+THREAD_TS = '1700000000.000100'
+ROSTER = {'김철수': 4, '이영희': 5, '박민수': 6}
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = ThreadRegistry(tmp_path / 'threads.json')
+    registry.register(THREAD_TS, CHANNEL, column='K')
+    return registry
+
+
+def make_source(registry, written, roster_provider=lambda: ROSTER, coalesce_seconds=60.0):
+    listener = LiveAttendanceListener(
+        CHANNEL, registry, AttendanceParser(),
+        roster_provider=roster_provider,
+        write_queue=written.append,
+        coalesce_seconds=coalesce_seconds
+    )
+    return LocalEventSource(listener)
+
+
+def test_replies_are_coalesced_into_one_batch(registry):
+    batches = []
+    source = make_source(registry, batches)
+    source.start()
+
+    assert source.inject_reply(THREAD_TS, '김철수/출석')['row'] == 4
+    assert source.inject_reply(THREAD_TS, '이영희 출석')['row'] == 5
+    assert source.inject_reply(THREAD_TS, '김철수/출석했습니다') is None   # 같은 사람
+    assert source.inject_reply('1700000000.999999', '박민수/출석') is None  # 등록되지 않은 스레드
+    assert source.inject_reply(THREAD_TS, '홍길동/출석') is None           # 명단에 없음
+
+    # 간격(60초)이 지나기 전에는 넘기지 않음
+    assert batches == []
+    assert source.listener.get_stats()['pending_updates'] == 2
+
+    # 중지하면 남은 기록을 한 번에 넘김
+    source.stop()
+
+    assert len(batches) == 1
+    assert [(u['name'], u['row'], u['column'], u['status']) for u in batches[0]] == [
+        ('김철수', 4, 10, AttendanceStatus.PRESENT),
+        ('이영희', 5, 10, AttendanceStatus.PRESENT),
+    ]
+    assert source.listener.get_stats() == {'processed_events': 4, 'queued_updates': 2, 'pending_updates': 0}
+
+
+def test_flush_runs_when_pending_reaches_limit(registry, monkeypatch):
+    monkeypatch.setattr(LiveAttendanceListener, 'MAX_PENDING', 2)
+    flushed = threading.Event()
+    batches = []
+
+    def write_queue(updates):
+        batches.append(updates)
+        flushed.set()
+
+    listener = LiveAttendanceListener(
+        CHANNEL, registry, AttendanceParser(),
+        roster_provider=lambda: ROSTER,
+        write_queue=write_queue,
+        coalesce_seconds=60.0
+    )
+    source = LocalEventSource(listener)
+    source.start()
+
+    try:
+        source.inject_reply(THREAD_TS, '김철수/출석')
+        assert not flushed.wait(0.2)
+
+        source.inject_reply(THREAD_TS, '이영희/출석')
+        assert flushed.wait(5)
+    finally:
+        source.stop()
+
+    assert [[u['name'] for u in batch] for batch in batches] == [['김철수', '이영희']]
+
+
+def test_roster_is_fetched_outside_the_lock(registry):
+    batches = []
+    lock_held = []
+
+    def roster_provider():
+        lock_held.append(source.listener._lock.locked())
+        return ROSTER
+
+    source = make_source(registry, batches, roster_provider=roster_provider)
+
+    source.inject_reply(THREAD_TS, '김철수/출석')
+    source.listener.flush()
+
+    assert lock_held == [False]
+    assert [u['name'] for u in batches[0]] == ['김철수']
+
+
+def test_inject_route_rejects_socket_mode_sources(registry, monkeypatch):
+    import app_flask
+
+    class SocketModeStandIn:
+        def __init__(self, listener):
+            self.listener = listener
+
+    batches = []
+    local = make_source(registry, batches)
+    remote = SocketModeStandIn(local.listener)
+    monkeypatch.setattr(app_flask, 'live_sources', {'local': local, 'remote': remote})
+    client = app_flask.app.test_client()
+
+    response = client.post('/api/live/inject', json={'workspace': 'remote', 'thread_ts': THREAD_TS, 'text': '김철수/출석'})
+    assert response.status_code == 403
+    assert local.listener.get_stats()['processed_events'] == 0
+
+    response = client.post('/api/live/inject', json={'workspace': 'local', 'thread_ts': THREAD_TS, 'text': '김철수/출석'})
+    assert response.status_code == 200
+    assert response.get_json() == {'success': True, 'queued': True, 'name': '김철수'}
+
+
+def test_seen_names_are_kept_for_recent_threads_only(registry, monkeypatch):
+    monkeypatch.setattr(LiveAttendanceListener, 'MAX_THREADS', 2)
+    threads = ['1700000001.000100', '1700000002.000100', '1700000003.000100']
+    for ts in threads:
+        registry.register(ts, CHANNEL, column='K')
+
+    source = make_source(registry, [])
+    for ts in threads:
+        source.inject_reply(ts, '김철수/출석')
+
+    assert list(source.listener._seen) == threads[1:]
+
+
+def test_inject_route_handles_missing_body(monkeypatch):
+    import app_flask
+
+    monkeypatch.setattr(app_flask, 'live_sources', {})
+    client = app_flask.app.test_client()
+
+    response = client.post('/api/live/inject', data='not json', content_type='text/plain')
+    assert response.status_code == 404
+    assert response.get_json()['success'] is False
@@ -0,0 +1,39 @@
+"""
+알림 대기열 추가 테스트 (미출석자 안내 DM)
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import app_flask
+from src.notification_queue import NotificationQueue
+
+TEMPLATE = "{name}님, {column}열 출석이 확인되지 않았습니다."
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    queue = NotificationQueue(tmp_path / 'notifications.db')
+    monkeypatch.setattr(app_flask, 'notification_queue', queue)
+    monkeypatch.setattr(app_flask.notification_worker, 'notify', lambda: None)
+    return queue
+
+
+def test_absentee_dms_are_queued_once_per_run(queue):
+    workspace = SimpleNamespace(name='ws', slack_bot_token='xoxb-test', notification_digest_seconds=0)
+    recipients = [
+        {'recipient': 'U1', 'name': '김철수', 'column': 'H'},
+        {'recipient': 'U2', 'name': '박민수'},  # column 없음 -> 템플릿 오류로 건너뜀
+        {'recipient': 'lee@example.com', 'name': '이영희', 'column': 'H'},
+    ]
+
+    assert app_flask.enqueue_bulk_dms(workspace, recipients, TEMPLATE, 'check:1') == 2
+    # 같은 실행이 다시 돌아도 중복으로 추가하지 않음
+    assert app_flask.enqueue_bulk_dms(workspace, recipients, TEMPLATE, 'check:1') == 0
+
+    items = queue.claim()
+    assert sorted((item['target'], item['text']) for item in items) == [
+        ('U1', '김철수님, H열 출석이 확인되지 않았습니다.'),
+        ('lee@example.com', '이영희님, H열 출석이 확인되지 않았습니다.'),
+    ]
+    assert {item['kind'] for item in items} == {'dm'}
@@ -0,0 +1,38 @@
+"""
+스레드 댓글 저장소 테스트
+"""
+import sqlite3
+
+import pytest
+
+from src.reply_store import ReplyStore
+
+CHANNEL = 'C1'
+THREAD_TS = '1700000000.000100'
+
+
+def test_connections_are_closed(tmp_path, monkeypatch):
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr('src.reply_store.sqlite3.connect', tracking_connect)
+
+    store = ReplyStore(tmp_path / 'replies.db')
+    store.commit(CHANNEL, THREAD_TS,
+                 [{'timestamp': '1700000001.000000', 'text': '김철수/출석'}],
+                 [{'name': '김철수', 'timestamp': '1700000001.000000'}], 'K')
+    assert store.get_high_water_mark(CHANNEL, THREAD_TS) == '1700000001.000000'
+    assert store.count_replies(CHANNEL, THREAD_TS) == 1
+    assert [a['name'] for a in store.get_attendance(CHANNEL, THREAD_TS)] == ['김철수']
+    store.reset(CHANNEL, THREAD_TS)
+    assert store.get_thread(CHANNEL, THREAD_TS) is None
+
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
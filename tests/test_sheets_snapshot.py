@@ -0,0 +1,187 @@
+"""
+시트 스냅샷 / 학생 명단 캐시 테스트 (가짜 Sheets 서비스 사용)
+"""
+import json
+
+import pytest
+
+from fakes import FakeRequest, FakeSheetsService
+from src.roster_cache import RosterCache
+from src.sheets_handler import AttendanceStatus, SheetsHandler
+
+NAME_COLUMN = 1   # B
+START_ROW = 4     # 5행부터
+ATTENDANCE_COLUMN = 7  # H
+
+
+@pytest.fixture(autouse=True)
+def clear_roster_memory():
+    """RosterCache는 프로세스 메모리 캐시를 공유하므로 테스트마다 비움"""
+    RosterCache._memory.clear()
+    yield
+    RosterCache._memory.clear()
+
+
+def make_handler(service, tmp_path):
+    return SheetsHandler(
+        credentials_path=str(tmp_path / 'credentials.json'),
+        spreadsheet_id='S1',
+        service=service,
+        roster_cache=RosterCache(tmp_path / 'roster.json', ttl=3600)
+    )
+
+
+def test_snapshot_reads_name_column_even_with_warm_cache(tmp_path):
+    service = FakeSheetsService()
+    service.set_column(NAME_COLUMN, START_ROW, ['김철수', '이영희'])
+    handler = make_handler(service, tmp_path)
+
+    # 캐시 채우기
+    assert handler.get_student_list(NAME_COLUMN, START_ROW) == {'김철수': 4, '이영희': 5}
+
+    # 명단 순서가 바뀌고 학생이 추가됨 (캐시는 아직 유효)
+    service.set_column(NAME_COLUMN, START_ROW, ['이영희', '박민수', '김철수'])
+    service.calls.clear()
+
+    snapshot = handler.get_sheet_snapshot(NAME_COLUMN, START_ROW, [ATTENDANCE_COLUMN])
+
+    # 이름 열과 출석 열을 한 번의 batchGet으로 읽음
+    assert service.calls == [('batchGet', ('출석현황!B5:B', '출석현황!H5:H'))]
+    assert snapshot.students == {'이영희': 4, '박민수': 5, '김철수': 6}
+
+    # 스냅샷으로 캐시도 갱신되어, 이후 명단 조회는 API 호출 없이 새 명단을 돌려줌
+    service.calls.clear()
+    assert handler.get_student_list(NAME_COLUMN, START_ROW) == snapshot.students
+    assert service.calls == []
+
+
+def test_snapshot_reads_name_column_once_when_requested_twice(tmp_path):
+    service = FakeSheetsService()
+    service.set_column(NAME_COLUMN, START_ROW, ['김철수'])
+    service.set_column(ATTENDANCE_COLUMN, START_ROW, ['O'])
+    handler = make_handler(service, tmp_path)
+
+    snapshot = handler.get_sheet_snapshot(NAME_COLUMN, START_ROW, [ATTENDANCE_COLUMN, NAME_COLUMN, ATTENDANCE_COLUMN])
+
+    assert service.calls == [('batchGet', ('출석현황!B5:B', '출석현황!H5:H'))]
+    assert snapshot.get_value(4, ATTENDANCE_COLUMN) == 'O'
+
+
+def test_roster_refresh_route_uses_injected_service(tmp_path, monkeypatch):
+    import app_flask
+    import src.workspace_manager as workspace_module
+    from src.workspace_manager import WorkspaceManager
+
+    workspace_dir = tmp_path / 'workspaces' / 'test_ws'
+    workspace_dir.mkdir(parents=True)
+    (workspace_dir / 'credentials.json').write_text('{}', encoding='utf-8')
+    (workspace_dir / 'config.json').write_text(json.dumps({
+        'name': '테스트',
+        'slack_bot_token': 'xoxb-test',
+        'slack_channel_id': 'C1',
+        'spreadsheet_id': 'S1',
+        'sheet_name': '출석현황',
+        'name_column': 'B',
+        'start_row': START_ROW
+    }), encoding='utf-8')
+
+    service = FakeSheetsService()
+    service.set_column(NAME_COLUMN, START_ROW, ['김철수', '이영희', '박민수'])
+
+    monkeypatch.setattr(workspace_module, 'get_cache_dir', lambda: tmp_path / 'cache')
+    monkeypatch.setattr(app_flask, 'workspace_manager', WorkspaceManager(tmp_path))
+    monkeypatch.setitem(app_flask.app.config, 'SHEETS_SERVICE', service)
+
+    response = app_flask.app.test_client().post('/api/roster/refresh', json={'workspace': 'test_ws'})
+
+    assert response.status_code == 200
+    assert response.get_json() == {'success': True, 'total_students': 3}
+    assert service.calls == [('get', '출석현황!B5:B')]
+    assert (tmp_path / 'cache' / 'workspaces' / 'test_ws' / 'roster.json').exists()
+
+
+def test_snapshot_columns_accept_multi_letter_names(tmp_path, capsys):
+    from src.workspace_manager import WorkspaceConfig
+
+    workspace_dir = tmp_path / 'cols_ws'
+    workspace_dir.mkdir()
+    (workspace_dir / 'config.json').write_text(json.dumps({
+        'name_column': 'B',
+        'start_row': START_ROW,
+        'snapshot_columns': ['C', 'aa', 'AB', 3, '1A', '']
+    }), encoding='utf-8')
+    workspace = WorkspaceConfig(workspace_dir)
+
+    assert workspace.snapshot_columns == [2, 26, 27, 3]
+    assert "'1A'" in capsys.readouterr().out
+
+    service = FakeSheetsService()
+    service.set_column(NAME_COLUMN, START_ROW, ['김철수'])
+    service.set_column(27, START_ROW, ['U123'])
+    handler = make_handler(service, tmp_path)
+
+    snapshot = handler.get_sheet_snapshot(NAME_COLUMN, START_ROW, workspace.snapshot_columns)
+
+    assert service.calls[0][1] == ('출석현황!B5:B', '출석현황!C5:C', '출석현황!AA5:AA', '출석현황!AB5:AB', '출석현황!D5:D')
+    assert snapshot.get_value(4, 27) == 'U123'
+
+
+class FakeDriveService:
+    """files().get(fields='modifiedTime')만 흉내 내는 가짜 Drive 서비스"""
+
+    def __init__(self, modified_time='2026-01-01T00:00:00Z'):
+        self.modified_time = modified_time
+        self.calls = 0
+
+    def files(self):
+        return self
+
+    def get(self, fileId=None, fields=None, **kwargs):
+        self.calls += 1
+        return FakeRequest(lambda: {'modifiedTime': self.modified_time})
+
+
+class RecordingGovernor:
+    """요청 종류만 기록하고 바로 실행하는 조절기"""
+
+    def __init__(self):
+        self.kinds = []
+
+    def execute(self, request, kind='read', credentials_path=None):
+        self.kinds.append(kind)
+        return request.execute()
+
+
+def test_revision_check_only_calls_drive_for_cached_roster_lookups(tmp_path):
+    service = FakeSheetsService()
+    service.set_column(NAME_COLUMN, START_ROW, ['김철수', '이영희'])
+    drive = FakeDriveService()
+    governor = RecordingGovernor()
+    handler = SheetsHandler(
+        credentials_path=str(tmp_path / 'credentials.json'),
+        spreadsheet_id='S1',
+        service=service,
+        roster_cache=RosterCache(tmp_path / 'roster.json', ttl=3600),
+        revision_check=True,
+        governor=governor
+    )
+    handler.drive_service = drive
+
+    # 스냅샷과 기록은 Drive API를 호출하지 않음
+    handler.get_sheet_snapshot(NAME_COLUMN, START_ROW, [ATTENDANCE_COLUMN])
+    handler.batch_update_attendance([{'name': '김철수', 'row': 4, 'column': ATTENDANCE_COLUMN, 'status': AttendanceStatus.PRESENT}])
+    assert drive.calls == 0
+
+    # 명단 조회의 revision 확인은 조절기를 거침
+    assert handler.get_student_list(NAME_COLUMN, START_ROW) == {'김철수': 4, '이영희': 5}
+    assert drive.calls == 1
+    assert governor.kinds == ['read', 'write', 'read', 'read']
+
+    # revision이 같으면 캐시 사용, 바뀌면 다시 읽음
+    service.calls.clear()
+    assert handler.get_student_list(NAME_COLUMN, START_ROW) == {'김철수': 4, '이영희': 5}
+    assert service.calls == []
+
+    drive.modified_time = '2026-01-02T00:00:00Z'
+    handler.get_student_list(NAME_COLUMN, START_ROW)
+    assert service.calls == [('get', '출석현황!B5:B')]
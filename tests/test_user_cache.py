@@ -0,0 +1,66 @@
+"""
+Slack 사용자 프로필 캐시 테스트
+"""
+import sqlite3
+
+import pytest
+
+from src.user_cache import UserProfileCache
+
+
+def test_email_and_dm_channel_memory_is_bounded(tmp_path):
+    cache = UserProfileCache(tmp_path / 'users.db', max_entries=3)
+
+    for i in range(10):
+        cache.put_user_id_by_email('T1', f'user{i}@example.com', f'U{i}')
+        cache.put_dm_channel('T1', f'U{i}', f'D{i}')
+
+    stats = cache.get_stats()
+    assert stats['email_entries'] == 3
+    assert stats['dm_channel_entries'] == 3
+
+    # 메모리에서 밀려난 항목은 디스크에서 다시 읽음
+    assert cache.get_user_id_by_email('T1', 'USER0@example.com') == 'U0'
+    assert cache.get_dm_channel('T1', 'U0') == 'D0'
+
+
+def test_email_memory_entries_expire(tmp_path, monkeypatch):
+    cache = UserProfileCache(tmp_path / 'users.db', ttl=60)
+    now = [1000.0]
+    monkeypatch.setattr('src.user_cache.time.time', lambda: now[0])
+
+    cache.put_user_id_by_email('T1', 'kim@example.com', 'U1')
+    cache.put_dm_channel('T1', 'U1', 'D1')
+    assert cache.get_user_id_by_email('T1', 'kim@example.com') == 'U1'
+
+    now[0] += 61
+
+    # 이메일 매핑은 메모리/디스크 모두 만료
+    assert cache.get_user_id_by_email('T1', 'kim@example.com') is None
+    assert cache.get_stats()['email_entries'] == 0
+
+    # DM 채널은 메모리에서만 만료되고 디스크에서 다시 읽음
+    assert cache.get_dm_channel('T1', 'U1') == 'D1'
+
+
+def test_connections_are_closed(tmp_path, monkeypatch):
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr('src.user_cache.sqlite3.connect', tracking_connect)
+
+    cache = UserProfileCache(tmp_path / 'users.db')
+    cache.put('T1', 'U1', {'real_name': '김철수'})
+    assert cache.get_many('T1', ['U1', 'U2']) == {'U1': {'real_name': '김철수'}}
+    cache.put_dm_channel('T1', 'U1', 'D1')
+    cache.invalidate_dm_channel('T1', 'U1')
+
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
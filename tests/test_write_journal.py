@@ -0,0 +1,48 @@
+"""
+출석 기록 저널 테스트
+"""
+import time
+
+from src.sheets_handler import AttendanceStatus
+from src.write_journal import WriteJournal
+
+UPDATES = [{'name': '김철수', 'row': 4, 'column': 7, 'status': AttendanceStatus.PRESENT}]
+
+
+def test_lease_is_renewed_while_sending(tmp_path, monkeypatch):
+    monkeypatch.setattr(WriteJournal, 'LEASE_SECONDS', 0.3)
+    journal = WriteJournal(tmp_path / 'journal.db')
+    entries = journal.record('ws', 'S1', '출석현황', UPDATES, claim=True)
+
+    # 임대 시간의 몇 배가 걸리는 전송 중에도 다른 작업자가 가져가지 않음
+    with journal.leased(entries):
+        deadline = time.time() + 1.0
+        while time.time() < deadline:
+            assert journal.claim() == []
+            time.sleep(0.05)
+
+    # 연장이 멈춘 뒤 임대 시간이 지나면 다시 가져갈 수 있음
+    time.sleep(0.4)
+    assert [e['name'] for e in journal.claim()] == ['김철수']
+
+
+def test_failed_entries_are_reported(tmp_path, monkeypatch):
+    monkeypatch.setattr(WriteJournal, 'MAX_ATTEMPTS', 2)
+    journal = WriteJournal(tmp_path / 'journal.db')
+    entries = journal.record('ws', 'S1', '출석현황', UPDATES, claim=True)
+
+    journal.release(entries, 'Sheets 업데이트 실패')
+    assert journal.failed_entries() == []
+
+    journal.release(entries, 'Sheets 업데이트 실패')
+    assert journal.count('failed') == 1
+    assert journal.failed_entries() == [{
+        'workspace': 'ws',
+        'sheet_name': '출석현황',
+        'name': '김철수',
+        'row': 4,
+        'column': 7,
+        'status': AttendanceStatus.PRESENT.value,
+        'attempts': 2,
+        'last_error': 'Sheets 업데이트 실패',
+    }]